@@ -98,9 +98,7 @@ def get_user_database_manager(user_id: str, multi_db_manager=Depends(get_multi_d
         UserDatabaseManager: Database manager for the specific user
     """
     try:
-        db_manager = multi_db_manager.get_user_db_manager(user_id)
-        from db.user_db_manager import UserDatabaseManager
-        return UserDatabaseManager(db_manager)
+        return multi_db_manager.get_user_database_manager(user_id)
     except Exception as e:
         logger.error(f"Failed to get user database manager for {user_id}: {e}")
         raise HTTPException(
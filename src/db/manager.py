@@ -1,17 +1,20 @@
 """
 Database manager with connection pooling, transactions, and CRUD operations.
 """
+import random
+import re
 import sqlite3
 import threading
 import time
-import json
 import shutil
 from contextlib import contextmanager
+from itertools import combinations
 from typing import Dict, List, Optional, Any, Union, Tuple
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import queue
-import uuid
+
+import orjson
 
 from core.config import get_config
 from core.logging import get_logger
@@ -19,6 +22,88 @@ from .schema import DatabaseSchema
 
 logger = get_logger(__name__)
 
+# FTS5 query cleanup: ISO timestamps, characters FTS5 treats as syntax, runs of whitespace
+_TIMESTAMP_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[\.\d]*')
+_FTS_PUNCTUATION_PATTERN = re.compile(r'[<>()"\'-]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def dump_json(value: Any) -> str:
+    """Serialize a settings/metadata value to the JSON text stored in the database."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def load_json(text: Union[str, bytes]) -> Any:
+    """Parse JSON text read back from the database."""
+    return orjson.loads(text)
+
+
+def sql_timestamp(value: datetime) -> str:
+    """
+    Format a datetime for comparison against CURRENT_TIMESTAMP columns.
+    
+    SQLite stores created_at/updated_at as 'YYYY-MM-DD HH:MM:SS' in UTC, and
+    compares them as text. Binding isoformat()'s 'T' separator would sort
+    every same-day bound after the stored value.
+    
+    Args:
+        value: Datetime to format; aware values are converted to UTC
+        
+    Returns:
+        Timestamp text in SQLite's CURRENT_TIMESTAMP layout
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(sep=' ')
+
+
+# Per-thread RNGs for retry jitter, so concurrent retries draw independent delays
+_retry_local = threading.local()
+
+
+def _backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Pick a full-jitter exponential backoff delay.
+    
+    Args:
+        attempt: Zero-based retry attempt
+        base_delay: Delay ceiling for the first retry, in seconds
+        max_delay: Upper bound on the delay ceiling, in seconds
+        
+    Returns:
+        Delay in seconds, uniform between 0 and the attempt's ceiling
+    """
+    rng = getattr(_retry_local, 'rng', None)
+    if rng is None:
+        rng = _retry_local.rng = random.Random(time.perf_counter_ns())
+    return rng.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def _is_locked_error(error: BaseException) -> bool:
+    """Whether an error, or the SQLite error it wraps, is a lock/busy failure."""
+    cause = error if isinstance(error, sqlite3.OperationalError) else error.__cause__
+    return isinstance(cause, sqlite3.OperationalError) and "database is locked" in str(cause).lower()
+
+
+def _memory_from_row(row: tuple) -> Dict[str, Any]:
+    """Build a memory dict from a plain-tuple list/search row."""
+    (memory_id, user_id, content, original_message,
+     category, confidence_score, timestamp, created_at,
+     updated_at, metadata, is_active) = row
+    return {
+        'memory_id': memory_id,
+        'user_id': user_id,
+        'content': content,
+        'original_message': original_message,
+        'category': category,
+        'confidence_score': confidence_score,
+        'timestamp': datetime.fromisoformat(timestamp) if timestamp else None,
+        'created_at': created_at,
+        'updated_at': updated_at,
+        'metadata': load_json(metadata) if metadata else {},
+        'is_active': bool(is_active)
+    }
+
 
 class DatabaseError(Exception):
     """Base exception for database operations."""
@@ -40,10 +125,39 @@ class MigrationError(DatabaseError):
     pass
 
 
+def build_update_statements(table: str, fields: Tuple[str, ...], where: str,
+                            touch_updated_at: bool = False) -> Dict[frozenset, Tuple[str, Tuple[str, ...]]]:
+    """
+    Precompute the UPDATE statement for every non-empty subset of fields.
+    
+    Partial updates then always reuse one of a fixed set of SQL strings, so
+    they stay resident in each connection's prepared-statement cache.
+    
+    Args:
+        table: Table to update
+        fields: Updatable columns, in SET-clause order
+        where: WHERE clause; its parameters follow the field values
+        touch_updated_at: Whether to also set updated_at to CURRENT_TIMESTAMP
+        
+    Returns:
+        Mapping of field subset to (sql, field order for parameters)
+    """
+    statements = {}
+    for size in range(1, len(fields) + 1):
+        for subset in combinations(fields, size):
+            assignments = [f"{field} = ?" for field in subset]
+            if touch_updated_at:
+                assignments.append("updated_at = CURRENT_TIMESTAMP")
+            sql = f"UPDATE {table} SET {', '.join(assignments)} WHERE {where}"
+            statements[frozenset(subset)] = (sql, subset)
+    return statements
+
+
 class ConnectionPool:
     """Thread-safe connection pool for SQLite database."""
     
-    def __init__(self, db_path: str, max_connections: int = 20, timeout: int = 30):
+    def __init__(self, db_path: str, max_connections: int = 20, timeout: int = 30,
+                 read_only: bool = False):
         """
         Initialize connection pool.
         
@@ -51,33 +165,44 @@ class ConnectionPool:
             db_path: Path to SQLite database
             max_connections: Maximum number of connections in pool
             timeout: Timeout in seconds for getting connection
+            read_only: Whether to pool read-only (query_only) connections
         """
         self.db_path = db_path
         self.max_connections = max_connections
         self.timeout = timeout
+        self.read_only = read_only
         self._pool = queue.Queue(maxsize=max_connections)
         self._lock = threading.Lock()
         self._created_connections = 0
         
-        logger.info(f"Initializing connection pool: max={max_connections}, timeout={timeout}s")
+        logger.info(f"Initializing {'read-only ' if read_only else ''}connection pool: "
+                    f"max={max_connections}, timeout={timeout}s")
     
     def _create_connection(self) -> sqlite3.Connection:
         """Create a new database connection with proper settings."""
+        if self.read_only:
+            try:
+                conn = DatabaseSchema.open_reader(self.db_path)
+                conn.row_factory = sqlite3.Row
+                return conn
+            except sqlite3.Error as e:
+                logger.error(f"Failed to create read-only database connection: {e}")
+                raise ConnectionPoolError(f"Failed to create connection: {e}")
+        
         try:
             conn = sqlite3.connect(
                 self.db_path,
                 timeout=self.timeout,
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=DatabaseSchema.CACHED_STATEMENTS,
+                # Autocommit: transaction() issues BEGIN itself, so the driver
+                # never opens an implicit deferred transaction behind its back
+                isolation_level=None
             )
             
-            # Configure connection settings
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.execute("PRAGMA synchronous = NORMAL")
-            conn.execute("PRAGMA cache_size = -10240")  # 10MB cache
-            conn.execute("PRAGMA temp_store = MEMORY")
-            conn.execute("PRAGMA mmap_size = 268435456")  # 256MB mmap
-            conn.execute("PRAGMA busy_timeout = 60000")  # 60 second timeout (increased)
+            # Same WAL, cache and mmap settings as the read pool and schema connections
+            DatabaseSchema._apply_pragmas(conn)
+            conn.execute("PRAGMA busy_timeout = 60000")  # 60 second timeout for writers
             conn.execute("PRAGMA wal_autocheckpoint = 100")  # Auto-checkpoint every 100 pages
             
             # Set row factory for dict-like access
@@ -143,6 +268,13 @@ class ConnectionPool:
             raise
         finally:
             if conn:
+                if conn.in_transaction:
+                    # Never pool a connection holding a snapshot or lock, e.g. from
+                    # a generator closed before its transaction finished
+                    try:
+                        conn.rollback()
+                    except sqlite3.Error:
+                        pass
                 try:
                     # Return connection to pool
                     self._pool.put_nowait(conn)
@@ -161,9 +293,15 @@ class ConnectionPool:
             while not self._pool.empty():
                 try:
                     conn = self._pool.get_nowait()
-                    conn.close()
                 except queue.Empty:
                     break
+                if not self.read_only:
+                    try:
+                        # Let SQLite refresh any planner statistics this connection found stale
+                        conn.execute("PRAGMA optimize")
+                    except sqlite3.Error as e:
+                        logger.debug(f"PRAGMA optimize on close failed: {e}")
+                conn.close()
             self._created_connections = 0
         logger.info("All connections closed")
     
@@ -181,6 +319,35 @@ class ConnectionPool:
 class DatabaseManager:
     """Database manager with connection pooling, transactions, and CRUD operations."""
     
+    # Columns update_memory can change, in SET-clause order
+    MEMORY_UPDATE_FIELDS = ('content', 'category', 'confidence_score', 'metadata')
+    UPDATE_MEMORY_SQL = build_update_statements(
+        'memories', MEMORY_UPDATE_FIELDS,
+        where="memory_id = ? AND deleted_at IS NULL", touch_updated_at=True
+    )
+    
+    LIST_MEMORIES_SQL = """
+        SELECT memory_id, user_id, content, original_message, category,
+               confidence_score, timestamp, created_at, updated_at,
+               metadata, deleted_at IS NULL AS is_active
+        FROM memories 
+        WHERE user_id = ? AND deleted_at IS NULL
+        ORDER BY created_at DESC LIMIT ? OFFSET ?
+    """
+    LIST_MEMORIES_BY_CATEGORY_SQL = """
+        SELECT memory_id, user_id, content, original_message, category,
+               confidence_score, timestamp, created_at, updated_at,
+               metadata, deleted_at IS NULL AS is_active
+        FROM memories 
+        WHERE user_id = ? AND deleted_at IS NULL AND category = ?
+        ORDER BY created_at DESC LIMIT ? OFFSET ?
+    """
+    
+    # OR IGNORE keeps the first embedding when a batch repeats a memory_id
+    INSERT_EMBEDDING_SQL = """
+        INSERT OR IGNORE INTO memory_embeddings (memory_id, embedding) VALUES (?, ?)
+    """
+    
     def __init__(self, db_path: Optional[str] = None, pool_size: Optional[int] = None):
         """
         Initialize database manager.
@@ -194,16 +361,28 @@ class DatabaseManager:
         self.pool_size = pool_size or config.database.pool_size
         self.timeout = config.database.timeout
         
-        # Initialize connection pool
+        # Initialize connection pools: read-write, plus query_only connections
+        # so WAL readers never queue behind writers for a pooled connection
         self.pool = ConnectionPool(
             self.db_path,
             max_connections=self.pool_size,
             timeout=self.timeout
         )
+        self.read_pool = ConnectionPool(
+            self.db_path,
+            max_connections=self.pool_size,
+            timeout=self.timeout,
+            read_only=True
+        )
         
-        # Retry configuration (more aggressive for database locks)
-        self.max_retries = 10  # Increased retries
-        self.retry_delay = 0.05  # 50ms base delay (faster initial retry)
+        # Retry configuration: full-jitter exponential backoff for database locks
+        self.max_retries = 10
+        self.retry_delay = 0.001  # 1ms ceiling on the first retry
+        self.max_retry_delay = 0.1  # 100ms cap on any single retry
+        
+        # Passing schema/FTS health checks are reused for this many seconds
+        self.health_check_ttl = 60.0
+        self._schema_checks_cache: Dict[bool, Tuple[float, Dict[str, bool]]] = {}
         
         logger.info(f"DatabaseManager initialized: {self.db_path}")
     
@@ -225,10 +404,12 @@ class DatabaseManager:
         for attempt in range(self.max_retries + 1):
             try:
                 return operation(*args, **kwargs)
-            except sqlite3.OperationalError as e:
-                if "database is locked" in str(e).lower() and attempt < self.max_retries:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(f"Database locked, retrying in {delay:.3f}s (attempt {attempt + 1}/{self.max_retries + 1})")
+            except (sqlite3.OperationalError, TransactionError) as e:
+                if _is_locked_error(e) and attempt < self.max_retries:
+                    delay = _backoff_delay(attempt, self.retry_delay, self.max_retry_delay)
+                    # Brief contention is expected; only sustained contention is worth a warning
+                    log = logger.warning if attempt >= 3 else logger.debug
+                    log(f"Database locked, retrying in {delay * 1000:.1f}ms (attempt {attempt + 1}/{self.max_retries + 1})")
                     time.sleep(delay)
                     continue
                 else:
@@ -244,12 +425,14 @@ class DatabaseManager:
         Context manager for database transactions.
         
         Args:
-            read_only: Whether this is a read-only transaction
+            read_only: Whether this is a read-only transaction; these run on
+                query_only connections from the read pool
             
         Yields:
             sqlite3.Connection: Database connection with active transaction
         """
-        with self.pool.get_connection() as conn:
+        pool = self.read_pool if read_only else self.pool
+        with pool.get_connection() as conn:
             savepoint = None
             try:
                 # Check if we're already in a transaction
@@ -257,40 +440,41 @@ class DatabaseManager:
                     # Use savepoint for nested transactions
                     savepoint = f"sp_{int(time.time() * 1000000)}"
                     conn.execute(f"SAVEPOINT {savepoint}")
+                elif not read_only:
+                    # Take the write lock at BEGIN; a deferred transaction that
+                    # later upgrades to a writer is what collides with SQLITE_BUSY
+                    conn.execute("BEGIN IMMEDIATE")
                 else:
-                    if not read_only:
-                        # Use IMMEDIATE for write transactions to prevent lock escalation
-                        conn.execute("BEGIN IMMEDIATE")
-                    else:
-                        # Use DEFERRED for read-only transactions
-                        conn.execute("BEGIN DEFERRED")
+                    # Use DEFERRED for read-only transactions
+                    conn.execute("BEGIN DEFERRED")
                 
                 yield conn
                 
                 if savepoint:
                     conn.execute(f"RELEASE SAVEPOINT {savepoint}")
                 else:
-                    if not read_only:
-                        conn.commit()
-                        logger.debug("Transaction committed")
+                    # Read transactions are ended too, so the connection goes
+                    # back to the pool without a snapshot or lock held
+                    conn.commit()
+                    logger.debug("Transaction committed")
                     
             except Exception as e:
                 if savepoint:
                     try:
                         conn.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                        conn.execute(f"RELEASE SAVEPOINT {savepoint}")
                         logger.debug("Savepoint rolled back")
                     except sqlite3.Error as rollback_error:
                         logger.error(f"Failed to rollback savepoint: {rollback_error}")
                 else:
-                    if not read_only:
-                        try:
-                            conn.rollback()
-                            logger.debug("Transaction rolled back")
-                        except sqlite3.Error as rollback_error:
-                            logger.error(f"Failed to rollback transaction: {rollback_error}")
+                    try:
+                        conn.rollback()
+                        logger.debug("Transaction rolled back")
+                    except sqlite3.Error as rollback_error:
+                        logger.error(f"Failed to rollback transaction: {rollback_error}")
                 
                 logger.error(f"Transaction failed: {e}")
-                raise TransactionError(f"Transaction failed: {e}")
+                raise TransactionError(f"Transaction failed: {e}") from e
     
     # User CRUD operations
     def create_user(self, user_id: str, settings: Optional[Dict] = None, metadata: Optional[Dict] = None) -> bool:
@@ -300,7 +484,7 @@ class DatabaseManager:
                 conn.execute("""
                     INSERT INTO users (user_id, settings, metadata)
                     VALUES (?, ?, ?)
-                """, (user_id, json.dumps(settings) if settings else None, json.dumps(metadata) if metadata else None))
+                """, (user_id, dump_json(settings) if settings else None, dump_json(metadata) if metadata else None))
                 return True
         
         try:
@@ -326,8 +510,8 @@ class DatabaseManager:
                         'user_id': row['user_id'],
                         'created_at': row['created_at'],
                         'updated_at': row['updated_at'],
-                        'settings': json.loads(row['settings']) if row['settings'] else {},
-                        'metadata': json.loads(row['metadata']) if row['metadata'] else {}
+                        'settings': load_json(row['settings']) if row['settings'] else {},
+                        'metadata': load_json(row['metadata']) if row['metadata'] else {}
                     }
                 return None
         
@@ -339,11 +523,12 @@ class DatabaseManager:
             with self.transaction() as conn:
                 cursor = conn.execute("""
                     UPDATE users 
-                    SET settings = COALESCE(?, settings), metadata = COALESCE(?, metadata)
+                    SET settings = COALESCE(?, settings), metadata = COALESCE(?, metadata),
+                        updated_at = CURRENT_TIMESTAMP
                     WHERE user_id = ?
                 """, (
-                    json.dumps(settings) if settings is not None else None,
-                    json.dumps(metadata) if metadata is not None else None,
+                    dump_json(settings) if settings is not None else None,
+                    dump_json(metadata) if metadata is not None else None,
                     user_id
                 ))
                 return cursor.rowcount > 0
@@ -370,13 +555,15 @@ class DatabaseManager:
                 conn.execute("""
                     INSERT INTO memories 
                     (memory_id, user_id, content, original_message, category, 
-                     confidence_score, timestamp, metadata, embedding)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     confidence_score, timestamp, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     memory_id, user_id, content, original_message, category,
                     confidence_score, timestamp.isoformat() if timestamp else None,
-                    json.dumps(metadata) if metadata else None, embedding
+                    dump_json(metadata) if metadata else None
                 ))
+                if embedding is not None:
+                    conn.execute(self.INSERT_EMBEDDING_SQL, (memory_id, embedding))
                 return True
         
         try:
@@ -387,16 +574,87 @@ class DatabaseManager:
                 return False
             raise
     
-    def get_memory(self, memory_id: str) -> Optional[Dict[str, Any]]:
-        """Get memory by ID."""
+    @staticmethod
+    def existing_memory_ids(conn: sqlite3.Connection, memory_ids: List[str]) -> set:
+        """
+        Return which of the given memory IDs already exist, deleted or not.
+        
+        The IDs are bound as one JSON array so the query text stays constant
+        whatever the batch size.
+        """
+        if not memory_ids:
+            return set()
+        cursor = conn.execute(
+            "SELECT memory_id FROM memories WHERE memory_id IN (SELECT value FROM json_each(?))",
+            (dump_json(memory_ids),)
+        )
+        return {row[0] for row in cursor}
+    
+    def create_memories_bulk(self, memories: List[Dict[str, Any]]) -> int:
+        """
+        Create many memories in a single write transaction.
+        
+        Args:
+            memories: Memory dicts with the create_memory arguments as keys;
+                memory_id, user_id and content are required
+                
+        Returns:
+            Number of memories inserted; existing memory_ids are skipped
+        """
+        rows = [
+            (
+                memory['memory_id'], memory['user_id'], memory['content'],
+                memory.get('original_message'), memory.get('category'),
+                memory.get('confidence_score'),
+                memory['timestamp'].isoformat() if memory.get('timestamp') else None,
+                dump_json(memory['metadata']) if memory.get('metadata') else None
+            )
+            for memory in memories
+        ]
+        if not rows:
+            return 0
+        
+        embeddings = [
+            (memory['memory_id'], memory['embedding'])
+            for memory in memories if memory.get('embedding') is not None
+        ]
+        
+        def _create():
+            with self.transaction() as conn:
+                # Duplicates skipped by OR IGNORE must not pick up this batch's embeddings
+                existing = DatabaseManager.existing_memory_ids(conn, [row[0] for row in embeddings])
+                cursor = conn.executemany("""
+                    INSERT OR IGNORE INTO memories 
+                    (memory_id, user_id, content, original_message, category, 
+                     confidence_score, timestamp, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                conn.executemany(DatabaseManager.INSERT_EMBEDDING_SQL, [
+                    row for row in embeddings if row[0] not in existing
+                ])
+                return cursor.rowcount
+        
+        return self._retry_on_locked(_create)
+    
+    def get_memory(self, memory_id: str, include_embedding: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get memory by ID.
+        
+        Args:
+            memory_id: Memory identifier
+            include_embedding: Whether to read the embedding from memory_embeddings;
+                when False the returned 'embedding' is None
+        """
         def _get():
             with self.transaction(read_only=True) as conn:
                 cursor = conn.execute("""
-                    SELECT memory_id, user_id, content, original_message, category,
-                           confidence_score, timestamp, created_at, updated_at,
-                           metadata, embedding, is_active
-                    FROM memories WHERE memory_id = ? AND is_active = TRUE
-                """, (memory_id,))
+                    SELECT m.memory_id, m.user_id, m.content, m.original_message, m.category,
+                           m.confidence_score, m.timestamp, m.created_at, m.updated_at,
+                           m.metadata, e.embedding, m.deleted_at IS NULL AS is_active
+                    FROM memories m
+                    LEFT JOIN memory_embeddings e ON e.memory_id = m.memory_id AND ?
+                    WHERE m.memory_id = ? AND m.deleted_at IS NULL
+                """, (include_embedding, memory_id))
                 row = cursor.fetchone()
                 
                 if row:
@@ -410,7 +668,7 @@ class DatabaseManager:
                         'timestamp': datetime.fromisoformat(row['timestamp']) if row['timestamp'] else None,
                         'created_at': row['created_at'],
                         'updated_at': row['updated_at'],
-                        'metadata': json.loads(row['metadata']) if row['metadata'] else {},
+                        'metadata': load_json(row['metadata']) if row['metadata'] else {},
                         'embedding': row['embedding'],
                         'is_active': bool(row['is_active'])
                     }
@@ -424,48 +682,27 @@ class DatabaseManager:
         """Update memory content and metadata."""
         def _update():
             with self.transaction() as conn:
-                # First get current content for audit
-                cursor = conn.execute("SELECT content FROM memories WHERE memory_id = ?", (memory_id,))
-                current = cursor.fetchone()
-                if not current:
-                    return False
-                
-                previous_content = current['content']
-                
                 # Update memory
-                update_fields = []
-                params = []
-                
-                if content is not None:
-                    update_fields.append("content = ?")
-                    params.append(content)
-                if category is not None:
-                    update_fields.append("category = ?")
-                    params.append(category)
-                if confidence_score is not None:
-                    update_fields.append("confidence_score = ?")
-                    params.append(confidence_score)
-                if metadata is not None:
-                    update_fields.append("metadata = ?")
-                    params.append(json.dumps(metadata))
+                values = {
+                    'content': content,
+                    'category': category,
+                    'confidence_score': confidence_score,
+                    'metadata': dump_json(metadata) if metadata is not None else None
+                }
+                fields = frozenset(field for field, value in values.items() if value is not None)
                 
-                if not update_fields:
-                    return True  # Nothing to update
+                if not fields:
+                    # Nothing to update
+                    cursor = conn.execute("SELECT 1 FROM memories WHERE memory_id = ?", (memory_id,))
+                    return cursor.fetchone() is not None
                 
+                # Content edits are recorded in memory_updates by the
+                # audit_memories_content_update trigger
+                sql, field_order = self.UPDATE_MEMORY_SQL[fields]
+                params = [values[field] for field in field_order]
                 params.append(memory_id)
                 
-                cursor = conn.execute(f"""
-                    UPDATE memories SET {', '.join(update_fields)}
-                    WHERE memory_id = ? AND is_active = TRUE
-                """, params)
-                
-                if cursor.rowcount > 0 and content is not None:
-                    # Create audit record
-                    conn.execute("""
-                        INSERT INTO memory_updates 
-                        (update_id, memory_id, previous_content, new_content, update_type, updated_by)
-                        VALUES (?, ?, ?, ?, 'update', 'system')
-                    """, (str(uuid.uuid4()), memory_id, previous_content, content))
+                cursor = conn.execute(sql, params)
                 
                 return cursor.rowcount > 0
         
@@ -477,8 +714,8 @@ class DatabaseManager:
             with self.transaction() as conn:
                 if soft_delete:
                     cursor = conn.execute("""
-                        UPDATE memories SET is_active = FALSE 
-                        WHERE memory_id = ? AND is_active = TRUE
+                        UPDATE memories SET deleted_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                        WHERE memory_id = ? AND deleted_at IS NULL
                     """, (memory_id,))
                 else:
                     cursor = conn.execute("DELETE FROM memories WHERE memory_id = ?", (memory_id,))
@@ -492,39 +729,18 @@ class DatabaseManager:
         """List memories for a user."""
         def _list():
             with self.transaction(read_only=True) as conn:
-                query = """
-                    SELECT memory_id, user_id, content, original_message, category,
-                           confidence_score, timestamp, created_at, updated_at,
-                           metadata, is_active
-                    FROM memories 
-                    WHERE user_id = ? AND is_active = TRUE
-                """
-                params = [user_id]
-                
                 if category:
-                    query += " AND category = ?"
-                    params.append(category)
-                
-                query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-                params.extend([limit, offset])
-                
-                cursor = conn.execute(query, params)
-                memories = []
+                    query = self.LIST_MEMORIES_BY_CATEGORY_SQL
+                    params = (user_id, category, limit, offset)
+                else:
+                    query = self.LIST_MEMORIES_SQL
+                    params = (user_id, limit, offset)
                 
-                for row in cursor.fetchall():
-                    memories.append({
-                        'memory_id': row['memory_id'],
-                        'user_id': row['user_id'],
-                        'content': row['content'],
-                        'original_message': row['original_message'],
-                        'category': row['category'],
-                        'confidence_score': row['confidence_score'],
-                        'timestamp': datetime.fromisoformat(row['timestamp']) if row['timestamp'] else None,
-                        'created_at': row['created_at'],
-                        'updated_at': row['updated_at'],
-                        'metadata': json.loads(row['metadata']) if row['metadata'] else {},
-                        'is_active': bool(row['is_active'])
-                    })
+                # Plain tuples, unpacked positionally instead of through sqlite3.Row
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(query, params)
+                memories = [_memory_from_row(row) for row in cursor]
                 
                 return memories
         
@@ -536,49 +752,38 @@ class DatabaseManager:
             with self.transaction(read_only=True) as conn:
                 # Clean query for FTS5 - remove problematic characters
                 # Remove dates, special chars that can confuse FTS5
-                import re
-                clean_query = re.sub(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[\.\d]*', '', query)
-                clean_query = re.sub(r'[<>()"\'-]', ' ', clean_query)
-                clean_query = ' '.join(clean_query.split())  # Normalize whitespace
+                clean_query = _TIMESTAMP_PATTERN.sub('', query)
+                clean_query = _FTS_PUNCTUATION_PATTERN.sub(' ', clean_query)
+                clean_query = _WHITESPACE_PATTERN.sub(' ', clean_query).strip()  # Normalize whitespace
+                
+                # Plain tuples, unpacked positionally instead of through sqlite3.Row
+                cursor = conn.cursor()
+                cursor.row_factory = None
                 
                 if not clean_query or len(clean_query) < 2:
                     # If query is too short after cleaning, use simple LIKE search
-                    cursor = conn.execute("""
+                    cursor.execute("""
                         SELECT memory_id, user_id, content, original_message, category,
                                confidence_score, timestamp, created_at, updated_at,
-                               metadata, is_active
+                               metadata, deleted_at IS NULL AS is_active
                         FROM memories
-                        WHERE user_id = ? AND is_active = TRUE 
+                        WHERE user_id = ? AND deleted_at IS NULL 
                         AND content LIKE ?
                         ORDER BY confidence_score DESC LIMIT ?
                     """, (user_id, f'%{query[:20]}%', limit))
                 else:
-                    cursor = conn.execute("""
+                    cursor.execute("""
                         SELECT m.memory_id, m.user_id, m.content, m.original_message, m.category,
                                m.confidence_score, m.timestamp, m.created_at, m.updated_at,
-                               m.metadata, m.is_active
+                               m.metadata, m.deleted_at IS NULL AS is_active
                         FROM memories m
-                        JOIN memories_fts fts ON m.memory_id = fts.memory_id
-                        WHERE m.user_id = ? AND m.is_active = TRUE 
+                        JOIN memories_fts fts ON fts.rowid = m.id
+                        WHERE m.user_id = ? AND m.deleted_at IS NULL 
                         AND memories_fts MATCH ?
                         ORDER BY rank LIMIT ?
                     """, (user_id, clean_query, limit))
                 
-                memories = []
-                for row in cursor.fetchall():
-                    memories.append({
-                        'memory_id': row['memory_id'],
-                        'user_id': row['user_id'],
-                        'content': row['content'],
-                        'original_message': row['original_message'],
-                        'category': row['category'],
-                        'confidence_score': row['confidence_score'],
-                        'timestamp': datetime.fromisoformat(row['timestamp']) if row['timestamp'] else None,
-                        'created_at': row['created_at'],
-                        'updated_at': row['updated_at'],
-                        'metadata': json.loads(row['metadata']) if row['metadata'] else {},
-                        'is_active': bool(row['is_active'])
-                    })
+                memories = [_memory_from_row(row) for row in cursor]
                 
                 return memories
         
@@ -616,6 +821,8 @@ class DatabaseManager:
             
             # Close all connections
             self.pool.close_all()
+            self.read_pool.close_all()
+            self._schema_checks_cache.clear()
             
             # Use SQLite's backup API for consistency
             backup_conn = sqlite3.connect(str(backup_file))
@@ -630,12 +837,18 @@ class DatabaseManager:
             finally:
                 backup_conn.close()
             
-            # Reinitialize connection pool
+            # Reinitialize connection pools
             self.pool = ConnectionPool(
                 self.db_path,
                 max_connections=self.pool_size,
                 timeout=self.timeout
             )
+            self.read_pool = ConnectionPool(
+                self.db_path,
+                max_connections=self.pool_size,
+                timeout=self.timeout,
+                read_only=True
+            )
             
             # Verify the restore worked by making a test connection
             with self.pool.get_connection() as conn:
@@ -649,6 +862,40 @@ class DatabaseManager:
             return False
     
     # Health checks
+    def schema_checks(self, per_user: bool = False) -> Dict[str, bool]:
+        """
+        Validate the schema and FTS indexes, reusing a recent passing result.
+        
+        Both checks open their own connection, read sqlite_master and probe
+        the FTS indexes, while the schema only changes on migration. A
+        passing result is therefore served from memory for health_check_ttl
+        seconds; failures are re-checked on every call.
+        
+        Args:
+            per_user: Whether to check against the per-user schema
+            
+        Returns:
+            Dict with 'schema' and 'fts' check results
+        """
+        cached = self._schema_checks_cache.get(per_user)
+        if cached and time.monotonic() - cached[0] < self.health_check_ttl:
+            return dict(cached[1])
+        
+        if per_user:
+            checks = {
+                'schema': DatabaseSchema.validate_user_schema(self.db_path),
+                'fts': DatabaseSchema.test_user_fts_functionality(self.db_path)
+            }
+        else:
+            checks = {
+                'schema': DatabaseSchema.validate_schema(self.db_path),
+                'fts': DatabaseSchema.test_fts_functionality(self.db_path)
+            }
+        
+        if all(checks.values()):
+            self._schema_checks_cache[per_user] = (time.monotonic(), checks)
+        return dict(checks)
+    
     def health_check(self) -> Dict[str, Any]:
         """Perform database health check."""
         health = {
@@ -664,14 +911,12 @@ class DatabaseManager:
                 conn.execute("SELECT 1").fetchone()
             health['checks']['connectivity'] = True
             
-            # Schema validation
-            health['checks']['schema'] = DatabaseSchema.validate_schema(self.db_path)
-            
-            # FTS functionality
-            health['checks']['fts'] = DatabaseSchema.test_fts_functionality(self.db_path)
+            # Schema validation and FTS functionality
+            health['checks'].update(self.schema_checks())
             
             # Connection pool stats
             health['stats']['pool'] = self.pool.get_stats()
+            health['stats']['read_pool'] = self.read_pool.get_stats()
             
             # Database file stats
             db_file = Path(self.db_path)
@@ -692,6 +937,8 @@ class DatabaseManager:
     def close(self):
         """Close all database connections."""
         self.pool.close_all()
+        self.read_pool.close_all()
+        self._schema_checks_cache.clear()
         logger.info("DatabaseManager closed")
     
     def __enter__(self):
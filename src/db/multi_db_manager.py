@@ -17,6 +17,7 @@ from core.config import get_config
 from core.logging import get_logger
 from .manager import DatabaseManager, DatabaseError
 from .schema import DatabaseSchema
+from .user_db_manager import UserDatabaseManager
 
 logger = get_logger(__name__)
 
@@ -57,6 +58,9 @@ class MultiDatabaseManager:
         self._db_managers: Dict[str, DatabaseManager] = {}
         self._managers_lock = threading.RLock()
         
+        # UserDatabaseManager wrappers over the cached managers, shared by all callers
+        self._user_db_managers: Dict[str, UserDatabaseManager] = {}
+        
         # Weak references for cleanup
         self._weak_managers = weakref.WeakValueDictionary()
         
@@ -185,6 +189,29 @@ class MultiDatabaseManager:
         
         return self._get_or_create_db_manager(user_id)
     
+    def get_user_database_manager(self, user_id: str) -> UserDatabaseManager:
+        """
+        Get the shared UserDatabaseManager for a specific user.
+        
+        The wrapper is created once over the user's cached DatabaseManager and
+        returned to every caller until the manager is closed or cleaned up.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            UserDatabaseManager instance for the user
+        """
+        if not user_id:
+            raise UserDatabaseError("user_id cannot be empty")
+        
+        with self._managers_lock:
+            user_db_manager = self._user_db_managers.get(user_id)
+            if user_db_manager is None:
+                user_db_manager = UserDatabaseManager(self._get_or_create_db_manager(user_id))
+                self._user_db_managers[user_id] = user_db_manager
+            return user_db_manager
+    
     def user_exists(self, user_id: str) -> bool:
         """
         Check if a user database exists.
@@ -237,6 +264,7 @@ class MultiDatabaseManager:
                 if user_id in self._db_managers:
                     self._db_managers[user_id].close()
                     del self._db_managers[user_id]
+                self._user_db_managers.pop(user_id, None)
             
             # Delete database files
             db_path = self._get_user_db_path(user_id)
@@ -339,9 +367,7 @@ class MultiDatabaseManager:
             try:
                 # Check health for databases we have managers for
                 if user_id in self._db_managers:
-                    from .user_db_manager import UserDatabaseManager
-                    db_manager = self._db_managers[user_id]
-                    user_db_manager = UserDatabaseManager(db_manager)
+                    user_db_manager = self.get_user_database_manager(user_id)
                     user_health = user_db_manager.health_check()
                     health['users'][user_id] = user_health
                     
@@ -456,6 +482,7 @@ class MultiDatabaseManager:
                     manager = self._db_managers[user_id]
                     manager.close()
                     del self._db_managers[user_id]
+                    self._user_db_managers.pop(user_id, None)
                     cleaned_up += 1
                     logger.debug(f"Cleaned up database manager for user: {user_id}")
                 except Exception as e:
@@ -476,6 +503,7 @@ class MultiDatabaseManager:
                     logger.error(f"Error closing manager for user {user_id}: {e}")
             
             self._db_managers.clear()
+            self._user_db_managers.clear()
             self._weak_managers.clear()
         
         logger.info("All database managers closed")
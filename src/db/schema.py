@@ -1,8 +1,13 @@
 """
 Database schema definitions for Harmonia Memory Storage System.
+
+updated_at is not maintained by triggers: UPDATE statements on memories
+and users must set updated_at = CURRENT_TIMESTAMP themselves.
 """
 import sqlite3
-from typing import List, Optional
+import struct
+import time
+from typing import Any, Dict, Iterable, List, Optional
 from pathlib import Path
 import logging
 
@@ -15,13 +20,52 @@ class DatabaseSchema:
     """Database schema management and initialization."""
     
     # Schema version for migrations
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 10
+    
+    # Embeddings are stored as packed little-endian float16 vectors of a fixed
+    # dimension, readable directly with numpy.frombuffer(blob, dtype='<f2')
+    EMBEDDING_DIM = 768
+    EMBEDDING_FORMAT = f"<{EMBEDDING_DIM}e"
+    
+    # Per-connection PRAGMA bundle. busy_timeout, cache_size, temp_store and
+    # mmap_size are connection-scoped, so every new connection must re-apply them.
+    CONNECTION_PRAGMAS = [
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA busy_timeout = 5000",
+        "PRAGMA cache_size = -65536",  # 64MB
+        "PRAGMA temp_store = MEMORY",
+        # Reads fault pages straight from the mapped file rather than copying
+        # them through read(). Trade-off: an I/O error on a mapped page raises
+        # SIGBUS and kills the process instead of returning SQLITE_IOERR.
+        "PRAGMA mmap_size = 268435456"  # 256MB
+    ]
+    
+    # Page size for new database files; larger pages fit more long content rows
+    # per B-tree node. It is fixed by the first write, so existing files keep theirs.
+    PAGE_SIZE = 8192
+    
+    # Prepared statement cache size for long-lived connections (sqlite3 default is 128)
+    CACHED_STATEMENTS = 256
+    
+    # Embeddings live beside memories rather than inline, so scans over the
+    # memories table don't page through 1.5 KB of vector per row
+    CREATE_EMBEDDINGS_TABLE = """
+            CREATE TABLE IF NOT EXISTS memory_embeddings (
+                memory_id TEXT PRIMARY KEY,
+                embedding BLOB NOT NULL CHECK (length(embedding) = 1536),
+                FOREIGN KEY (memory_id) REFERENCES memories(memory_id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+        """
     
-    # SQL DDL statements for creating tables
+    # SQL DDL statements for creating tables. Rows are keyed by an INTEGER
+    # PRIMARY KEY (the rowid); external text ids are UNIQUE columns, which
+    # foreign keys reference.
     CREATE_TABLES = {
         'users': """
             CREATE TABLE IF NOT EXISTS users (
-                user_id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                user_id TEXT NOT NULL UNIQUE,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 settings JSON,
@@ -31,7 +75,8 @@ class DatabaseSchema:
         
         'memories': """
             CREATE TABLE IF NOT EXISTS memories (
-                memory_id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                memory_id TEXT NOT NULL UNIQUE,
                 user_id TEXT NOT NULL,
                 content TEXT NOT NULL,
                 original_message TEXT,
@@ -41,15 +86,17 @@ class DatabaseSchema:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 metadata JSON,
-                embedding BLOB,
-                is_active BOOLEAN DEFAULT TRUE,
+                deleted_at TIMESTAMP,
                 FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
             )
         """,
         
+        'memory_embeddings': CREATE_EMBEDDINGS_TABLE,
+        
         'memory_updates': """
             CREATE TABLE IF NOT EXISTS memory_updates (
-                update_id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                update_id TEXT NOT NULL UNIQUE,
                 memory_id TEXT NOT NULL,
                 previous_content TEXT,
                 new_content TEXT,
@@ -63,7 +110,8 @@ class DatabaseSchema:
         
         'sessions': """
             CREATE TABLE IF NOT EXISTS sessions (
-                session_id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                session_id TEXT NOT NULL UNIQUE,
                 user_id TEXT NOT NULL,
                 started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 ended_at TIMESTAMP,
@@ -76,7 +124,8 @@ class DatabaseSchema:
         
         'categories': """
             CREATE TABLE IF NOT EXISTS categories (
-                category_id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                category_id TEXT NOT NULL UNIQUE,
                 name TEXT NOT NULL,
                 description TEXT,
                 parent_category_id TEXT,
@@ -94,23 +143,66 @@ class DatabaseSchema:
         """
     }
     
-    # FTS5 virtual table for full-text search
+    # FTS5 virtual table for full-text search (unicode61 handles non-ASCII
+    # text and diacritics; porter stems English on top of it). External
+    # content: only the inverted index is stored, text is read from memories
+    # through its stable INTEGER PRIMARY KEY.
     CREATE_FTS_TABLE = """
         CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
-            memory_id UNINDEXED,
             content,
             category,
-            tokenize = 'porter'
+            content = 'memories',
+            content_rowid = 'id',
+            tokenize = 'porter unicode61 remove_diacritics 2'
+        )
+    """
+    
+    # Trigram FTS5 table for substring and CJK queries (requires SQLite 3.34+)
+    CREATE_FTS_TRIGRAM_TABLE = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts_tri USING fts5(
+            content,
+            content = 'memories',
+            content_rowid = 'id',
+            tokenize = 'trigram'
         )
     """
     
+    # Reindex the FTS tables from memories
+    REBUILD_FTS_TABLES = [
+        "INSERT INTO memories_fts(memories_fts) VALUES('rebuild')",
+        "INSERT INTO memories_fts_tri(memories_fts_tri) VALUES('rebuild')"
+    ]
+    
+    # Index memories added after a given id; used by bulk loads instead of the insert trigger
+    INDEX_NEW_FTS_ROWS = [
+        """
+        INSERT INTO memories_fts(rowid, content, category)
+        SELECT id, content, COALESCE(category, '') FROM memories WHERE id > ?
+        """,
+        
+        """
+        INSERT INTO memories_fts_tri(rowid, content)
+        SELECT id, content FROM memories WHERE id > ?
+        """
+    ]
+    
+    # Merge FTS index segments; run periodically to keep queries fast
+    OPTIMIZE_FTS_TABLES = [
+        "INSERT INTO memories_fts(memories_fts) VALUES('optimize')",
+        "INSERT INTO memories_fts_tri(memories_fts_tri) VALUES('optimize')"
+    ]
+    
     # Database indexes for performance
     CREATE_INDEXES = [
         "CREATE INDEX IF NOT EXISTS idx_memories_user_id ON memories(user_id)",
         "CREATE INDEX IF NOT EXISTS idx_memories_timestamp ON memories(timestamp)",
         "CREATE INDEX IF NOT EXISTS idx_memories_category ON memories(category)",
         "CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at)",
-        "CREATE INDEX IF NOT EXISTS idx_memories_is_active ON memories(is_active)",
+        # Partial indexes over active (not soft-deleted) memories; queries must
+        # filter with 'deleted_at IS NULL' for the planner to use them
+        "CREATE INDEX IF NOT EXISTS idx_memories_user_active_ts ON memories(user_id, timestamp DESC) WHERE deleted_at IS NULL",
+        "CREATE INDEX IF NOT EXISTS idx_memories_user_active ON memories(user_id, created_at DESC) WHERE deleted_at IS NULL",
+        "CREATE INDEX IF NOT EXISTS idx_memories_user_category_active ON memories(user_id, category, created_at DESC) WHERE deleted_at IS NULL",
         "CREATE INDEX IF NOT EXISTS idx_memory_updates_memory_id ON memory_updates(memory_id)",
         "CREATE INDEX IF NOT EXISTS idx_memory_updates_updated_at ON memory_updates(updated_at)",
         "CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id)",
@@ -118,44 +210,34 @@ class DatabaseSchema:
         "CREATE INDEX IF NOT EXISTS idx_categories_parent ON categories(parent_category_id)"
     ]
     
-    # Database triggers for maintaining data integrity
-    CREATE_TRIGGERS = [
-        """
-        CREATE TRIGGER IF NOT EXISTS update_memories_timestamp
-        AFTER UPDATE ON memories
-        FOR EACH ROW
-        BEGIN
-            UPDATE memories SET updated_at = CURRENT_TIMESTAMP WHERE memory_id = NEW.memory_id;
-        END
-        """,
-        
-        """
-        CREATE TRIGGER IF NOT EXISTS update_users_timestamp
-        AFTER UPDATE ON users
-        FOR EACH ROW
-        BEGIN
-            UPDATE users SET updated_at = CURRENT_TIMESTAMP WHERE user_id = NEW.user_id;
-        END
-        """,
-        
+    # Triggers keeping both FTS tables in sync with memories. External-content
+    # tables must be told the old values to remove them from the index.
+    CREATE_FTS_TRIGGERS = [
         """
         CREATE TRIGGER IF NOT EXISTS sync_memories_fts_insert
         AFTER INSERT ON memories
         FOR EACH ROW
         BEGIN
-            INSERT INTO memories_fts(memory_id, content, category)
-            VALUES(NEW.memory_id, NEW.content, COALESCE(NEW.category, ''));
+            INSERT INTO memories_fts(rowid, content, category)
+            VALUES(NEW.id, NEW.content, COALESCE(NEW.category, ''));
+            INSERT INTO memories_fts_tri(rowid, content)
+            VALUES(NEW.id, NEW.content);
         END
         """,
         
         """
         CREATE TRIGGER IF NOT EXISTS sync_memories_fts_update
-        AFTER UPDATE ON memories
+        AFTER UPDATE OF content, category ON memories
         FOR EACH ROW
         BEGIN
-            UPDATE memories_fts
-            SET content = NEW.content, category = COALESCE(NEW.category, '')
-            WHERE memory_id = NEW.memory_id;
+            INSERT INTO memories_fts(memories_fts, rowid, content, category)
+            VALUES('delete', OLD.id, OLD.content, COALESCE(OLD.category, ''));
+            INSERT INTO memories_fts(rowid, content, category)
+            VALUES(NEW.id, NEW.content, COALESCE(NEW.category, ''));
+            INSERT INTO memories_fts_tri(memories_fts_tri, rowid, content)
+            VALUES('delete', OLD.id, OLD.content);
+            INSERT INTO memories_fts_tri(rowid, content)
+            VALUES(NEW.id, NEW.content);
         END
         """,
         
@@ -164,11 +246,93 @@ class DatabaseSchema:
         AFTER DELETE ON memories
         FOR EACH ROW
         BEGIN
-            DELETE FROM memories_fts WHERE memory_id = OLD.memory_id;
+            INSERT INTO memories_fts(memories_fts, rowid, content, category)
+            VALUES('delete', OLD.id, OLD.content, COALESCE(OLD.category, ''));
+            INSERT INTO memories_fts_tri(memories_fts_tri, rowid, content)
+            VALUES('delete', OLD.id, OLD.content);
         END
         """
     ]
     
+    # Audit trail for content edits, written in the same statement as the edit
+    CREATE_AUDIT_TRIGGERS = [
+        """
+        CREATE TRIGGER IF NOT EXISTS audit_memories_content_update
+        AFTER UPDATE OF content ON memories
+        FOR EACH ROW
+        WHEN OLD.content IS NOT NEW.content
+        BEGIN
+            INSERT INTO memory_updates
+            (update_id, memory_id, previous_content, new_content, update_type, updated_by)
+            VALUES (lower(hex(randomblob(16))), NEW.memory_id, OLD.content, NEW.content,
+                    'update', 'system');
+        END
+        """
+    ]
+    
+    # Database triggers for maintaining data integrity
+    CREATE_TRIGGERS = CREATE_FTS_TRIGGERS + CREATE_AUDIT_TRIGGERS
+    
+    # Statements upgrading an existing database to each schema version. They run
+    # against the tables as they were before the upgrade; objects dropped here
+    # are recreated from the current definitions once all steps ran.
+    MIGRATIONS = {
+        2: [
+            # The tokenizer of an FTS5 table cannot be altered; rebuild it
+            "DROP TABLE IF EXISTS memories_fts"
+        ],
+        3: [
+            # FTS tables become external-content tables keyed by memories.id
+            "DROP TABLE IF EXISTS memories_fts",
+            "DROP TABLE IF EXISTS memories_fts_tri",
+            "DROP TRIGGER IF EXISTS sync_memories_fts_insert",
+            "DROP TRIGGER IF EXISTS sync_memories_fts_update",
+            "DROP TRIGGER IF EXISTS sync_memories_fts_delete",
+            "DROP TRIGGER IF EXISTS sync_memories_fts_tri_insert",
+            "DROP TRIGGER IF EXISTS sync_memories_fts_tri_update",
+            "DROP TRIGGER IF EXISTS sync_memories_fts_tri_delete"
+        ],
+        # Partial listing indexes replace the low-selectivity is_active index
+        4: [
+            "DROP INDEX IF EXISTS idx_memories_is_active"
+        ],
+        # updated_at is now set by the UPDATE statements themselves
+        5: [
+            "DROP TRIGGER IF EXISTS update_memories_timestamp",
+            "DROP TRIGGER IF EXISTS update_users_timestamp"
+        ],
+        # Embeddings without the fixed float16 layout cannot be decoded; drop them
+        # so only rows passing the embedding CHECK constraint are carried forward
+        6: [
+            "UPDATE memories SET embedding = NULL WHERE length(embedding) != 1536"
+        ],
+        # Text primary keys become UNIQUE columns beside an INTEGER PRIMARY KEY
+        7: [],
+        # Soft deletion is recorded as deleted_at instead of an is_active flag
+        8: [
+            "ALTER TABLE memories ADD COLUMN deleted_at TIMESTAMP",
+            "UPDATE memories SET deleted_at = COALESCE(updated_at, CURRENT_TIMESTAMP) WHERE NOT is_active"
+        ],
+        # Content edits are audited by a trigger instead of by the caller
+        9: [],
+        # Embeddings move to their own table; the rebuild drops the old column
+        10: [
+            CREATE_EMBEDDINGS_TABLE,
+            "INSERT OR IGNORE INTO memory_embeddings (memory_id, embedding) "
+            "SELECT memory_id, embedding FROM memories WHERE embedding IS NOT NULL"
+        ]
+    }
+    
+    # Tables rebuilt from their current definition when upgrading past each
+    # version; each table is rebuilt once, after all migration statements
+    REBUILD_TABLES = {
+        3: ['memories'],
+        6: ['memories'],
+        7: ['users', 'memory_updates', 'sessions', 'categories'],
+        8: ['memories'],
+        10: ['memories']
+    }
+    
     # Default data to insert after schema creation
     DEFAULT_DATA = [
         """
@@ -184,75 +348,525 @@ class DatabaseSchema:
         
         f"""
         INSERT OR IGNORE INTO schema_version (version, description) VALUES
-        ({SCHEMA_VERSION}, 'Initial database schema with FTS5 search')
+        ({SCHEMA_VERSION}, 'Database schema with external-content FTS5 and trigram search')
         """
     ]
     
+    # Schema validation checks, tagged by kind. memories_fts exists in every
+    # schema version, so probing it can't block a migration.
+    VALIDATION_QUERY = """
+        SELECT 'table', name FROM sqlite_master
+        WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+        UNION ALL
+        SELECT 'version', MAX(version) FROM schema_version
+        UNION ALL
+        SELECT 'fts', COUNT(*) FROM (SELECT 1 FROM memories_fts LIMIT 1)
+    """
+    
+    # Initialization scripts, joined once at class load for executescript().
+    # Seed rows go in before indexes and triggers are built.
+    _DDL_SCRIPT_DEFERRED = ";\n".join(
+        list(CREATE_TABLES.values()) + [CREATE_FTS_TABLE, CREATE_FTS_TRIGRAM_TABLE] + DEFAULT_DATA
+    )
+    _DDL_SCRIPT = ";\n".join([_DDL_SCRIPT_DEFERRED] + CREATE_INDEXES + CREATE_TRIGGERS)
+    _REBUILD_FTS_SCRIPT = ";\n".join(REBUILD_FTS_TABLES)
+    
+    @classmethod
+    def pack_embedding(cls, values: Iterable[float]) -> bytes:
+        """
+        Pack an embedding vector into the stored BLOB layout.
+        
+        Args:
+            values: EMBEDDING_DIM floats
+            
+        Returns:
+            Little-endian float16 bytes
+            
+        Raises:
+            ValueError: If the vector has the wrong dimension
+        """
+        values = list(values)
+        if len(values) != cls.EMBEDDING_DIM:
+            raise ValueError(f"Embedding must have {cls.EMBEDDING_DIM} dimensions, got {len(values)}")
+        return struct.pack(cls.EMBEDDING_FORMAT, *values)
+    
+    @classmethod
+    def unpack_embedding(cls, blob: bytes) -> List[float]:
+        """
+        Unpack a stored embedding BLOB into a vector.
+        
+        Args:
+            blob: Little-endian float16 bytes as stored in memory_embeddings.embedding
+            
+        Returns:
+            EMBEDDING_DIM floats
+        """
+        return list(struct.unpack(cls.EMBEDDING_FORMAT, blob))
+    
+    @classmethod
+    def _apply_pragmas(cls, conn: sqlite3.Connection, enable_foreign_keys: bool = True,
+                       read_only: bool = False) -> None:
+        """
+        Apply the standard PRAGMA bundle to a connection.
+        
+        Args:
+            conn: Open SQLite connection
+            enable_foreign_keys: Whether to enable foreign key constraints
+            read_only: Skip the journal mode switch and reject writes
+        """
+        for pragma_sql in cls.CONNECTION_PRAGMAS:
+            # journal_mode is persistent and can only be set by a writer
+            if read_only and "journal_mode" in pragma_sql:
+                continue
+            conn.execute(pragma_sql)
+        
+        if enable_foreign_keys:
+            conn.execute("PRAGMA foreign_keys = ON")
+        
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+    
+    @classmethod
+    def _connect(cls, db_path: str, isolation_level: Optional[str] = "IMMEDIATE",
+                 read_only: bool = False, **kwargs) -> sqlite3.Connection:
+        """
+        Open a connection through a URI with a private page cache.
+        
+        With the default isolation_level the sqlite3 module opens its implicit
+        transactions with BEGIN IMMEDIATE at the first write statement, so a
+        transaction never has to upgrade a read lock to a write lock.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            isolation_level: sqlite3 isolation level; None for autocommit
+            read_only: Open the file read-only
+            **kwargs: Further sqlite3.connect arguments
+            
+        Returns:
+            Open SQLite connection
+        """
+        uri = f"{Path(db_path).absolute().as_uri()}?cache=private"
+        if read_only:
+            uri += "&mode=ro"
+        return sqlite3.connect(uri, uri=True, isolation_level=isolation_level, timeout=5.0, **kwargs)
+    
+    @classmethod
+    def open_reader(cls, db_path: str) -> sqlite3.Connection:
+        """
+        Open a read-only connection for a reader pool.
+        
+        In WAL mode any number of readers run concurrently with the single
+        writer, so reader pools can be sized to the available cores.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            
+        Returns:
+            Read-only connection in autocommit mode
+        """
+        conn = cls._connect(
+            db_path,
+            isolation_level=None,
+            read_only=True,
+            check_same_thread=False,
+            cached_statements=cls.CACHED_STATEMENTS
+        )
+        cls._apply_pragmas(conn, read_only=True)
+        return conn
+    
+    @classmethod
+    def open_writer(cls, db_path: str) -> sqlite3.Connection:
+        """
+        Open the write connection for a database.
+        
+        SQLite allows a single writer at a time, so a writer pool MUST have a
+        maximum size of 1. The connection is in autocommit mode; callers wrap
+        writes in BEGIN IMMEDIATE ... COMMIT so the write lock is taken up
+        front instead of upgrading a read lock mid-transaction, which is what
+        produces SQLITE_BUSY deadlocks between writers.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            
+        Returns:
+            Read-write connection in autocommit mode
+        """
+        conn = cls._connect(
+            db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=cls.CACHED_STATEMENTS
+        )
+        cls._apply_pragmas(conn)
+        return conn
+    
+    @classmethod
+    def create_indexes_and_triggers(cls, conn: sqlite3.Connection) -> None:
+        """
+        Create indexes and triggers, and index any rows loaded without them.
+        
+        Building B-trees after the rows exist is considerably faster than
+        maintaining them per insert, so bulk loaders should populate the
+        tables first and call this once their inserts are committed.
+        
+        Args:
+            conn: Open SQLite connection
+        """
+        logger.info("Creating database indexes...")
+        for index_sql in cls.CREATE_INDEXES:
+            conn.execute(index_sql)
+        
+        # Rows inserted before the sync triggers existed are not in the FTS index yet
+        needs_fts_rebuild = not cls._fts_triggers_exist(conn)
+        
+        logger.info("Creating database triggers...")
+        for trigger_sql in cls.CREATE_TRIGGERS:
+            conn.execute(trigger_sql)
+        
+        if needs_fts_rebuild:
+            cls.rebuild_fts_tables(conn)
+    
+    @classmethod
+    def _fts_triggers_exist(cls, conn: sqlite3.Connection) -> bool:
+        """
+        Check whether memories writes are currently mirrored into the FTS index.
+        
+        Args:
+            conn: Open SQLite connection
+            
+        Returns:
+            True if the FTS sync triggers are installed
+        """
+        cursor = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'sync_memories_fts_insert'"
+        )
+        return cursor.fetchone() is not None
+    
+    @classmethod
+    def rebuild_fts_tables(cls, conn: sqlite3.Connection) -> None:
+        """
+        Rebuild both FTS indexes from the memories table.
+        
+        Args:
+            conn: Open SQLite connection
+        """
+        for rebuild_sql in cls.REBUILD_FTS_TABLES:
+            conn.execute(rebuild_sql)
+    
+    @classmethod
+    def bulk_insert_memories(cls, conn: sqlite3.Connection, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert many memories in one transaction with set-based FTS indexing.
+        
+        The per-row FTS insert trigger is dropped for the duration of the load
+        and the new rows are indexed with one INSERT ... SELECT per FTS table.
+        The connection must not already be inside a transaction.
+        
+        Args:
+            conn: Open SQLite connection
+            rows: Memory rows keyed by column name, with values as stored
+                (metadata already serialized); all rows must share the same keys.
+                An 'embedding' key is written to memory_embeddings.
+            
+        Returns:
+            Number of memories inserted
+        """
+        rows = [dict(row) for row in rows]
+        if not rows:
+            return 0
+        
+        embeddings = [
+            (row['memory_id'], row.pop('embedding'))
+            for row in rows if row.get('embedding') is not None
+        ]
+        for row in rows:
+            row.pop('embedding', None)
+        
+        columns = list(rows[0].keys())
+        insert_sql = (
+            f"INSERT INTO memories ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + column for column in columns)})"
+        )
+        
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("PRAGMA defer_foreign_keys = ON")
+            last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM memories").fetchone()[0]
+            
+            conn.execute("DROP TRIGGER IF EXISTS sync_memories_fts_insert")
+            inserted = conn.executemany(insert_sql, rows).rowcount
+            conn.executemany(
+                "INSERT INTO memory_embeddings (memory_id, embedding) VALUES (?, ?)", embeddings
+            )
+            for index_sql in cls.INDEX_NEW_FTS_ROWS:
+                conn.execute(index_sql, (last_id,))
+            
+            # Restores the dropped insert trigger; the others already exist
+            for trigger_sql in cls.CREATE_FTS_TRIGGERS:
+                conn.execute(trigger_sql)
+            
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        
+        logger.info(f"Bulk inserted {inserted} memories")
+        return inserted
+    
+    @classmethod
+    def optimize(cls, db_path: str) -> bool:
+        """
+        Run routine maintenance on a database.
+        
+        Refreshes query planner statistics, merges FTS index segments and
+        truncates the WAL. Schedule this externally (cron or a background
+        thread); it takes the write lock and must stay off the request path.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            
+        Returns:
+            True if maintenance successful, False otherwise
+        """
+        start_time = time.time()
+        conn = None
+        try:
+            conn = cls.open_writer(db_path)
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("ANALYZE")
+            conn.execute("PRAGMA optimize")
+            for optimize_sql in cls.OPTIMIZE_FTS_TABLES:
+                conn.execute(optimize_sql)
+            conn.execute("COMMIT")
+            
+            # Checkpointing cannot run inside a transaction
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            
+            logger.info(f"Optimized database {db_path} in {time.time() - start_time:.2f}s")
+            return True
+            
+        except sqlite3.Error as e:
+            if conn is not None and conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"Database optimization failed: {e}")
+            return False
+        finally:
+            if conn is not None:
+                conn.close()
+    
+    @classmethod
+    def optimize_fts_index(cls, db_path: str) -> bool:
+        """
+        Merge the FTS index segments of a database into one.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            
+        Returns:
+            True if optimization successful, False otherwise
+        """
+        conn = None
+        try:
+            conn = cls._connect(db_path)
+            for optimize_sql in cls.OPTIMIZE_FTS_TABLES:
+                conn.execute(optimize_sql)
+            conn.commit()
+            logger.info(f"Optimized FTS index for: {db_path}")
+            return True
+            
+        except sqlite3.Error as e:
+            logger.error(f"FTS index optimization failed: {e}")
+            return False
+        finally:
+            if conn is not None:
+                conn.close()
+    
+    @classmethod
+    def _get_schema_version(cls, conn: sqlite3.Connection) -> Optional[int]:
+        """
+        Get the current schema version of an open database.
+        
+        Args:
+            conn: Open SQLite connection
+            
+        Returns:
+            Highest applied schema version, or None if not recorded
+        """
+        cursor = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+        )
+        if cursor.fetchone() is None:
+            return None
+        return conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0]
+    
+    @classmethod
+    def _migrate(cls, conn: sqlite3.Connection, current_version: int, per_user: bool = False) -> None:
+        """
+        Upgrade an existing database from current_version to SCHEMA_VERSION.
+        
+        Foreign key enforcement is suspended while tables are rebuilt so that
+        dropping the old copy doesn't cascade into dependent rows.
+        
+        Args:
+            conn: Open SQLite connection
+            current_version: Schema version the database is at
+            per_user: Whether this is a per-user database
+        """
+        conn.commit()
+        foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        conn.execute("PRAGMA foreign_keys = OFF")
+        
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rebuild_tables = []
+            for version in range(current_version + 1, cls.SCHEMA_VERSION + 1):
+                logger.info(f"Migrating database schema to version {version}")
+                for migration_sql in cls.MIGRATIONS.get(version, []):
+                    conn.execute(migration_sql)
+                for table_name in cls.REBUILD_TABLES.get(version, []):
+                    if table_name not in rebuild_tables:
+                        rebuild_tables.append(table_name)
+                conn.execute(
+                    "INSERT OR IGNORE INTO schema_version (version, description) VALUES (?, ?)",
+                    (version, f"Migrated to schema version {version}")
+                )
+            
+            # Rebuilds use the current definitions, so they run after every
+            # statement that still expects the old table shapes
+            for table_name in rebuild_tables:
+                cls._rebuild_table(conn, table_name, per_user)
+            
+            # Recreate anything the migration steps dropped and reindex
+            schema = cls()
+            schema.create_fts_tables(conn)
+            if per_user:
+                needs_fts_rebuild = not cls._fts_triggers_exist(conn)
+                schema.create_indexes_without_user_id(conn)
+                schema.create_fts_triggers_per_user(conn)
+                if needs_fts_rebuild:
+                    cls.rebuild_fts_tables(conn)
+            else:
+                cls.create_indexes_and_triggers(conn)
+            
+            violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+            if violations:
+                logger.warning(f"Foreign key violations after migration: {len(violations)}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute(f"PRAGMA foreign_keys = {'ON' if foreign_keys else 'OFF'}")
+    
+    @classmethod
+    def _rebuild_table(cls, conn: sqlite3.Connection, table_name: str, per_user: bool = False) -> None:
+        """
+        Rebuild a table from its current definition, keeping its rows.
+        
+        Columns present in both the old and the new definition are copied;
+        indexes and triggers on the table are dropped and must be recreated.
+        
+        Args:
+            conn: Open SQLite connection
+            table_name: Table to rebuild
+            per_user: Whether to use the per-user table definition
+        """
+        tables = cls.CREATE_TABLES_PER_USER if per_user else cls.CREATE_TABLES
+        if table_name not in tables:
+            return
+        
+        new_table = f"{table_name}_new"
+        conn.execute(tables[table_name].replace(
+            f"IF NOT EXISTS {table_name} (", f"{new_table} ("
+        ))
+        
+        column_sql = "SELECT name FROM pragma_table_info(?)"
+        new_columns = {row[0] for row in conn.execute(column_sql, (new_table,))}
+        columns = ", ".join(
+            row[0] for row in conn.execute(column_sql, (table_name,))
+            if row[0] in new_columns
+        )
+        conn.execute(
+            f"INSERT INTO {new_table} ({columns}) SELECT {columns} FROM {table_name} ORDER BY rowid"
+        )
+        conn.execute(f"DROP TABLE {table_name}")
+        conn.execute(f"ALTER TABLE {new_table} RENAME TO {table_name}")
+    
     @classmethod
-    def initialize_database(cls, db_path: str, enable_foreign_keys: bool = True) -> bool:
+    def initialize_database(cls, db_path: str, enable_foreign_keys: bool = True,
+                            defer_indexes: bool = False) -> bool:
         """
         Initialize the database with complete schema.
         
         Args:
             db_path: Path to the SQLite database file
             enable_foreign_keys: Whether to enable foreign key constraints
+            defer_indexes: Skip index and trigger creation so a bulk import can
+                load rows first; the caller must then run create_indexes_and_triggers
             
         Returns:
             True if initialization successful, False otherwise
         """
+        conn = None
         try:
             # Ensure directory exists
             db_file = Path(db_path)
             db_file.parent.mkdir(parents=True, exist_ok=True)
             
             logger.info(f"Initializing database at: {db_path}")
+            is_new_file = not db_file.exists() or db_file.stat().st_size == 0
+            
+            conn = cls._connect(db_path, isolation_level=None)
+            # Must precede enabling WAL, which writes the database header
+            if is_new_file:
+                conn.execute(f"PRAGMA page_size = {cls.PAGE_SIZE}")
+            
+            # WAL, busy timeout, cache and foreign keys
+            cls._apply_pragmas(conn, enable_foreign_keys)
+            
+            # Upgrade an existing database before re-seeding it
+            current_version = cls._get_schema_version(conn)
+            if current_version is not None and current_version < cls.SCHEMA_VERSION:
+                cls._migrate(conn, current_version)
+            
+            if defer_indexes:
+                logger.info("Deferring index and trigger creation for bulk load")
+                script = cls._DDL_SCRIPT_DEFERRED
+            else:
+                script = cls._DDL_SCRIPT
+                # Rows written before the sync triggers existed are not in the FTS index yet
+                if not cls._fts_triggers_exist(conn):
+                    script = f"{script};\n{cls._REBUILD_FTS_SCRIPT}"
+            
+            # executescript() commits any open transaction, so the script
+            # takes the write lock itself rather than upgrading mid-transaction
+            logger.info("Creating tables, full-text search, default data, indexes and triggers...")
+            try:
+                conn.executescript(f"BEGIN IMMEDIATE;\n{script};\nCOMMIT;")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            
+            # Start with fresh planner statistics
+            conn.execute("PRAGMA optimize")
+            
+            # Fold the initialization writes back into the database file now
+            # rather than leaving them to whichever connection checkpoints next
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            
+            logger.info("Database initialization completed successfully")
+            return True
             
-            with sqlite3.connect(db_path) as conn:
-                # Enable foreign keys if requested
-                if enable_foreign_keys:
-                    conn.execute("PRAGMA foreign_keys = ON")
-                
-                # Enable WAL mode for better concurrency
-                conn.execute("PRAGMA journal_mode = WAL")
-                
-                # Set reasonable cache size (10MB)
-                conn.execute("PRAGMA cache_size = -10240")
-                
-                # Create all tables
-                logger.info("Creating database tables...")
-                for table_name, create_sql in cls.CREATE_TABLES.items():
-                    logger.debug(f"Creating table: {table_name}")
-                    conn.execute(create_sql)
-                
-                # Create FTS table
-                logger.info("Creating full-text search table...")
-                conn.execute(cls.CREATE_FTS_TABLE)
-                
-                # Create indexes
-                logger.info("Creating database indexes...")
-                for index_sql in cls.CREATE_INDEXES:
-                    conn.execute(index_sql)
-                
-                # Create triggers
-                logger.info("Creating database triggers...")
-                for trigger_sql in cls.CREATE_TRIGGERS:
-                    conn.execute(trigger_sql)
-                
-                # Insert default data
-                logger.info("Inserting default data...")
-                for data_sql in cls.DEFAULT_DATA:
-                    conn.execute(data_sql)
-                
-                conn.commit()
-                logger.info("Database initialization completed successfully")
-                return True
-                
         except sqlite3.Error as e:
             logger.error(f"Database initialization failed: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error during database initialization: {e}")
             return False
+        finally:
+            if conn is not None:
+                conn.close()
     
     @classmethod
     def validate_user_schema(cls, db_path: str) -> bool:
@@ -265,44 +879,43 @@ class DatabaseSchema:
         Returns:
             True if schema is valid, False otherwise
         """
+        conn = None
         try:
-            with sqlite3.connect(db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Check that all required tables exist (without users table)
-                cursor.execute("""
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                """)
-                tables = {row[0] for row in cursor.fetchall()}
-                
-                required_tables = set(cls.CREATE_TABLES_PER_USER.keys()) | {'memories_fts'}
-                missing_tables = required_tables - tables
-                
-                if missing_tables:
-                    logger.error(f"Missing required tables: {missing_tables}")
-                    return False
-                
-                # Check FTS5 table exists and is functional
-                cursor.execute("SELECT COUNT(*) FROM memories_fts LIMIT 1")
-                
-                # Check schema version
-                cursor.execute("SELECT MAX(version) FROM schema_version")
-                current_version = cursor.fetchone()[0]
-                
-                if current_version != cls.SCHEMA_VERSION:
-                    logger.warning(f"Schema version mismatch: {current_version} != {cls.SCHEMA_VERSION}")
-                    return False
-                
-                logger.info("Per-user database schema validation passed")
-                return True
-                
+            conn = cls._connect(db_path)
+            # Tables, schema version and an FTS5 probe in one round trip
+            checks = conn.execute(cls.VALIDATION_QUERY).fetchall()
+            tables = {value for check, value in checks if check == 'table'}
+            current_version = next(value for check, value in checks if check == 'version')
+            
+            # Upgrade databases from older releases, then validate the result
+            if current_version is not None and current_version < cls.SCHEMA_VERSION:
+                cls._migrate(conn, current_version, per_user=True)
+                return cls.validate_user_schema(db_path)
+            
+            if current_version != cls.SCHEMA_VERSION:
+                logger.warning(f"Schema version mismatch: {current_version} != {cls.SCHEMA_VERSION}")
+                return False
+            
+            # Check that all required tables exist (without users table)
+            required_tables = set(cls.CREATE_TABLES_PER_USER.keys()) | {'memories_fts', 'memories_fts_tri'}
+            missing_tables = required_tables - tables
+            
+            if missing_tables:
+                logger.error(f"Missing required tables: {missing_tables}")
+                return False
+            
+            logger.info("Per-user database schema validation passed")
+            return True
+            
         except sqlite3.Error as e:
             logger.error(f"Per-user schema validation failed: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error during per-user schema validation: {e}")
             return False
+        finally:
+            if conn is not None:
+                conn.close()
 
     @classmethod
     def test_user_fts_functionality(cls, db_path: str) -> bool:
@@ -315,42 +928,22 @@ class DatabaseSchema:
         Returns:
             True if FTS is functional, False otherwise
         """
+        conn = None
         try:
-            with sqlite3.connect(db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Insert test data
-                test_memory_id = "test_fts_memory"
-                cursor.execute("""
-                    INSERT OR REPLACE INTO memories 
-                    (memory_id, content, category) 
-                    VALUES (?, 'This is a test memory for FTS functionality', 'test')
-                """, (test_memory_id,))
-                
-                # Test FTS search
-                cursor.execute("""
-                    SELECT memory_id FROM memories_fts 
-                    WHERE memories_fts MATCH 'test'
-                """)
-                results = cursor.fetchall()
-                
-                # Clean up test data
-                cursor.execute("DELETE FROM memories WHERE memory_id = ?", (test_memory_id,))
-                conn.commit()
+            conn = cls._connect(db_path, isolation_level=None)
+            cls._check_fts_tables(conn)
+            logger.info("Per-user FTS5 functionality test passed")
+            return True
                 
-                if results:
-                    logger.info("Per-user FTS5 functionality test passed")
-                    return True
-                else:
-                    logger.error("Per-user FTS5 functionality test failed - no search results")
-                    return False
-                    
         except sqlite3.Error as e:
             logger.error(f"Per-user FTS functionality test failed: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error during per-user FTS test: {e}")
             return False
+        finally:
+            if conn is not None:
+                conn.close()
 
     @classmethod
     def validate_schema(cls, db_path: str) -> bool:
@@ -363,44 +956,43 @@ class DatabaseSchema:
         Returns:
             True if schema is valid, False otherwise
         """
+        conn = None
         try:
-            with sqlite3.connect(db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Check that all required tables exist
-                cursor.execute("""
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                """)
-                tables = {row[0] for row in cursor.fetchall()}
-                
-                required_tables = set(cls.CREATE_TABLES.keys()) | {'memories_fts'}
-                missing_tables = required_tables - tables
-                
-                if missing_tables:
-                    logger.error(f"Missing required tables: {missing_tables}")
-                    return False
-                
-                # Check FTS5 table exists and is functional
-                cursor.execute("SELECT COUNT(*) FROM memories_fts LIMIT 1")
-                
-                # Check schema version
-                cursor.execute("SELECT MAX(version) FROM schema_version")
-                current_version = cursor.fetchone()[0]
-                
-                if current_version != cls.SCHEMA_VERSION:
-                    logger.warning(f"Schema version mismatch: {current_version} != {cls.SCHEMA_VERSION}")
-                    return False
-                
-                logger.info("Database schema validation passed")
-                return True
-                
+            conn = cls._connect(db_path)
+            # Tables, schema version and an FTS5 probe in one round trip
+            checks = conn.execute(cls.VALIDATION_QUERY).fetchall()
+            tables = {value for check, value in checks if check == 'table'}
+            current_version = next(value for check, value in checks if check == 'version')
+            
+            # Upgrade databases from older releases, then validate the result
+            if current_version is not None and current_version < cls.SCHEMA_VERSION:
+                cls._migrate(conn, current_version)
+                return cls.validate_schema(db_path)
+            
+            if current_version != cls.SCHEMA_VERSION:
+                logger.warning(f"Schema version mismatch: {current_version} != {cls.SCHEMA_VERSION}")
+                return False
+            
+            # Check that all required tables exist
+            required_tables = set(cls.CREATE_TABLES.keys()) | {'memories_fts', 'memories_fts_tri'}
+            missing_tables = required_tables - tables
+            
+            if missing_tables:
+                logger.error(f"Missing required tables: {missing_tables}")
+                return False
+            
+            logger.info("Database schema validation passed")
+            return True
+            
         except sqlite3.Error as e:
             logger.error(f"Schema validation failed: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error during schema validation: {e}")
             return False
+        finally:
+            if conn is not None:
+                conn.close()
     
     @classmethod
     def get_table_info(cls, db_path: str, table_name: str) -> Optional[List[tuple]]:
@@ -414,20 +1006,29 @@ class DatabaseSchema:
         Returns:
             List of column information tuples, or None if error
         """
+        conn = None
         try:
-            with sqlite3.connect(db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f"PRAGMA table_info({table_name})")
-                return cursor.fetchall()
+            conn = cls._connect(db_path)
+            cursor = conn.cursor()
+            # Bound parameter: one cached statement for every table, no injection
+            cursor.execute(
+                'SELECT cid, name, type, "notnull", dflt_value, pk FROM pragma_table_info(?)',
+                (table_name,)
+            )
+            return cursor.fetchall()
         except sqlite3.Error as e:
             logger.error(f"Failed to get table info for {table_name}: {e}")
             return None
+        finally:
+            if conn is not None:
+                conn.close()
     
     # Per-user database schema (without user_id columns and foreign keys)
     CREATE_TABLES_PER_USER = {
         'memories': """
             CREATE TABLE IF NOT EXISTS memories (
-                memory_id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                memory_id TEXT NOT NULL UNIQUE,
                 content TEXT NOT NULL,
                 original_message TEXT,
                 category TEXT,
@@ -436,14 +1037,16 @@ class DatabaseSchema:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 metadata JSON,
-                embedding BLOB,
-                is_active BOOLEAN DEFAULT TRUE
+                deleted_at TIMESTAMP
             )
         """,
         
+        'memory_embeddings': CREATE_EMBEDDINGS_TABLE,
+        
         'memory_updates': """
             CREATE TABLE IF NOT EXISTS memory_updates (
-                update_id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                update_id TEXT NOT NULL UNIQUE,
                 memory_id TEXT NOT NULL,
                 previous_content TEXT,
                 new_content TEXT,
@@ -457,7 +1060,8 @@ class DatabaseSchema:
         
         'sessions': """
             CREATE TABLE IF NOT EXISTS sessions (
-                session_id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                session_id TEXT NOT NULL UNIQUE,
                 started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 ended_at TIMESTAMP,
                 message_count INTEGER DEFAULT 0,
@@ -468,7 +1072,8 @@ class DatabaseSchema:
         
         'categories': """
             CREATE TABLE IF NOT EXISTS categories (
-                category_id TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                category_id TEXT NOT NULL UNIQUE,
                 name TEXT NOT NULL,
                 description TEXT,
                 parent_category_id TEXT,
@@ -491,13 +1096,32 @@ class DatabaseSchema:
         "CREATE INDEX IF NOT EXISTS idx_memories_timestamp ON memories(timestamp)",
         "CREATE INDEX IF NOT EXISTS idx_memories_category ON memories(category)",
         "CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at)",
-        "CREATE INDEX IF NOT EXISTS idx_memories_is_active ON memories(is_active)",
+        # Partial indexes serving the active-memory listing, newest first, with
+        # and without a category filter
+        "CREATE INDEX IF NOT EXISTS idx_memories_active ON memories(created_at DESC) WHERE deleted_at IS NULL",
+        "CREATE INDEX IF NOT EXISTS idx_memories_category_active ON memories(category, created_at DESC) WHERE deleted_at IS NULL",
         "CREATE INDEX IF NOT EXISTS idx_memory_updates_memory_id ON memory_updates(memory_id)",
         "CREATE INDEX IF NOT EXISTS idx_memory_updates_updated_at ON memory_updates(updated_at)",
         "CREATE INDEX IF NOT EXISTS idx_sessions_started_at ON sessions(started_at)",
         "CREATE INDEX IF NOT EXISTS idx_categories_parent ON categories(parent_category_id)"
     ]
     
+    # Default data for per-user databases
+    DEFAULT_DATA_PER_USER = [
+        DEFAULT_DATA[0],
+        
+        f"""
+        INSERT OR IGNORE INTO schema_version (version, description) VALUES
+        ({SCHEMA_VERSION}, 'Per-user database schema with FTS5 search')
+        """
+    ]
+    
+    # Per-user initialization script, joined once at class load
+    _USER_DDL_SCRIPT = ";\n".join(
+        list(CREATE_TABLES_PER_USER.values()) + [CREATE_FTS_TABLE, CREATE_FTS_TRIGRAM_TABLE]
+        + DEFAULT_DATA_PER_USER + CREATE_INDEXES_PER_USER + CREATE_FTS_TRIGGERS + CREATE_AUDIT_TRIGGERS
+    )
+    
     def create_tables_without_user_id(self, conn):
         """Create tables for per-user database (without user_id columns)."""
         for table_name, create_sql in self.CREATE_TABLES_PER_USER.items():
@@ -512,6 +1136,7 @@ class DatabaseSchema:
     def create_fts_tables(self, conn):
         """Create FTS virtual tables."""
         conn.execute(self.CREATE_FTS_TABLE)
+        conn.execute(self.CREATE_FTS_TRIGRAM_TABLE)
     
     def create_fts_triggers(self, conn):
         """Create FTS synchronization triggers."""
@@ -519,50 +1144,8 @@ class DatabaseSchema:
             conn.execute(trigger_sql)
     
     def create_fts_triggers_per_user(self, conn):
-        """Create FTS synchronization triggers for per-user databases (without user table triggers)."""
-        # Only create FTS-related triggers, skip user table triggers
-        fts_triggers = [
-            """
-            CREATE TRIGGER IF NOT EXISTS update_memories_timestamp
-            AFTER UPDATE ON memories
-            FOR EACH ROW
-            BEGIN
-                UPDATE memories SET updated_at = CURRENT_TIMESTAMP WHERE memory_id = NEW.memory_id;
-            END
-            """,
-            
-            """
-            CREATE TRIGGER IF NOT EXISTS sync_memories_fts_insert
-            AFTER INSERT ON memories
-            FOR EACH ROW
-            BEGIN
-                INSERT INTO memories_fts(memory_id, content, category)
-                VALUES(NEW.memory_id, NEW.content, COALESCE(NEW.category, ''));
-            END
-            """,
-            
-            """
-            CREATE TRIGGER IF NOT EXISTS sync_memories_fts_update
-            AFTER UPDATE ON memories
-            FOR EACH ROW
-            BEGIN
-                UPDATE memories_fts
-                SET content = NEW.content, category = COALESCE(NEW.category, '')
-                WHERE memory_id = NEW.memory_id;
-            END
-            """,
-            
-            """
-            CREATE TRIGGER IF NOT EXISTS sync_memories_fts_delete
-            AFTER DELETE ON memories
-            FOR EACH ROW
-            BEGIN
-                DELETE FROM memories_fts WHERE memory_id = OLD.memory_id;
-            END
-            """
-        ]
-        
-        for trigger_sql in fts_triggers:
+        """Create FTS synchronization and audit triggers for per-user databases (without user table triggers)."""
+        for trigger_sql in self.CREATE_FTS_TRIGGERS + self.CREATE_AUDIT_TRIGGERS:
             conn.execute(trigger_sql)
     
     @classmethod
@@ -576,72 +1159,88 @@ class DatabaseSchema:
         Returns:
             True if initialization successful, False otherwise
         """
+        conn = None
         try:
             # Ensure directory exists
             db_file = Path(db_path)
             db_file.parent.mkdir(parents=True, exist_ok=True)
             
             logger.info(f"Initializing user database at: {db_path}")
+            is_new_file = not db_file.exists() or db_file.stat().st_size == 0
+            
+            conn = cls._connect(db_path, isolation_level=None)
+            # Must precede enabling WAL, which writes the database header
+            if is_new_file:
+                conn.execute(f"PRAGMA page_size = {cls.PAGE_SIZE}")
+            
+            # WAL, busy timeout, cache and foreign keys
+            cls._apply_pragmas(conn)
+            
+            # Smaller cache (5MB) for per-user DBs
+            conn.execute("PRAGMA cache_size = -5120")
+            
+            # Upgrade an existing database before re-seeding it
+            current_version = cls._get_schema_version(conn)
+            if current_version is not None and current_version < cls.SCHEMA_VERSION:
+                cls._migrate(conn, current_version, per_user=True)
+            
+            script = cls._USER_DDL_SCRIPT
+            if not cls._fts_triggers_exist(conn):
+                script = f"{script};\n{cls._REBUILD_FTS_SCRIPT}"
+            
+            # executescript() commits any open transaction, so the script
+            # takes the write lock itself rather than upgrading mid-transaction
+            logger.info("Creating tables, full-text search, default data, indexes and triggers...")
+            try:
+                conn.executescript(f"BEGIN IMMEDIATE;\n{script};\nCOMMIT;")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            
+            # Start with fresh planner statistics
+            conn.execute("PRAGMA optimize")
+            
+            # Fold the initialization writes back into the database file now
+            # rather than leaving them to whichever connection checkpoints next
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            
+            logger.info("User database initialization completed successfully")
+            return True
             
-            with sqlite3.connect(db_path) as conn:
-                # Enable foreign keys
-                conn.execute("PRAGMA foreign_keys = ON")
-                
-                # Enable WAL mode for better concurrency
-                conn.execute("PRAGMA journal_mode = WAL")
-                
-                # Set reasonable cache size (5MB for smaller per-user DBs)
-                conn.execute("PRAGMA cache_size = -5120")
-                
-                # Create schema instance for instance methods
-                schema = cls()
-                
-                # Create all tables
-                logger.info("Creating database tables...")
-                schema.create_tables_without_user_id(conn)
-                
-                # Create FTS table
-                logger.info("Creating full-text search table...")
-                schema.create_fts_tables(conn)
-                
-                # Create indexes
-                logger.info("Creating database indexes...")
-                schema.create_indexes_without_user_id(conn)
-                
-                # Create triggers
-                logger.info("Creating database triggers...")
-                schema.create_fts_triggers_per_user(conn)
-                
-                # Insert default categories
-                logger.info("Inserting default data...")
-                conn.execute("""
-                    INSERT OR IGNORE INTO categories (category_id, name, description) VALUES
-                    ('personal', 'Personal', 'Personal information and preferences'),
-                    ('work', 'Work', 'Work-related information and tasks'),
-                    ('relationships', 'Relationships', 'Information about people and relationships'),
-                    ('preferences', 'Preferences', 'User preferences and settings'),
-                    ('events', 'Events', 'Scheduled events and appointments'),
-                    ('facts', 'Facts', 'General facts and knowledge'),
-                    ('other', 'Other', 'Uncategorized memories')
-                """)
-                
-                # Insert schema version
-                conn.execute(f"""
-                    INSERT OR IGNORE INTO schema_version (version, description) VALUES
-                    ({cls.SCHEMA_VERSION}, 'Per-user database schema with FTS5 search')
-                """)
-                
-                conn.commit()
-                logger.info("User database initialization completed successfully")
-                return True
-                
         except sqlite3.Error as e:
             logger.error(f"User database initialization failed: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error during user database initialization: {e}")
             return False
+        finally:
+            if conn is not None:
+                conn.close()
 
+    @classmethod
+    def _check_fts_tables(cls, conn: sqlite3.Connection) -> None:
+        """
+        Check both FTS indexes without writing to the database.
+        
+        Args:
+            conn: Open SQLite connection in autocommit mode
+            
+        Raises:
+            sqlite3.Error: If an index is corrupt or cannot be queried
+        """
+        # FTS5's own consistency check; raises if the index is corrupt
+        conn.execute("INSERT INTO memories_fts(memories_fts) VALUES('integrity-check')")
+        conn.execute("INSERT INTO memories_fts_tri(memories_fts_tri) VALUES('integrity-check')")
+        
+        # Confirm the MATCH query path compiles and runs
+        conn.execute(
+            "SELECT 1 FROM memories_fts WHERE memories_fts MATCH ? LIMIT 1", ("nonexistent_token",)
+        ).fetchall()
+        conn.execute(
+            "SELECT 1 FROM memories_fts_tri WHERE memories_fts_tri MATCH ? LIMIT 1", ("nonexistent_token",)
+        ).fetchall()
+    
     @classmethod
     def test_fts_functionality(cls, db_path: str) -> bool:
         """
@@ -653,39 +1252,19 @@ class DatabaseSchema:
         Returns:
             True if FTS is functional, False otherwise
         """
+        conn = None
         try:
-            with sqlite3.connect(db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Insert test data
-                test_memory_id = "test_fts_memory"
-                cursor.execute("""
-                    INSERT OR REPLACE INTO memories 
-                    (memory_id, user_id, content, category) 
-                    VALUES (?, 'test_user', 'This is a test memory for FTS functionality', 'test')
-                """, (test_memory_id,))
-                
-                # Test FTS search
-                cursor.execute("""
-                    SELECT memory_id FROM memories_fts 
-                    WHERE memories_fts MATCH 'test'
-                """)
-                results = cursor.fetchall()
+            conn = cls._connect(db_path, isolation_level=None)
+            cls._check_fts_tables(conn)
+            logger.info("FTS5 functionality test passed")
+            return True
                 
-                # Clean up test data
-                cursor.execute("DELETE FROM memories WHERE memory_id = ?", (test_memory_id,))
-                conn.commit()
-                
-                if results:
-                    logger.info("FTS5 functionality test passed")
-                    return True
-                else:
-                    logger.error("FTS5 functionality test failed - no search results")
-                    return False
-                    
         except sqlite3.Error as e:
             logger.error(f"FTS functionality test failed: {e}")
             return False
         except Exception as e:
             logger.error(f"Unexpected error during FTS test: {e}")
-            return False
\ No newline at end of file
+            return False
+        finally:
+            if conn is not None:
+                conn.close()
\ No newline at end of file
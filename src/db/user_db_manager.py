@@ -2,17 +2,159 @@
 User-specific database manager that adapts the original DatabaseManager
 interface for per-user databases (without user_id parameters).
 """
-import uuid
-import json
-from typing import Dict, List, Optional, Any
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 from contextlib import contextmanager
+from functools import lru_cache
 
 from core.logging import get_logger
-from .manager import DatabaseManager, DatabaseError
+from .manager import (
+    DatabaseManager, DatabaseError, build_update_statements, dump_json, load_json,
+    sql_timestamp
+)
 
 logger = get_logger(__name__)
 
+# FTS5 query cleanup: ISO timestamps, characters FTS5 treats as syntax, runs of whitespace
+_TIMESTAMP_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[\.\d]*')
+_FTS_PUNCTUATION_PATTERN = re.compile(r'[<>()"\'-]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Optional memory filters, in the order their parameters are bound
+MEMORY_FILTERS = (
+    ('active', "deleted_at IS NULL"),
+    ('category', "category = ?"),
+    ('from_date', "created_at >= ?"),
+    ('to_date', "created_at <= ?"),
+    ('min_confidence', "confidence_score >= ?"),
+    ('max_confidence', "confidence_score <= ?"),
+)
+
+MEMORY_COLUMNS = """memory_id, content, original_message, category,
+                   confidence_score, timestamp, created_at, updated_at,
+                   metadata, deleted_at IS NULL AS is_active"""
+
+SORT_COLUMNS = ('created_at', 'updated_at', 'timestamp', 'confidence_score')
+
+
+def _fts_phrase(text: str) -> str:
+    """Quote text as an FTS5 string, so it is matched literally."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _memory_from_row(row: tuple) -> Dict[str, Any]:
+    """Build a memory dict from a plain-tuple row in MEMORY_COLUMNS order."""
+    (memory_id, content, original_message, category,
+     confidence_score, timestamp, created_at, updated_at,
+     metadata, is_active) = row
+    return {
+        'memory_id': memory_id,
+        'content': content,
+        'original_message': original_message,
+        'category': category,
+        'confidence_score': confidence_score,
+        'timestamp': datetime.fromisoformat(timestamp) if timestamp else None,
+        'created_at': created_at,
+        'updated_at': updated_at,
+        'metadata': load_json(metadata) if metadata else {},
+        'is_active': bool(is_active)
+    }
+
+
+def _filter_params(values: Dict[str, Any]) -> Tuple[frozenset, List[Any]]:
+    """
+    Split filter values into the set of active filters and their parameters.
+    
+    Args:
+        values: Filter name to bound value; None leaves the filter off and
+            True enables a filter that takes no parameter
+            
+    Returns:
+        Tuple of (active filter names, parameters in MEMORY_FILTERS order)
+    """
+    active = frozenset(name for name, value in values.items() if value is not None)
+    params = [
+        values[name] for name, _ in MEMORY_FILTERS
+        if name in active and values[name] is not True
+    ]
+    return active, params
+
+
+def _listing_filters(category: Optional[str], from_date: Optional[datetime],
+                     to_date: Optional[datetime], min_confidence: Optional[float],
+                     max_confidence: Optional[float], include_inactive: bool) -> Tuple[frozenset, List[Any]]:
+    """Resolve the list/count filter arguments into active filters and parameters."""
+    return _filter_params({
+        'active': None if include_inactive else True,
+        'category': category or None,
+        'from_date': sql_timestamp(from_date) if from_date else None,
+        'to_date': sql_timestamp(to_date) if to_date else None,
+        'min_confidence': min_confidence,
+        'max_confidence': max_confidence
+    })
+
+
+def _order_by(sort_by: str, sort_order: str) -> str:
+    """Build a whitelisted ORDER BY term, defaulting to newest first."""
+    if sort_by in SORT_COLUMNS:
+        order = "DESC" if sort_order.lower() == "desc" else "ASC"
+        return f"{sort_by} {order}"
+    return "created_at DESC"
+
+
+@lru_cache(maxsize=None)
+def _where_clause(filters: frozenset, prefix: str = '') -> str:
+    """Build the AND-joined WHERE conditions for a set of active filters."""
+    conditions = [f"{prefix}{clause}" for name, clause in MEMORY_FILTERS if name in filters]
+    return ' AND '.join(conditions) or '1=1'
+
+
+@lru_cache(maxsize=None)
+def _list_memories_sql(filters: frozenset, order_by: str, with_total: bool = False) -> str:
+    """
+    Build the list_memories query for a filter set and sort order.
+    
+    With with_total, every row also carries the size of the whole filtered
+    set as a trailing column, computed in the same pass over the rows.
+    """
+    total = ", COUNT(*) OVER () AS total" if with_total else ""
+    return f"""
+        SELECT {MEMORY_COLUMNS}{total}
+        FROM memories 
+        WHERE {_where_clause(filters)}
+        ORDER BY {order_by}
+        LIMIT ? OFFSET ?
+    """
+
+
+@lru_cache(maxsize=None)
+def _count_memories_sql(filters: frozenset) -> str:
+    """Build the count_memories query for a filter set."""
+    return f"SELECT COUNT(*) FROM memories WHERE {_where_clause(filters)}"
+
+
+@lru_cache(maxsize=None)
+def _search_memories_sql(filters: frozenset, full_text: bool) -> str:
+    """Build the FTS5 or LIKE-fallback search query for a filter set."""
+    if full_text:
+        return f"""
+            SELECT m.memory_id, m.content, m.original_message, m.category,
+                   m.confidence_score, m.timestamp, m.created_at, m.updated_at,
+                   m.metadata, m.deleted_at IS NULL AS is_active
+            FROM memories m
+            JOIN memories_fts fts ON fts.rowid = m.id
+            WHERE memories_fts MATCH ? AND {_where_clause(filters, 'm.')}
+            ORDER BY rank LIMIT ? OFFSET ?
+        """
+    return f"""
+        SELECT {MEMORY_COLUMNS}
+        FROM memories
+        WHERE content LIKE ? AND {_where_clause(filters)}
+        ORDER BY confidence_score DESC LIMIT ? OFFSET ?
+    """
+
 
 class UserDatabaseManager:
     """
@@ -22,6 +164,12 @@ class UserDatabaseManager:
     to work with per-user databases where user_id columns don't exist.
     """
     
+    # Columns update_session can change, in SET-clause order
+    SESSION_UPDATE_FIELDS = ('ended_at', 'message_count', 'memories_created', 'metadata')
+    UPDATE_SESSION_SQL = build_update_statements(
+        'sessions', SESSION_UPDATE_FIELDS, where="session_id = ?"
+    )
+    
     def __init__(self, db_manager: DatabaseManager):
         """
         Initialize with a DatabaseManager instance.
@@ -49,13 +197,15 @@ class UserDatabaseManager:
                 conn.execute("""
                     INSERT INTO memories 
                     (memory_id, content, original_message, category, 
-                     confidence_score, timestamp, metadata, embedding)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                     confidence_score, timestamp, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, (
                     memory_id, content, original_message, category,
                     confidence_score, timestamp.isoformat() if timestamp else None,
-                    json.dumps(metadata) if metadata else None, embedding
+                    dump_json(metadata) if metadata else None
                 ))
+                if embedding is not None:
+                    conn.execute(DatabaseManager.INSERT_EMBEDDING_SQL, (memory_id, embedding))
                 return True
         
         try:
@@ -66,16 +216,70 @@ class UserDatabaseManager:
                 return False
             raise
     
-    def get_memory(self, memory_id: str) -> Optional[Dict[str, Any]]:
-        """Get memory by ID."""
+    def create_memories_bulk(self, memories: List[Dict[str, Any]]) -> int:
+        """
+        Create many memories in a single write transaction.
+        
+        Args:
+            memories: Memory dicts with the create_memory arguments as keys;
+                memory_id and content are required
+                
+        Returns:
+            Number of memories inserted; existing memory_ids are skipped
+        """
+        rows = [
+            (
+                memory['memory_id'], memory['content'], memory.get('original_message'),
+                memory.get('category'), memory.get('confidence_score'),
+                memory['timestamp'].isoformat() if memory.get('timestamp') else None,
+                dump_json(memory['metadata']) if memory.get('metadata') else None
+            )
+            for memory in memories
+        ]
+        if not rows:
+            return 0
+        
+        embeddings = [
+            (memory['memory_id'], memory['embedding'])
+            for memory in memories if memory.get('embedding') is not None
+        ]
+        
+        def _create():
+            with self.transaction() as conn:
+                # Duplicates skipped by OR IGNORE must not pick up this batch's embeddings
+                existing = DatabaseManager.existing_memory_ids(conn, [row[0] for row in embeddings])
+                cursor = conn.executemany("""
+                    INSERT OR IGNORE INTO memories 
+                    (memory_id, content, original_message, category, 
+                     confidence_score, timestamp, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                conn.executemany(DatabaseManager.INSERT_EMBEDDING_SQL, [
+                    row for row in embeddings if row[0] not in existing
+                ])
+                return cursor.rowcount
+        
+        return self.db_manager._retry_on_locked(_create)
+    
+    def get_memory(self, memory_id: str, include_embedding: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get memory by ID.
+        
+        Args:
+            memory_id: Memory identifier
+            include_embedding: Whether to read the embedding from memory_embeddings;
+                when False the returned 'embedding' is None
+        """
         def _get():
             with self.transaction(read_only=True) as conn:
                 cursor = conn.execute("""
-                    SELECT memory_id, content, original_message, category,
-                           confidence_score, timestamp, created_at, updated_at,
-                           metadata, embedding, is_active
-                    FROM memories WHERE memory_id = ? AND is_active = TRUE
-                """, (memory_id,))
+                    SELECT m.memory_id, m.content, m.original_message, m.category,
+                           m.confidence_score, m.timestamp, m.created_at, m.updated_at,
+                           m.metadata, e.embedding, m.deleted_at IS NULL AS is_active
+                    FROM memories m
+                    LEFT JOIN memory_embeddings e ON e.memory_id = m.memory_id AND ?
+                    WHERE m.memory_id = ? AND m.deleted_at IS NULL
+                """, (include_embedding, memory_id))
                 row = cursor.fetchone()
                 
                 if row:
@@ -88,7 +292,7 @@ class UserDatabaseManager:
                         'timestamp': datetime.fromisoformat(row['timestamp']) if row['timestamp'] else None,
                         'created_at': row['created_at'],
                         'updated_at': row['updated_at'],
-                        'metadata': json.loads(row['metadata']) if row['metadata'] else {},
+                        'metadata': load_json(row['metadata']) if row['metadata'] else {},
                         'embedding': row['embedding'],
                         'is_active': bool(row['is_active'])
                     }
@@ -102,48 +306,27 @@ class UserDatabaseManager:
         """Update memory content and metadata."""
         def _update():
             with self.transaction() as conn:
-                # First get current content for audit
-                cursor = conn.execute("SELECT content FROM memories WHERE memory_id = ?", (memory_id,))
-                current = cursor.fetchone()
-                if not current:
-                    return False
-                
-                previous_content = current['content']
-                
                 # Update memory
-                update_fields = []
-                params = []
-                
-                if content is not None:
-                    update_fields.append("content = ?")
-                    params.append(content)
-                if category is not None:
-                    update_fields.append("category = ?")
-                    params.append(category)
-                if confidence_score is not None:
-                    update_fields.append("confidence_score = ?")
-                    params.append(confidence_score)
-                if metadata is not None:
-                    update_fields.append("metadata = ?")
-                    params.append(json.dumps(metadata))
-                
-                if not update_fields:
-                    return True  # Nothing to update
-                
+                values = {
+                    'content': content,
+                    'category': category,
+                    'confidence_score': confidence_score,
+                    'metadata': dump_json(metadata) if metadata is not None else None
+                }
+                fields = frozenset(field for field, value in values.items() if value is not None)
+                
+                if not fields:
+                    # Nothing to update
+                    cursor = conn.execute("SELECT 1 FROM memories WHERE memory_id = ?", (memory_id,))
+                    return cursor.fetchone() is not None
+                
+                # Content edits are recorded in memory_updates by the
+                # audit_memories_content_update trigger
+                sql, field_order = DatabaseManager.UPDATE_MEMORY_SQL[fields]
+                params = [values[field] for field in field_order]
                 params.append(memory_id)
                 
-                cursor = conn.execute(f"""
-                    UPDATE memories SET {', '.join(update_fields)}
-                    WHERE memory_id = ? AND is_active = TRUE
-                """, params)
-                
-                if cursor.rowcount > 0 and content is not None:
-                    # Create audit record
-                    conn.execute("""
-                        INSERT INTO memory_updates 
-                        (update_id, memory_id, previous_content, new_content, update_type, updated_by)
-                        VALUES (?, ?, ?, ?, 'update', 'system')
-                    """, (str(uuid.uuid4()), memory_id, previous_content, content))
+                cursor = conn.execute(sql, params)
                 
                 return cursor.rowcount > 0
         
@@ -155,8 +338,8 @@ class UserDatabaseManager:
             with self.transaction() as conn:
                 if soft_delete:
                     cursor = conn.execute("""
-                        UPDATE memories SET is_active = FALSE 
-                        WHERE memory_id = ? AND is_active = TRUE
+                        UPDATE memories SET deleted_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                        WHERE memory_id = ? AND deleted_at IS NULL
                     """, (memory_id,))
                 else:
                     cursor = conn.execute("DELETE FROM memories WHERE memory_id = ?", (memory_id,))
@@ -174,71 +357,101 @@ class UserDatabaseManager:
         """List memories with advanced filtering options."""
         def _list():
             with self.transaction(read_only=True) as conn:
-                query = """
-                    SELECT memory_id, content, original_message, category,
-                           confidence_score, timestamp, created_at, updated_at,
-                           metadata, is_active
-                    FROM memories 
-                    WHERE 1=1
-                """
-                params = []
-                
-                # Active/inactive filter
-                if not include_inactive:
-                    query += " AND is_active = TRUE"
-                
-                # Category filter
-                if category:
-                    query += " AND category = ?"
-                    params.append(category)
-                
-                # Date range filters
-                if from_date:
-                    query += " AND created_at >= ?"
-                    params.append(from_date.isoformat())
-                
-                if to_date:
-                    query += " AND created_at <= ?"
-                    params.append(to_date.isoformat())
+                filters, params = _listing_filters(
+                    category, from_date, to_date, min_confidence, max_confidence, include_inactive
+                )
                 
-                # Confidence filters
-                if min_confidence is not None:
-                    query += " AND confidence_score >= ?"
-                    params.append(min_confidence)
+                # Sorting and pagination
+                query = _list_memories_sql(filters, _order_by(sort_by, sort_order))
+                params.extend([limit, offset])
                 
-                if max_confidence is not None:
-                    query += " AND confidence_score <= ?"
-                    params.append(max_confidence)
+                # Plain tuples, unpacked positionally instead of through sqlite3.Row
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(query, params)
+                memories = [_memory_from_row(row) for row in cursor]
                 
-                # Sorting
-                if sort_by in ['created_at', 'updated_at', 'timestamp', 'confidence_score']:
-                    order = "DESC" if sort_order.lower() == "desc" else "ASC"
-                    query += f" ORDER BY {sort_by} {order}"
-                else:
-                    query += " ORDER BY created_at DESC"
+                return memories
+        
+        return self.db_manager._retry_on_locked(_list)
+    
+    def iter_memories(self, category: Optional[str] = None,
+                      sort_by: str = "created_at", sort_order: str = "desc",
+                      from_date: Optional[datetime] = None, to_date: Optional[datetime] = None,
+                      min_confidence: Optional[float] = None, max_confidence: Optional[float] = None,
+                      include_inactive: bool = False, batch_size: int = 256) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every matching memory, fetching rows in batches.
+        
+        Takes the same filters as list_memories, without pagination. One
+        read transaction and its pooled connection are held until the
+        iterator is exhausted or closed.
+        
+        Args:
+            batch_size: Rows fetched from SQLite per batch
+            
+        Yields:
+            Memory dicts in the requested order
+        """
+        filters, params = _listing_filters(
+            category, from_date, to_date, min_confidence, max_confidence, include_inactive
+        )
+        query = _list_memories_sql(filters, _order_by(sort_by, sort_order))
+        params.extend([-1, 0])  # LIMIT -1: no limit
+        
+        with self.transaction(read_only=True) as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                for row in batch:
+                    yield _memory_from_row(row)
+    
+    def list_memories_with_total(self, category: Optional[str] = None, 
+                                 limit: int = 100, offset: int = 0, 
+                                 sort_by: str = "created_at", sort_order: str = "desc",
+                                 from_date: Optional[datetime] = None, to_date: Optional[datetime] = None,
+                                 min_confidence: Optional[float] = None,
+                                 max_confidence: Optional[float] = None,
+                                 include_inactive: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        List one page of memories together with the total matching count.
+        
+        Replaces a list_memories + count_memories pair with one query, for
+        paginated listings. Takes the same filters as list_memories.
+        
+        Returns:
+            Tuple of (memories on the requested page, total matching memories)
+        """
+        def _list():
+            with self.transaction(read_only=True) as conn:
+                filters, params = _listing_filters(
+                    category, from_date, to_date, min_confidence, max_confidence, include_inactive
+                )
+                count_params = list(params)
                 
-                # Pagination
-                query += " LIMIT ? OFFSET ?"
+                # Sorting and pagination
+                query = _list_memories_sql(filters, _order_by(sort_by, sort_order), True)
                 params.extend([limit, offset])
                 
-                cursor = conn.execute(query, params)
-                memories = []
-                
-                for row in cursor.fetchall():
-                    memories.append({
-                        'memory_id': row['memory_id'],
-                        'content': row['content'],
-                        'original_message': row['original_message'],
-                        'category': row['category'],
-                        'confidence_score': row['confidence_score'],
-                        'timestamp': datetime.fromisoformat(row['timestamp']) if row['timestamp'] else None,
-                        'created_at': row['created_at'],
-                        'updated_at': row['updated_at'],
-                        'metadata': json.loads(row['metadata']) if row['metadata'] else {},
-                        'is_active': bool(row['is_active'])
-                    })
+                # Plain tuples; the windowed total is the trailing column
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                
+                if rows:
+                    total = rows[0][-1]
+                elif offset > 0:
+                    # A page past the end has no row to carry the total
+                    total = conn.execute(_count_memories_sql(filters), count_params).fetchone()[0]
+                else:
+                    total = 0
                 
-                return memories
+                return [_memory_from_row(row[:-1]) for row in rows], total
         
         return self.db_manager._retry_on_locked(_list)
     
@@ -249,35 +462,10 @@ class UserDatabaseManager:
         """Count memories with filtering options."""
         def _count():
             with self.transaction(read_only=True) as conn:
-                query = "SELECT COUNT(*) FROM memories WHERE 1=1"
-                params = []
-                
-                # Active/inactive filter
-                if not include_inactive:
-                    query += " AND is_active = TRUE"
-                
-                # Category filter
-                if category:
-                    query += " AND category = ?"
-                    params.append(category)
-                
-                # Date range filters
-                if from_date:
-                    query += " AND created_at >= ?"
-                    params.append(from_date.isoformat())
-                
-                if to_date:
-                    query += " AND created_at <= ?"
-                    params.append(to_date.isoformat())
-                
-                # Confidence filters
-                if min_confidence is not None:
-                    query += " AND confidence_score >= ?"
-                    params.append(min_confidence)
-                
-                if max_confidence is not None:
-                    query += " AND confidence_score <= ?"
-                    params.append(max_confidence)
+                filters, params = _listing_filters(
+                    category, from_date, to_date, min_confidence, max_confidence, include_inactive
+                )
+                query = _count_memories_sql(filters)
                 
                 cursor = conn.execute(query, params)
                 return cursor.fetchone()[0]
@@ -290,75 +478,36 @@ class UserDatabaseManager:
         def _search():
             with self.transaction(read_only=True) as conn:
                 # Clean query for FTS5 - remove problematic characters
-                import re
-                clean_query = re.sub(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}[\.\d]*', '', query)
-                clean_query = re.sub(r'[<>()"\'-]', ' ', clean_query)
-                clean_query = ' '.join(clean_query.split())  # Normalize whitespace
+                clean_query = _TIMESTAMP_PATTERN.sub('', query)
+                clean_query = _FTS_PUNCTUATION_PATTERN.sub(' ', clean_query)
+                clean_query = _WHITESPACE_PATTERN.sub(' ', clean_query).strip()  # Normalize whitespace
+                
+                filters, filter_params = _filter_params({
+                    'active': True,
+                    'category': category or None,
+                    'min_confidence': min_confidence
+                })
                 
                 if not clean_query or len(clean_query) < 2:
                     # If query is too short after cleaning, use simple LIKE search
-                    search_query = """
-                        SELECT memory_id, content, original_message, category,
-                               confidence_score, timestamp, created_at, updated_at,
-                               metadata, is_active
-                        FROM memories
-                        WHERE is_active = TRUE AND content LIKE ?
-                    """
+                    search_query = _search_memories_sql(filters, False)
                     params = [f'%{query[:20]}%']
-                    
-                    # Add category filter
-                    if category:
-                        search_query += " AND category = ?"
-                        params.append(category)
-                    
-                    # Add confidence filter
-                    if min_confidence is not None:
-                        search_query += " AND confidence_score >= ?"
-                        params.append(min_confidence)
-                    
-                    search_query += " ORDER BY confidence_score DESC LIMIT ? OFFSET ?"
-                    params.extend([limit, offset])
-                    
                 else:
-                    search_query = """
-                        SELECT m.memory_id, m.content, m.original_message, m.category,
-                               m.confidence_score, m.timestamp, m.created_at, m.updated_at,
-                               m.metadata, m.is_active
-                        FROM memories m
-                        JOIN memories_fts fts ON m.memory_id = fts.memory_id
-                        WHERE m.is_active = TRUE AND memories_fts MATCH ?
-                    """
-                    params = [clean_query]
-                    
-                    # Add category filter
+                    search_query = _search_memories_sql(filters, True)
                     if category:
-                        search_query += " AND m.category = ?"
-                        params.append(category)
-                    
-                    # Add confidence filter
-                    if min_confidence is not None:
-                        search_query += " AND m.confidence_score >= ?"
-                        params.append(min_confidence)
-                    
-                    search_query += " ORDER BY rank LIMIT ? OFFSET ?"
-                    params.extend([limit, offset])
+                        # Let FTS5 prune on its indexed category column before the
+                        # join; the exact m.category filter still applies afterwards
+                        clean_query = f"category : {_fts_phrase(category)} AND ({clean_query})"
+                    params = [clean_query]
                 
-                cursor = conn.execute(search_query, params)
-                memories = []
+                params.extend(filter_params)
+                params.extend([limit, offset])
                 
-                for row in cursor.fetchall():
-                    memories.append({
-                        'memory_id': row['memory_id'],
-                        'content': row['content'],
-                        'original_message': row['original_message'],
-                        'category': row['category'],
-                        'confidence_score': row['confidence_score'],
-                        'timestamp': datetime.fromisoformat(row['timestamp']) if row['timestamp'] else None,
-                        'created_at': row['created_at'],
-                        'updated_at': row['updated_at'],
-                        'metadata': json.loads(row['metadata']) if row['metadata'] else {},
-                        'is_active': bool(row['is_active'])
-                    })
+                # Plain tuples, unpacked positionally instead of through sqlite3.Row
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(search_query, params)
+                memories = [_memory_from_row(row) for row in cursor]
                 
                 return memories
         
@@ -372,7 +521,7 @@ class UserDatabaseManager:
                 conn.execute("""
                     INSERT INTO sessions (session_id, metadata)
                     VALUES (?, ?)
-                """, (session_id, json.dumps(metadata) if metadata else None))
+                """, (session_id, dump_json(metadata) if metadata else None))
                 return True
         
         try:
@@ -389,31 +538,22 @@ class UserDatabaseManager:
         """Update session information."""
         def _update():
             with self.transaction() as conn:
-                update_fields = []
-                params = []
-                
-                if ended_at is not None:
-                    update_fields.append("ended_at = ?")
-                    params.append(ended_at.isoformat())
-                if message_count is not None:
-                    update_fields.append("message_count = ?")
-                    params.append(message_count)
-                if memories_created is not None:
-                    update_fields.append("memories_created = ?")
-                    params.append(memories_created)
-                if metadata is not None:
-                    update_fields.append("metadata = ?")
-                    params.append(json.dumps(metadata))
-                
-                if not update_fields:
+                values = {
+                    'ended_at': ended_at.isoformat() if ended_at is not None else None,
+                    'message_count': message_count,
+                    'memories_created': memories_created,
+                    'metadata': dump_json(metadata) if metadata is not None else None
+                }
+                fields = frozenset(field for field, value in values.items() if value is not None)
+                
+                if not fields:
                     return True  # Nothing to update
                 
+                sql, field_order = self.UPDATE_SESSION_SQL[fields]
+                params = [values[field] for field in field_order]
                 params.append(session_id)
                 
-                cursor = conn.execute(f"""
-                    UPDATE sessions SET {', '.join(update_fields)}
-                    WHERE session_id = ?
-                """, params)
+                cursor = conn.execute(sql, params)
                 
                 return cursor.rowcount > 0
         
@@ -437,7 +577,7 @@ class UserDatabaseManager:
                         'ended_at': datetime.fromisoformat(row['ended_at']) if row['ended_at'] else None,
                         'message_count': row['message_count'],
                         'memories_created': row['memories_created'],
-                        'metadata': json.loads(row['metadata']) if row['metadata'] else {}
+                        'metadata': load_json(row['metadata']) if row['metadata'] else {}
                     }
                 return None
         
@@ -454,8 +594,6 @@ class UserDatabaseManager:
     
     def health_check(self) -> Dict[str, Any]:
         """Perform health check on user's memory system."""
-        from .schema import DatabaseSchema
-        
         health = {
             'status': 'healthy',
             'checks': {},
@@ -469,18 +607,14 @@ class UserDatabaseManager:
                 conn.execute("SELECT 1").fetchone()
             health['checks']['connectivity'] = True
             
-            # Schema validation for per-user database
-            health['checks']['schema'] = DatabaseSchema.validate_user_schema(self.db_path)
-            
-            # FTS functionality for per-user database
-            health['checks']['fts'] = DatabaseSchema.test_user_fts_functionality(self.db_path)
+            # Schema validation and FTS functionality for per-user database
+            health['checks'].update(self.db_manager.schema_checks(per_user=True))
             
             # Connection pool stats from underlying database manager
             if hasattr(self.db_manager, 'pool'):
                 health['stats']['pool'] = self.db_manager.pool.get_stats()
             
             # Database file stats
-            from pathlib import Path
             db_file = Path(self.db_path)
             if db_file.exists():
                 health['stats']['file_size'] = db_file.stat().st_size
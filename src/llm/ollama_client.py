@@ -3,14 +3,18 @@ Ollama client for LLM integration with connection management, retry logic, and h
 """
 import time
 import json
-from typing import Dict, List, Optional, Any, Union
+import random
+from typing import Dict, List, Optional, Any, Union, Iterator, AsyncIterator
 from datetime import datetime, timedelta
 import asyncio
 import threading
+from collections import deque
 from contextlib import contextmanager
 
+import httpx
 import ollama
 from ollama import Client as OllamaBaseClient
+from ollama import AsyncClient as OllamaAsyncBaseClient
 
 from core.config import get_config
 from core.logging import get_logger
@@ -43,6 +47,18 @@ class OllamaClient:
     Ollama client with connection management, retry logic, and health monitoring.
     """
     
+    # Keep-alive pool for the underlying HTTP clients. Idle connections are
+    # kept for 30s (httpx defaults to 5s) so requests spaced out by LLM
+    # latency reuse an open connection instead of reconnecting.
+    HTTP_LIMITS = httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0)
+    
+    # Seconds a fetched model list answers model_exists() without a request
+    MODEL_CACHE_TTL = 60.0
+    
+    # Seconds between the generation probes health_check() runs by default;
+    # each one loads the model and decodes tokens
+    MODEL_PROBE_INTERVAL = 3600.0
+    
     def __init__(self, host: Optional[str] = None, timeout: Optional[int] = None, 
                  default_model: Optional[str] = None, max_retries: int = 3):
         """
@@ -62,8 +78,10 @@ class OllamaClient:
         self.max_retries = max_retries
         self.retry_delay = 1.0  # Base delay in seconds
         
-        # Initialize Ollama client
-        self._client = OllamaBaseClient(host=self.host, timeout=self.timeout)
+        # Initialize Ollama clients; the async client backs agenerate/achat.
+        # Each keeps one connection pool for all of its requests.
+        self._client = OllamaBaseClient(host=self.host, timeout=self.timeout, limits=self.HTTP_LIMITS)
+        self._aclient = OllamaAsyncBaseClient(host=self.host, timeout=self.timeout, limits=self.HTTP_LIMITS)
         
         # Connection state
         self._connected = False
@@ -71,43 +89,55 @@ class OllamaClient:
         self._health_check_interval = timedelta(minutes=5)
         self._lock = threading.Lock()
         
-        # Statistics
+        # Names from the last model listing and when it was made
+        self._model_cache: frozenset = frozenset()
+        self._model_cache_ts = 0.0
+        
+        # time.monotonic() of the last successful generation probe
+        self._last_model_probe: Optional[float] = None
+        
+        # Statistics. Counters live in per-thread shards that only their own
+        # thread writes, summed in get_stats(), so recording a request takes
+        # no lock. The rest relies on set.add, deque.append and attribute
+        # assignment being atomic.
+        self._local = threading.local()
+        self._stat_shards: List[Dict[str, Any]] = []
         self._stats = {
-            'requests_made': 0,
-            'requests_failed': 0,
-            'total_response_time': 0.0,
-            'avg_response_time': 0.0,
-            'last_request_time': None,
+            'last_request_time': None,  # time.time() of the last attempt, formatted on read
             'models_used': set(),
-            'errors': []
+            'errors': deque(maxlen=10)  # Keep only last 10 errors
         }
         
         logger.info(f"OllamaClient initialized: host={self.host}, model={self.default_model}")
     
+    def _stats_shard(self) -> Dict[str, Any]:
+        """Return the calling thread's statistics counters, registering them on first use."""
+        shard = getattr(self._local, 'stats', None)
+        if shard is None:
+            shard = {'requests_made': 0, 'requests_failed': 0, 'total_response_time': 0.0}
+            self._local.stats = shard
+            with self._lock:
+                self._stat_shards.append(shard)
+        return shard
+    
     def _update_stats(self, response_time: float, model: str, success: bool, error: Optional[str] = None):
         """Update client statistics."""
-        with self._lock:
-            self._stats['requests_made'] += 1
-            if not success:
-                self._stats['requests_failed'] += 1
-                if error:
-                    self._stats['errors'].append({
-                        'error': error,
-                        'timestamp': datetime.now().isoformat(),
-                        'model': model
-                    })
-                    # Keep only last 10 errors
-                    if len(self._stats['errors']) > 10:
-                        self._stats['errors'] = self._stats['errors'][-10:]
-            
-            if success:
-                self._stats['total_response_time'] += response_time
-                successful_requests = self._stats['requests_made'] - self._stats['requests_failed']
-                if successful_requests > 0:
-                    self._stats['avg_response_time'] = self._stats['total_response_time'] / successful_requests
-                self._stats['models_used'].add(model)
-            
-            self._stats['last_request_time'] = datetime.now().isoformat()
+        shard = self._stats_shard()
+        shard['requests_made'] += 1
+        if not success:
+            shard['requests_failed'] += 1
+            if error:
+                self._stats['errors'].append({
+                    'error': error,
+                    'timestamp': datetime.now().isoformat(),
+                    'model': model
+                })
+        
+        if success:
+            shard['total_response_time'] += response_time
+            self._stats['models_used'].add(model)
+        
+        self._stats['last_request_time'] = time.time()
     
     def _retry_with_backoff(self, operation, *args, **kwargs):
         """
@@ -146,24 +176,96 @@ class OllamaClient:
                 self._update_stats(0.0, model, False, str(e))
                 
                 if attempt < self.max_retries:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
+                    delay = self._backoff_delay(attempt)
                     logger.warning(f"Ollama request failed, retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries + 1}): {e}")
                     time.sleep(delay)
                 else:
                     logger.error(f"Ollama request failed after {self.max_retries + 1} attempts: {e}")
         
-        # Convert specific errors
-        if "model" in str(last_error).lower() and "not found" in str(last_error).lower():
-            raise ModelNotFoundError(f"Model not found: {last_error}")
-        elif "connection" in str(last_error).lower() or "timeout" in str(last_error).lower():
-            raise ConnectionError(f"Connection failed: {last_error}")
+        raise self._convert_error(last_error) from last_error
+    
+    async def _aretry_with_backoff(self, operation, *args, **kwargs):
+        """
+        Await an async operation with exponential backoff retry logic.
+        
+        Async counterpart of _retry_with_backoff; waits between attempts with
+        asyncio.sleep so other requests keep running on the event loop.
+        
+        Args:
+            operation: Coroutine function to await
+            *args: Arguments for operation
+            **kwargs: Keyword arguments for operation
+            
+        Returns:
+            Result of operation
+            
+        Raises:
+            OllamaError: If operation fails after all retries
+        """
+        last_error = None
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                start_time = time.time()
+                result = await operation(*args, **kwargs)
+                response_time = time.time() - start_time
+                
+                # Update stats on success
+                model = kwargs.get('model', self.default_model)
+                self._update_stats(response_time, model, True)
+                
+                return result
+                
+            except Exception as e:
+                last_error = e
+                model = kwargs.get('model', self.default_model)
+                
+                # Update stats on failure
+                self._update_stats(0.0, model, False, str(e))
+                
+                if attempt < self.max_retries:
+                    delay = self._backoff_delay(attempt)
+                    logger.warning(f"Ollama request failed, retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries + 1}): {e}")
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(f"Ollama request failed after {self.max_retries + 1} attempts: {e}")
+        
+        raise self._convert_error(last_error) from last_error
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Seconds to wait before retrying after a failed attempt.
+        
+        Full jitter: uniform between zero and the exponential backoff, so
+        callers failing together during an outage do not retry in lockstep.
+        """
+        return random.uniform(0, self.retry_delay * (2 ** attempt))
+    
+    @staticmethod
+    def _convert_error(error: Exception) -> OllamaError:
+        """
+        Map the last error of a failed request to a specific OllamaError.
+        
+        The server answers an unknown model with a 404 ResponseError; transport
+        failures surface as httpx errors, or as the builtin ConnectionError
+        (an OSError) that the ollama library raises when it cannot connect.
+        """
+        if isinstance(error, ollama.ResponseError) and error.status_code == 404:
+            return ModelNotFoundError(f"Model not found: {error}")
+        elif isinstance(error, (httpx.TransportError, OSError)):
+            return ConnectionError(f"Connection failed: {error}")
         else:
-            raise OllamaError(f"Request failed: {last_error}")
+            return OllamaError(f"Request failed: {error}")
     
-    def health_check(self) -> Dict[str, Any]:
+    def health_check(self, probe_model: Optional[bool] = None) -> Dict[str, Any]:
         """
         Perform health check on Ollama server.
         
+        Args:
+            probe_model: Whether to test the default model with a short
+                generation; by default only when the last successful probe is
+                older than MODEL_PROBE_INTERVAL
+        
         Returns:
             Health check results
         """
@@ -175,26 +277,18 @@ class OllamaClient:
             'default_model': self.default_model,
             'response_time_ms': 0,
             'models_available': [],
+            'model_probed': False,
             'errors': []
         }
         
         try:
             # Test basic connectivity by listing models
             models_response = self._client.list()
-            # Handle both old dict format and new model object format
-            if hasattr(models_response, 'models'):
-                models = models_response.models
-            else:
-                models = models_response.get('models', [])
+            health['models_available'] = self._model_names(models_response)
             
-            health['models_available'] = []
-            for model in models:
-                if hasattr(model, 'model'):
-                    health['models_available'].append(model.model)
-                elif isinstance(model, dict) and 'name' in model:
-                    health['models_available'].append(model['name'])
-                elif hasattr(model, 'name'):
-                    health['models_available'].append(model.name)
+            # The listing also refreshes the model_exists() cache
+            self._model_cache = frozenset(health['models_available'])
+            self._model_cache_ts = time.monotonic()
             
             # Check if default model is available
             if self.default_model not in health['models_available']:
@@ -202,7 +296,8 @@ class OllamaClient:
                 health['status'] = 'degraded'
             
             # Test model response with simple prompt
-            if self.default_model in health['models_available']:
+            if self.default_model in health['models_available'] and self._should_probe_model(probe_model):
+                health['model_probed'] = True
                 try:
                     response = self._client.generate(
                         model=self.default_model,
@@ -212,6 +307,8 @@ class OllamaClient:
                     if not response.get('response'):
                         health['errors'].append("Model response test failed")
                         health['status'] = 'degraded'
+                    else:
+                        self._last_model_probe = time.monotonic()
                 except Exception as e:
                     health['errors'].append(f"Model test failed: {str(e)}")
                     health['status'] = 'degraded'
@@ -230,6 +327,13 @@ class OllamaClient:
         
         return health
     
+    def _should_probe_model(self, probe_model: Optional[bool]) -> bool:
+        """Decide whether a health check runs the generation probe."""
+        if probe_model is not None:
+            return probe_model
+        return (self._last_model_probe is None
+                or time.monotonic() - self._last_model_probe > self.MODEL_PROBE_INTERVAL)
+    
     def _should_health_check(self) -> bool:
         """Check if health check is needed."""
         if self._last_health_check is None:
@@ -248,11 +352,14 @@ class OllamaClient:
         """
         Ensure connection to Ollama is healthy.
         
+        Liveness only: the periodic check lists models without running the
+        generation probe.
+        
         Returns:
             True if connected and healthy
         """
         if self._should_health_check():
-            health = self.health_check()
+            health = self.health_check(probe_model=False)
             return health['status'] != 'unhealthy'
         return self._connected
     
@@ -266,15 +373,9 @@ class OllamaClient:
         try:
             result = self._retry_with_backoff(self._client.list)
             
-            # Handle both old dict format and new model object format
-            if hasattr(result, 'models'):
-                models = result.models
-            else:
-                models = result.get('models', [])
-            
             # Convert model objects to dictionaries for consistency
             model_list = []
-            for model in models:
+            for model in self._listed_models(result):
                 if hasattr(model, 'model'):
                     # New format with model objects
                     model_dict = {
@@ -292,30 +393,81 @@ class OllamaClient:
                 
                 model_list.append(model_dict)
             
+            self._model_cache = frozenset(m['name'] for m in model_list)
+            self._model_cache_ts = time.monotonic()
             return model_list
         except Exception as e:
             logger.error(f"Failed to list models: {e}")
             raise
     
+    def list_model_names(self) -> frozenset:
+        """
+        List the names of available models.
+        
+        Cheaper than list_models() when only names are needed: no per-model
+        dictionaries are built.
+        
+        Returns:
+            Names of available models
+        """
+        try:
+            result = self._retry_with_backoff(self._client.list)
+        except Exception as e:
+            logger.error(f"Failed to list models: {e}")
+            raise
+        
+        self._model_cache = frozenset(self._model_names(result))
+        self._model_cache_ts = time.monotonic()
+        return self._model_cache
+    
+    @staticmethod
+    def _listed_models(response) -> List[Any]:
+        """Models from a list response, in either the old dict or the new object format."""
+        if hasattr(response, 'models'):
+            return response.models
+        return response.get('models', [])
+    
+    @classmethod
+    def _model_names(cls, response) -> List[str]:
+        """Model names from a list response."""
+        names = []
+        for model in cls._listed_models(response):
+            if hasattr(model, 'model'):
+                names.append(model.model)
+            elif isinstance(model, dict) and 'name' in model:
+                names.append(model['name'])
+            elif hasattr(model, 'name'):
+                names.append(model.name)
+        return names
+    
     def model_exists(self, model: str) -> bool:
         """
         Check if a model exists.
         
+        A model seen in a model list fetched within MODEL_CACHE_TTL counts as
+        existing without a request; otherwise the list is fetched again.
+        
         Args:
             model: Model name to check
             
         Returns:
             True if model exists
         """
+        if model in self._model_cache and time.monotonic() - self._model_cache_ts < self.MODEL_CACHE_TTL:
+            return True
+        
         try:
-            models = self.list_models()
-            return model in [m['name'] for m in models]
+            return model in self.list_model_names()
         except Exception:
             return False
     
+    def _invalidate_model_cache(self):
+        """Make the next model_exists() call fetch the model list again."""
+        self._model_cache_ts = 0.0
+    
     def generate(self, prompt: str, model: Optional[str] = None, 
                  system: Optional[str] = None, options: Optional[Dict[str, Any]] = None,
-                 stream: bool = False) -> Dict[str, Any]:
+                 stream: bool = False) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
         """
         Generate text response from model.
         
@@ -324,31 +476,17 @@ class OllamaClient:
             model: Model to use (defaults to default_model)
             system: System prompt
             options: Generation options
-            stream: Whether to stream response
+            stream: Whether to stream response (see generate_stream())
             
         Returns:
-            Generated response
+            Generated response, or an iterator of response chunks when streaming
         """
-        if not self.ensure_connected():
-            raise ConnectionError("Ollama server is not available")
+        if stream:
+            return self.generate_stream(prompt, model, system, options)
         
         model = model or self.default_model
-        
-        # Check if model exists
-        if not self.model_exists(model):
-            available_models = [m['name'] for m in self.list_models()]
-            raise ModelNotFoundError(f"Model '{model}' not found. Available models: {available_models}")
-        
-        request_params = {
-            'model': model,
-            'prompt': prompt,
-            'stream': stream
-        }
-        
-        if system:
-            request_params['system'] = system
-        if options:
-            request_params['options'] = options
+        self._preflight(model)
+        request_params = self._generate_params(prompt, model, system, options, False)
         
         try:
             result = self._retry_with_backoff(self._client.generate, **request_params)
@@ -359,7 +497,8 @@ class OllamaClient:
             raise
     
     def chat(self, messages: List[Dict[str, str]], model: Optional[str] = None,
-             options: Optional[Dict[str, Any]] = None, stream: bool = False) -> Dict[str, Any]:
+             options: Optional[Dict[str, Any]] = None,
+             stream: bool = False) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
         """
         Chat with model using conversation format.
         
@@ -367,38 +506,308 @@ class OllamaClient:
             messages: List of chat messages (role, content)
             model: Model to use (defaults to default_model)
             options: Generation options
-            stream: Whether to stream response
+            stream: Whether to stream response (see chat_stream())
             
         Returns:
-            Chat response
+            Chat response, or an iterator of response chunks when streaming
         """
-        if not self.ensure_connected():
-            raise ConnectionError("Ollama server is not available")
+        if stream:
+            return self.chat_stream(messages, model, options)
         
         model = model or self.default_model
+        self._preflight(model)
+        request_params = self._chat_params(messages, model, options, False)
+        
+        try:
+            result = self._retry_with_backoff(self._client.chat, **request_params)
+            logger.debug(f"Chat response for model {model}: {len(messages)} messages in")
+            return result
+        except Exception as e:
+            logger.error(f"Chat failed for model {model}: {e}")
+            raise
+    
+    async def agenerate(self, prompt: str, model: Optional[str] = None,
+                        system: Optional[str] = None, options: Optional[Dict[str, Any]] = None,
+                        stream: bool = False) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+        """
+        Generate text response from model without blocking the event loop.
         
-        # Check if model exists
-        if not self.model_exists(model):
-            available_models = [m['name'] for m in self.list_models()]
-            raise ModelNotFoundError(f"Model '{model}' not found. Available models: {available_models}")
+        Takes the same arguments as generate().
         
-        request_params = {
-            'model': model,
-            'messages': messages,
-            'stream': stream
-        }
+        Returns:
+            Generated response, or an async iterator of response chunks when
+            streaming (see agenerate_stream())
+        """
+        if stream:
+            return self.agenerate_stream(prompt, model, system, options)
         
-        if options:
-            request_params['options'] = options
+        model = model or self.default_model
+        await asyncio.to_thread(self._preflight, model)
+        return await self._agenerate_checked(prompt, model, system, options, False)
+    
+    async def achat(self, messages: List[Dict[str, str]], model: Optional[str] = None,
+                    options: Optional[Dict[str, Any]] = None,
+                    stream: bool = False) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+        """
+        Chat with model without blocking the event loop.
+        
+        Takes the same arguments as chat().
+        
+        Returns:
+            Chat response, or an async iterator of response chunks when
+            streaming (see achat_stream())
+        """
+        if stream:
+            return self.achat_stream(messages, model, options)
+        
+        model = model or self.default_model
+        await asyncio.to_thread(self._preflight, model)
+        request_params = self._chat_params(messages, model, options, False)
         
         try:
-            result = self._retry_with_backoff(self._client.chat, **request_params)
+            result = await self._aretry_with_backoff(self._aclient.chat, **request_params)
             logger.debug(f"Chat response for model {model}: {len(messages)} messages in")
             return result
         except Exception as e:
             logger.error(f"Chat failed for model {model}: {e}")
             raise
     
+    def generate_stream(self, prompt: str, model: Optional[str] = None,
+                        system: Optional[str] = None,
+                        options: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Generate text response from model, yielding chunks as they arrive.
+        
+        The server check runs before this returns, so an unavailable server
+        or model raises here rather than on the first iteration. Streams are
+        not retried: a failure after chunks were yielded cannot be replayed.
+        
+        Args:
+            prompt: Input prompt
+            model: Model to use (defaults to default_model)
+            system: System prompt
+            options: Generation options
+            
+        Returns:
+            Iterator of response chunks; the last one has done=True
+        """
+        model = model or self.default_model
+        self._preflight(model)
+        request_params = self._generate_params(prompt, model, system, options, True)
+        return self._stream(self._client.generate, request_params)
+    
+    def chat_stream(self, messages: List[Dict[str, str]], model: Optional[str] = None,
+                    options: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Chat with model, yielding chunks as they arrive.
+        
+        Behaves like generate_stream().
+        
+        Args:
+            messages: List of chat messages (role, content)
+            model: Model to use (defaults to default_model)
+            options: Generation options
+            
+        Returns:
+            Iterator of response chunks; the last one has done=True
+        """
+        model = model or self.default_model
+        self._preflight(model)
+        request_params = self._chat_params(messages, model, options, True)
+        return self._stream(self._client.chat, request_params)
+    
+    async def agenerate_stream(self, prompt: str, model: Optional[str] = None,
+                               system: Optional[str] = None,
+                               options: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate text response from model, yielding chunks without blocking the event loop.
+        
+        Takes the same arguments as generate_stream().
+        
+        Yields:
+            Response chunks; the last one has done=True
+        """
+        model = model or self.default_model
+        await asyncio.to_thread(self._preflight, model)
+        request_params = self._generate_params(prompt, model, system, options, True)
+        async for chunk in self._astream(self._aclient.generate, request_params):
+            yield chunk
+    
+    async def achat_stream(self, messages: List[Dict[str, str]], model: Optional[str] = None,
+                           options: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Chat with model, yielding chunks without blocking the event loop.
+        
+        Takes the same arguments as chat_stream().
+        
+        Yields:
+            Response chunks; the last one has done=True
+        """
+        model = model or self.default_model
+        await asyncio.to_thread(self._preflight, model)
+        request_params = self._chat_params(messages, model, options, True)
+        async for chunk in self._astream(self._aclient.chat, request_params):
+            yield chunk
+    
+    def _stream(self, operation, request_params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield chunks from a streaming request.
+        
+        The response time recorded in the stats is the time to the first
+        chunk, since that is what a streaming caller waits on.
+        """
+        model = request_params['model']
+        start_time = time.time()
+        first = True
+        
+        try:
+            for chunk in operation(**request_params):
+                if first:
+                    self._update_stats(time.time() - start_time, model, True)
+                    first = False
+                if chunk.get('done'):
+                    self._log_stream_done(model, chunk, start_time)
+                yield chunk
+        except Exception as e:
+            self._stream_failed(model, e, first)
+            raise self._convert_error(e) from e
+    
+    async def _astream(self, operation, request_params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Async counterpart of _stream."""
+        model = request_params['model']
+        start_time = time.time()
+        first = True
+        
+        try:
+            async for chunk in await operation(**request_params):
+                if first:
+                    self._update_stats(time.time() - start_time, model, True)
+                    first = False
+                if chunk.get('done'):
+                    self._log_stream_done(model, chunk, start_time)
+                yield chunk
+        except Exception as e:
+            self._stream_failed(model, e, first)
+            raise self._convert_error(e) from e
+    
+    @staticmethod
+    def _log_stream_done(model: str, chunk: Dict[str, Any], start_time: float):
+        """Log the totals reported on the final chunk of a stream."""
+        eval_duration = chunk.get('eval_duration')
+        if eval_duration:
+            logger.debug(f"Stream for model {model} finished: {chunk.get('eval_count', 0)} tokens "
+                         f"in {eval_duration / 1e9:.2f}s eval, {time.time() - start_time:.2f}s total")
+        else:
+            logger.debug(f"Stream for model {model} finished in {time.time() - start_time:.2f}s")
+    
+    def _stream_failed(self, model: str, error: Exception, before_first_chunk: bool):
+        """Record a failed stream; one that already yielded chunks counted as a success."""
+        if before_first_chunk:
+            self._update_stats(0.0, model, False, str(error))
+        logger.error(f"Streaming request failed for model {model}: {error}")
+    
+    async def abatch_generate(self, prompts: List[str], model: Optional[str] = None,
+                              system: Optional[str] = None,
+                              options: Optional[Dict[str, Any]] = None) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Generate responses for independent prompts concurrently.
+        
+        The server decodes at most OLLAMA_NUM_PARALLEL requests per model at
+        once and queues the rest, so that setting caps the speedup over
+        calling generate() in a loop.
+        
+        Args:
+            prompts: Input prompts
+            model: Model to use (defaults to default_model)
+            system: System prompt shared by all prompts
+            options: Generation options shared by all prompts
+            
+        Returns:
+            One response per prompt, in order; a failed prompt yields its
+            exception instead of failing the batch
+        """
+        model = model or self.default_model
+        await asyncio.to_thread(self._preflight, model)
+        
+        return await asyncio.gather(
+            *(self._agenerate_checked(prompt, model, system, options, False) for prompt in prompts),
+            return_exceptions=True
+        )
+    
+    async def _agenerate_checked(self, prompt: str, model: str, system: Optional[str],
+                                 options: Optional[Dict[str, Any]], stream: bool) -> Dict[str, Any]:
+        """Run an async generate request for a model already checked as available."""
+        request_params = self._generate_params(prompt, model, system, options, stream)
+        
+        try:
+            result = await self._aretry_with_backoff(self._aclient.generate, **request_params)
+            logger.debug(f"Generated response for model {model}: {len(prompt)} chars in -> {len(result.get('response', ''))} chars out")
+            return result
+        except Exception as e:
+            logger.error(f"Generation failed for model {model}: {e}")
+            raise
+    
+    def _preflight(self, model: str):
+        """
+        Verify the server is reachable and serves the model.
+        
+        A fresh cached model list containing the model answers both without a
+        request. Otherwise a single list_model_names() call refreshes the cache,
+        and its success also counts as the connectivity check; the full
+        health_check() and its generation probe stay off the request path.
+        
+        Raises:
+            ConnectionError: If the Ollama server is not available
+            ModelNotFoundError: If the model is not available on the server
+        """
+        if (self._connected and model in self._model_cache
+                and time.monotonic() - self._model_cache_ts < self.MODEL_CACHE_TTL):
+            return
+        
+        try:
+            self.list_model_names()
+        except Exception as e:
+            with self._lock:
+                self._connected = False
+            raise ConnectionError(f"Ollama server is not available: {e}") from e
+        
+        with self._lock:
+            self._connected = True
+            self._last_health_check = datetime.now()
+        
+        if model not in self._model_cache:
+            raise ModelNotFoundError(f"Model '{model}' not found. Available models: {sorted(self._model_cache)}")
+    
+    @staticmethod
+    def _generate_params(prompt: str, model: str, system: Optional[str],
+                         options: Optional[Dict[str, Any]], stream: bool) -> Dict[str, Any]:
+        """Build the request parameters for a generate call."""
+        request_params = {
+            'model': model,
+            'prompt': prompt,
+            'stream': stream
+        }
+        
+        if system:
+            request_params['system'] = system
+        if options:
+            request_params['options'] = options
+        return request_params
+    
+    @staticmethod
+    def _chat_params(messages: List[Dict[str, str]], model: str,
+                     options: Optional[Dict[str, Any]], stream: bool) -> Dict[str, Any]:
+        """Build the request parameters for a chat call."""
+        request_params = {
+            'model': model,
+            'messages': messages,
+            'stream': stream
+        }
+        
+        if options:
+            request_params['options'] = options
+        return request_params
+    
     def pull_model(self, model: str) -> bool:
         """
         Pull a model from Ollama repository.
@@ -412,6 +821,7 @@ class OllamaClient:
         try:
             logger.info(f"Pulling model: {model}")
             self._client.pull(model)
+            self._invalidate_model_cache()
             logger.info(f"Successfully pulled model: {model}")
             return True
         except Exception as e:
@@ -431,6 +841,7 @@ class OllamaClient:
         try:
             logger.info(f"Deleting model: {model}")
             self._client.delete(model)
+            self._invalidate_model_cache()
             logger.info(f"Successfully deleted model: {model}")
             return True
         except Exception as e:
@@ -445,14 +856,27 @@ class OllamaClient:
             Statistics dictionary
         """
         with self._lock:
-            stats = self._stats.copy()
-            stats['models_used'] = list(stats['models_used'])  # Convert set to list for JSON serialization
-            stats['connected'] = self._connected
-            stats['last_health_check'] = self._last_health_check.isoformat() if self._last_health_check else None
-            stats['success_rate'] = round(
-                (stats['requests_made'] - stats['requests_failed']) / max(stats['requests_made'], 1) * 100, 1
-            )
-            return stats
+            shards = list(self._stat_shards)
+        
+        requests_made = sum(shard['requests_made'] for shard in shards)
+        requests_failed = sum(shard['requests_failed'] for shard in shards)
+        total_response_time = sum(shard['total_response_time'] for shard in shards)
+        successful_requests = requests_made - requests_failed
+        last_request_time = self._stats['last_request_time']
+        
+        stats = {
+            'requests_made': requests_made,
+            'requests_failed': requests_failed,
+            'total_response_time': total_response_time,
+            'avg_response_time': total_response_time / successful_requests if successful_requests > 0 else 0.0,
+            'last_request_time': datetime.fromtimestamp(last_request_time).isoformat() if last_request_time else None,
+            'models_used': list(self._stats['models_used']),  # Convert set to list for JSON serialization
+            'errors': list(self._stats['errors'])
+        }
+        stats['connected'] = self._connected
+        stats['last_health_check'] = self._last_health_check.isoformat() if self._last_health_check else None
+        stats['success_rate'] = round(successful_requests / max(requests_made, 1) * 100, 1)
+        return stats
     
     @contextmanager
     def model_context(self, model: str):
@@ -471,8 +895,14 @@ class OllamaClient:
     
     def close(self):
         """Close the client and cleanup resources."""
+        # Release kept-alive connections held by the underlying httpx client
+        self._client._client.close()
         logger.info("OllamaClient closed")
     
+    async def aclose(self):
+        """Close the async client's pooled connections; call from its event loop."""
+        await self._aclient._client.aclose()
+    
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -1,11 +1,13 @@
 """
 Base model class with validation and serialization capabilities.
 """
-import json
+import functools
+import types
 import uuid
-from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, Union, get_type_hints
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, Union, get_type_hints
+
+import orjson
 
 from core.logging import get_logger
 
@@ -17,7 +19,87 @@ class ValidationError(Exception):
     pass
 
 
-class BaseModel(ABC):
+class _FieldMeta(NamedTuple):
+    """Validation facts about a field, derived once from its declared type and name."""
+    optional: bool
+    types: Tuple[type, ...]  # Union/Optional flattened, for a single isinstance()
+    accepts_datetime_str: bool
+    accepts_json_str: bool
+
+
+def _flatten_types(field_type: Any) -> Tuple[type, ...]:
+    """Unwrap Union/Optional into a flat tuple of types."""
+    if getattr(field_type, '__origin__', None) is Union:
+        return tuple(t for arg in field_type.__args__ for t in _flatten_types(arg))
+    return (field_type,)
+
+
+@functools.lru_cache(maxsize=256)
+def _type_meta(field_type: Any) -> _FieldMeta:
+    """Build the validation metadata for a declared field type, once per type."""
+    types = _flatten_types(field_type)
+    return _FieldMeta(
+        optional=type(None) in types,
+        types=types,
+        accepts_datetime_str=datetime in types,
+        accepts_json_str=dict in types or list in types
+    )
+
+
+def _parse_datetime_value(field: str, value: Any) -> Any:
+    """Convert a datetime string to a datetime object."""
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError as e:
+            raise ValidationError(f"Invalid datetime format for {field}: {value}")
+    return value
+
+
+def _parse_json_value(field: str, value: Any) -> Any:
+    """Parse a JSON object string into a dict; an empty string becomes {}."""
+    if isinstance(value, str):
+        try:
+            value = orjson.loads(value) if value else {}
+        except orjson.JSONDecodeError as e:
+            raise ValidationError(f"Invalid JSON for {field}: {value}")
+        # The type check only saw a string; the parsed value must be a dict
+        if not isinstance(value, dict):
+            raise ValidationError(f"{field} must be a dictionary")
+    return value
+
+
+def _keep_value(field: str, value: Any) -> Any:
+    """Leave a value unconverted."""
+    return value
+
+
+def _field_handler(field: str):
+    """Pick the conversion for a field by name: datetimes, JSON, or none."""
+    if field.endswith('_at') or field == 'timestamp':
+        return _parse_datetime_value
+    if field in ('metadata', 'settings'):
+        return _parse_json_value
+    return _keep_value
+
+
+def _validate_identifier(model: 'BaseModel', field: str, value: Any, max_length: int = 255) -> Any:
+    """Require a non-empty string of at most max_length characters."""
+    if not value:
+        raise ValidationError(f"{field} must be a non-empty string")
+    if len(value) > max_length:
+        raise ValidationError(f"{field} must be {max_length} characters or less")
+    return value
+
+
+def _validate_non_negative(model: 'BaseModel', field: str, value: Any) -> Any:
+    """Require a value that is not below zero, or None."""
+    if value is not None and value < 0:
+        raise ValidationError(f"{field} must be a non-negative integer")
+    return value
+
+
+class BaseModel:
     """
     Base model class providing validation, serialization, and common functionality.
     """
@@ -31,6 +113,59 @@ class BaseModel(ABC):
     # Define default values (override in subclasses)
     DEFAULTS: Dict[str, Any] = {}
     
+    # Fields whose validation reads another field, keyed by the field read;
+    # updating the key re-validates its dependents (override in subclasses)
+    DEPENDENT_FIELDS: Dict[str, List[str]] = {}
+    
+    # Model-specific checks run after type validation and conversion, keyed by
+    # field; each is called as validator(model, field, value) and returns the
+    # value to store. The type check from FIELD_TYPES has already passed, so
+    # these only check lengths, ranges and the like (override in subclasses)
+    _FIELD_VALIDATORS: Dict[str, Any] = {}
+    
+    # Per-field validation metadata and conversions, built from FIELD_TYPES
+    # for each subclass
+    _FIELD_META: Dict[str, _FieldMeta] = {}
+    _FIELD_HANDLERS: Dict[str, Any] = {}
+    
+    # The declarations above frozen for the per-instance construction loops:
+    # required field names, optional field names, and (field, default,
+    # default is callable) triples
+    _REQUIRED_FIELD_NAMES: Tuple[str, ...] = ()
+    _OPTIONAL_FIELD_NAMES: Tuple[str, ...] = ()
+    _DEFAULT_ITEMS: Tuple[Tuple[str, Any, bool], ...] = ()
+    
+    # Declared fields also stored as instance attributes (slots, where the
+    # subclass declares them), so reading them is a plain attribute lookup
+    # instead of a call to __getattr__
+    _DIRECT_FIELDS: frozenset = frozenset()
+    
+    # _dict_cache holds the last to_dict() result, dropped whenever a field is
+    # set. Subclasses may declare their FIELD_TYPES keys as __slots__ too, so
+    # instances carry no per-instance __dict__.
+    __slots__ = ('_fields', '_dict_cache')
+    
+    def __init_subclass__(cls, **kwargs):
+        """Precompute field validation metadata once per model class."""
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_META = {
+            field: _type_meta(field_type)
+            for field, field_type in cls.FIELD_TYPES.items()
+        }
+        cls._FIELD_HANDLERS = {field: _field_handler(field) for field in cls.FIELD_TYPES}
+        cls._REQUIRED_FIELD_NAMES = tuple(cls.REQUIRED_FIELDS)
+        cls._OPTIONAL_FIELD_NAMES = tuple(field for field, meta in cls._FIELD_META.items() if meta.optional)
+        cls._DEFAULT_ITEMS = tuple(
+            (field, default_value, callable(default_value))
+            for field, default_value in cls.DEFAULTS.items()
+        )
+        # A field named like a class attribute (e.g. a method) must not shadow
+        # it; a slot of the same name is where the field is meant to live
+        cls._DIRECT_FIELDS = frozenset(
+            field for field in cls.FIELD_TYPES
+            if not hasattr(cls, field) or isinstance(getattr(cls, field), types.MemberDescriptorType)
+        )
+    
     def __init__(self, **kwargs):
         """
         Initialize model with field validation.
@@ -42,12 +177,9 @@ class BaseModel(ABC):
             ValidationError: If validation fails
         """
         # Apply defaults first
-        for field, default_value in self.DEFAULTS.items():
+        for field, default_value, is_factory in self._DEFAULT_ITEMS:
             if field not in kwargs:
-                if callable(default_value):
-                    kwargs[field] = default_value()
-                else:
-                    kwargs[field] = default_value
+                kwargs[field] = default_value() if is_factory else default_value
         
         # Validate and set fields
         self._fields = {}
@@ -65,7 +197,7 @@ class BaseModel(ABC):
         """
         # Check required fields
         missing_fields = []
-        for field in self.REQUIRED_FIELDS:
+        for field in self._REQUIRED_FIELD_NAMES:
             if field not in fields or fields[field] is None:
                 missing_fields.append(field)
         
@@ -73,25 +205,119 @@ class BaseModel(ABC):
             raise ValidationError(f"Missing required fields: {missing_fields}")
         
         # Set all fields from FIELD_TYPES with None defaults for optional fields
-        for field, field_type in self.FIELD_TYPES.items():
+        for field in self._OPTIONAL_FIELD_NAMES:
             if field not in fields:
-                # Check if field is Optional (Union with None)
-                if hasattr(field_type, '__origin__') and field_type.__origin__ is Union:
-                    if type(None) in field_type.__args__:
-                        fields[field] = None
+                fields[field] = None
         
-        # Validate field types and set values
+        # Validate field types and set values. This is _validate_value and
+        # _set_field inlined, as it runs for every field of every new model.
+        field_meta = self._FIELD_META
+        direct_fields = self._DIRECT_FIELDS
+        stored_fields = self._fields
+        set_attribute = object.__setattr__
         for field, value in fields.items():
-            if field in self.FIELD_TYPES:
-                expected_type = self.FIELD_TYPES[field]
-                if value is not None and not self._is_valid_type(value, expected_type):
-                    raise ValidationError(
-                        f"Field '{field}' expected {expected_type.__name__}, got {type(value).__name__}"
-                    )
+            meta = field_meta.get(field)
+            if meta is not None and value is not None and not self._has_valid_type(value, meta):
+                raise ValidationError(
+                    f"Field '{field}' expected {self.FIELD_TYPES[field].__name__}, got {type(value).__name__}"
+                )
+            
+            value = self._validate_field(field, value)
+            stored_fields[field] = value
+            if field in direct_fields:
+                set_attribute(self, field, value)
+        set_attribute(self, '_dict_cache', None)
+    
+    def _validate_and_set_fields_partial(self, updates: Dict[str, Any]) -> None:
+        """
+        Validate and set only the given fields of an already valid model.
+        
+        Fields that depend on an updated field are re-validated after it,
+        against its new value.
+        
+        Args:
+            updates: Dictionary of field names and new values
             
-            # Custom field validation
-            validated_value = self._validate_field(field, value)
-            self._fields[field] = validated_value
+        Raises:
+            ValidationError: If validation fails
+        """
+        # Required fields can only become missing by being set to None
+        missing_fields = [field for field in self._REQUIRED_FIELD_NAMES
+                          if field in updates and updates[field] is None]
+        if missing_fields:
+            raise ValidationError(f"Missing required fields: {missing_fields}")
+        
+        dependents = [
+            dependent
+            for field in updates
+            for dependent in self.DEPENDENT_FIELDS.get(field, ())
+        ]
+        
+        for field in updates:
+            if field not in dependents:
+                self._set_field(field, self._validate_value(field, updates[field]))
+        
+        for field in dict.fromkeys(dependents):
+            if field in updates:
+                self._set_field(field, self._validate_value(field, updates[field]))
+            elif field in self._fields:
+                self._set_field(field, self._validate_value(field, self._fields[field]))
+    
+    def _set_field(self, field: str, value: Any) -> None:
+        """Store a validated field value; _fields stays the canonical store."""
+        self._fields[field] = value
+        if field in self._DIRECT_FIELDS:
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, '_dict_cache', None)
+    
+    def _validate_value(self, field: str, value: Any) -> Any:
+        """
+        Type-check and validate a single field value.
+        
+        Args:
+            field: Field name
+            value: Field value
+            
+        Returns:
+            Validated and possibly transformed value
+            
+        Raises:
+            ValidationError: If validation fails
+        """
+        meta = self._FIELD_META.get(field)
+        if meta is not None and value is not None and not self._has_valid_type(value, meta):
+            raise ValidationError(
+                f"Field '{field}' expected {self.FIELD_TYPES[field].__name__}, got {type(value).__name__}"
+            )
+        
+        return self._validate_field(field, value)
+    
+    @staticmethod
+    def _has_valid_type(value: Any, meta: _FieldMeta) -> bool:
+        """
+        Check a non-None value against a field's precomputed types.
+        
+        Strings also pass for datetime fields when they parse as ISO
+        datetimes, and for dict/list fields when they parse as JSON.
+        """
+        if isinstance(value, meta.types):
+            return True
+        
+        if isinstance(value, str):
+            if meta.accepts_datetime_str:
+                try:
+                    datetime.fromisoformat(value.replace('Z', '+00:00'))
+                    return True
+                except ValueError:
+                    pass
+            if meta.accepts_json_str:
+                try:
+                    orjson.loads(value)
+                    return True
+                except (orjson.JSONDecodeError, TypeError):
+                    pass
+        
+        return False
     
     def _is_valid_type(self, value: Any, expected_type: Type) -> bool:
         """
@@ -104,32 +330,11 @@ class BaseModel(ABC):
         Returns:
             True if value is valid type
         """
-        # Handle Union types (e.g., Optional[str] = Union[str, None])
-        if hasattr(expected_type, '__origin__'):
-            if expected_type.__origin__ is Union:
-                return any(self._is_valid_type(value, arg) for arg in expected_type.__args__)
-        
-        # Handle datetime strings
-        if expected_type is datetime and isinstance(value, str):
-            try:
-                datetime.fromisoformat(value.replace('Z', '+00:00'))
-                return True
-            except ValueError:
-                return False
-        
-        # Handle JSON fields (dict/list stored as strings)
-        if expected_type in (dict, list) and isinstance(value, str):
-            try:
-                json.loads(value)
-                return True
-            except (json.JSONDecodeError, TypeError):
-                return False
-        
-        return isinstance(value, expected_type)
+        return self._has_valid_type(value, _type_meta(expected_type))
     
     def _validate_field(self, field: str, value: Any) -> Any:
         """
-        Custom field validation. Override in subclasses for specific validation.
+        Convert a field value and run its entry in _FIELD_VALIDATORS, if any.
         
         Args:
             field: Field name
@@ -141,25 +346,17 @@ class BaseModel(ABC):
         Raises:
             ValidationError: If validation fails
         """
-        # Convert datetime strings to datetime objects
-        if field.endswith('_at') or field == 'timestamp':
-            if isinstance(value, str) and value:
-                try:
-                    return datetime.fromisoformat(value.replace('Z', '+00:00'))
-                except ValueError as e:
-                    raise ValidationError(f"Invalid datetime format for {field}: {value}")
-        
-        # Parse JSON fields
-        if field in ('metadata', 'settings') and isinstance(value, str):
-            try:
-                return json.loads(value) if value else {}
-            except json.JSONDecodeError as e:
-                raise ValidationError(f"Invalid JSON for {field}: {value}")
+        # Convert datetime and JSON strings; undeclared fields are classified by name
+        handler = self._FIELD_HANDLERS.get(field) or _field_handler(field)
+        value = handler(field, value)
         
+        validator = self._FIELD_VALIDATORS.get(field)
+        if validator is not None:
+            value = validator(self, field, value)
         return value
     
     def __getattr__(self, name: str) -> Any:
-        """Get field value."""
+        """Get a field value not stored as an instance attribute."""
         if name in self._fields:
             return self._fields[name]
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
@@ -173,31 +370,33 @@ class BaseModel(ABC):
                 super().__setattr__(name, value)
             else:
                 # Validate single field update
-                if name in self.FIELD_TYPES:
-                    expected_type = self.FIELD_TYPES[name]
-                    if value is not None and not self._is_valid_type(value, expected_type):
-                        raise ValidationError(
-                            f"Field '{name}' expected {expected_type.__name__}, got {type(value).__name__}"
-                        )
-                
-                validated_value = self._validate_field(name, value)
-                self._fields[name] = validated_value
+                self._set_field(name, self._validate_value(name, value))
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert model to dictionary.
         
+        The result is built once and reused until a field is set; each call
+        returns a fresh copy of it.
+        
         Returns:
             Dictionary representation of the model
         """
-        result = {}
-        for field, value in self._fields.items():
-            if isinstance(value, datetime):
-                result[field] = value.isoformat()
-            elif isinstance(value, (dict, list)):
-                result[field] = value
-            else:
-                result[field] = value
+        return self._serialized_fields().copy()
+    
+    def _serialized_fields(self) -> Dict[str, Any]:
+        """
+        The cached to_dict() result itself, with datetimes as ISO strings.
+        
+        Shared until a field is set; callers must not modify it.
+        """
+        result = self._dict_cache
+        if result is None:
+            result = {
+                field: value.isoformat() if isinstance(value, datetime) else value
+                for field, value in self._fields.items()
+            }
+            object.__setattr__(self, '_dict_cache', result)
         return result
     
     def to_json(self) -> str:
@@ -207,7 +406,8 @@ class BaseModel(ABC):
         Returns:
             JSON string representation of the model
         """
-        return json.dumps(self.to_dict(), default=str, ensure_ascii=False)
+        # orjson writes UTF-8 directly; values it cannot serialize fall back to str()
+        return orjson.dumps(self._serialized_fields(), default=str, option=orjson.OPT_NON_STR_KEYS).decode()
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BaseModel':
@@ -222,6 +422,50 @@ class BaseModel(ABC):
         """
         return cls(**data)
     
+    @classmethod
+    def _from_validated(cls, fields: Dict[str, Any]) -> 'BaseModel':
+        """
+        Create model instance from fields that have already been validated.
+        
+        Skips defaults and validation, so fields must be a complete, valid
+        field set, such as the stored fields of an existing instance.
+        
+        Args:
+            fields: Validated field values; copied, not shared
+            
+        Returns:
+            Model instance
+        """
+        instance = cls.__new__(cls)
+        set_attribute = object.__setattr__
+        set_attribute(instance, '_fields', dict(fields))
+        for field in cls._DIRECT_FIELDS.intersection(fields):
+            set_attribute(instance, field, fields[field])
+        set_attribute(instance, '_dict_cache', None)
+        return instance
+    
+    @classmethod
+    def _unchecked(cls, **fields) -> 'BaseModel':
+        """
+        Create model instance from known-good field values without validating them.
+        
+        Defaults and None for missing optional fields are filled in as by
+        __init__. Meant for trusted literal data such as test fixtures.
+        
+        Args:
+            **fields: Field values for the model
+            
+        Returns:
+            Model instance
+        """
+        for field, default_value, is_factory in cls._DEFAULT_ITEMS:
+            if field not in fields:
+                fields[field] = default_value() if is_factory else default_value
+        for field in cls._OPTIONAL_FIELD_NAMES:
+            if field not in fields:
+                fields[field] = None
+        return cls._from_validated(fields)
+    
     @classmethod
     def from_json(cls, json_str: str) -> 'BaseModel':
         """
@@ -237,27 +481,25 @@ class BaseModel(ABC):
             ValidationError: If JSON parsing fails
         """
         try:
-            data = json.loads(json_str)
+            data = orjson.loads(json_str)
             return cls.from_dict(data)
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON: {e}")
     
     def update(self, **kwargs) -> None:
         """
         Update model fields with validation.
         
+        Only the updated fields and their dependents are validated; use
+        validate() to re-check the whole model.
+        
         Args:
             **kwargs: Fields to update
             
         Raises:
             ValidationError: If validation fails
         """
-        # Create updated fields dict
-        updated_fields = self._fields.copy()
-        updated_fields.update(kwargs)
-        
-        # Validate all fields together
-        self._validate_and_set_fields(updated_fields)
+        self._validate_and_set_fields_partial(kwargs)
     
     def validate(self) -> bool:
         """
@@ -284,12 +526,11 @@ class BaseModel(ABC):
             return False
         return self._fields == other._fields
     
-    @abstractmethod
     def get_primary_key(self) -> str:
         """
-        Get the primary key value for this model.
+        Get the primary key value for this model. Subclasses must override this.
         
         Returns:
             Primary key value
         """
-        pass
\ No newline at end of file
+        raise NotImplementedError(f"{type(self).__name__} must implement get_primary_key()")
\ No newline at end of file
@@ -1,11 +1,62 @@
 """
 Category model for the Harmonia Memory Storage System.
 """
-import uuid
+import functools
+import re
+import secrets
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
-from .base import BaseModel, ValidationError
+from .base import BaseModel, ValidationError, _validate_identifier
+
+
+class _CategoryIdChars(dict):
+    """str.translate() table keeping characters allowed in a category ID and mapping all others to '_'."""
+    
+    def __missing__(self, char: int) -> str:
+        return '_'
+
+
+_CATEGORY_ID_CHARS = _CategoryIdChars(
+    (ord(c), c) for c in 'abcdefghijklmnopqrstuvwxyz0123456789_-'
+)
+
+# Names that generate_id_from_name() would return unchanged (before truncation)
+_GENERATED_CATEGORY_ID = re.compile(r'[a-z0-9-]+(?:_[a-z0-9-]+)*')
+
+# Letters, numbers, hyphens and underscores, with at least one letter or number
+_CATEGORY_ID_VALID = re.compile(r'[_-]*[^\W_][\w-]*')
+
+
+def _validate_category_id(model: 'Category', field: str, value):
+    """Category IDs should be URL-safe strings of at most 100 characters."""
+    _validate_identifier(model, field, value, max_length=100)
+    if not _CATEGORY_ID_VALID.fullmatch(value):
+        raise ValidationError("category_id must contain only letters, numbers, hyphens, and underscores")
+    return value
+
+
+def _validate_name(model: 'Category', field: str, value):
+    """Names are required and at most 200 characters."""
+    return _validate_identifier(model, field, value, max_length=200)
+
+
+def _validate_description(model: 'Category', field: str, value):
+    """Descriptions are optional and at most 1000 characters."""
+    if value is not None and len(value) > 1000:
+        raise ValidationError("description must be 1000 characters or less")
+    return value
+
+
+def _validate_parent_category_id(model: 'Category', field: str, value):
+    """A parent must be a short string and not the category itself."""
+    if value is not None:
+        if len(value) > 100:
+            raise ValidationError("parent_category_id must be a string of 100 characters or less")
+        # Prevent self-reference
+        if value == getattr(model, 'category_id', None):
+            raise ValidationError("category cannot be its own parent")
+    return value
 
 
 class Category(BaseModel):
@@ -30,47 +81,24 @@ class Category(BaseModel):
         'created_at': datetime
     }
     
+    # Fields live in slots; instances have no __dict__
+    __slots__ = tuple(FIELD_TYPES)
+    
     DEFAULTS = {
         'created_at': datetime.now
     }
     
-    def _validate_field(self, field: str, value):
-        """Custom validation for Category fields."""
-        # Call parent validation first
-        value = super()._validate_field(field, value)
-        
-        # Category ID validation
-        if field == 'category_id':
-            if not value or not isinstance(value, str):
-                raise ValidationError("category_id must be a non-empty string")
-            if len(value) > 100:
-                raise ValidationError("category_id must be 100 characters or less")
-            # Category IDs should be URL-safe
-            if not value.replace('_', '').replace('-', '').isalnum():
-                raise ValidationError("category_id must contain only letters, numbers, hyphens, and underscores")
-        
-        # Name validation
-        elif field == 'name':
-            if not value or not isinstance(value, str):
-                raise ValidationError("name must be a non-empty string")
-            if len(value) > 200:
-                raise ValidationError("name must be 200 characters or less")
-        
-        # Description validation
-        elif field == 'description':
-            if value is not None and len(value) > 1000:
-                raise ValidationError("description must be 1000 characters or less")
-        
-        # Parent category validation
-        elif field == 'parent_category_id':
-            if value is not None:
-                if not isinstance(value, str) or len(value) > 100:
-                    raise ValidationError("parent_category_id must be a string of 100 characters or less")
-                # Prevent self-reference
-                if hasattr(self, 'category_id') and value == self.category_id:
-                    raise ValidationError("category cannot be its own parent")
-        
-        return value
+    # A category cannot be its own parent
+    DEPENDENT_FIELDS = {
+        'category_id': ['parent_category_id']
+    }
+    
+    _FIELD_VALIDATORS = {
+        'category_id': _validate_category_id,
+        'name': _validate_name,
+        'description': _validate_description,
+        'parent_category_id': _validate_parent_category_id
+    }
     
     def get_primary_key(self) -> str:
         """Get the primary key value (category_id)."""
@@ -109,19 +137,18 @@ class Category(BaseModel):
         Returns:
             Generated category ID
         """
-        # Convert name to lowercase, replace spaces and special chars with underscores
-        category_id = name.lower()
-        # Replace spaces and special characters with underscores
-        import re
-        category_id = re.sub(r'[^a-z0-9_-]', '_', category_id)
-        # Replace multiple underscores with single underscore
-        category_id = re.sub(r'_+', '_', category_id)
-        # Remove leading/trailing underscores
-        category_id = category_id.strip('_')
+        # Names that are already IDs, e.g. machine-generated ones, need no cleanup
+        if _GENERATED_CATEGORY_ID.fullmatch(name):
+            category_id = name
+        else:
+            # Convert name to lowercase, replace spaces and special chars with underscores
+            category_id = name.lower().translate(_CATEGORY_ID_CHARS)
+            # Collapse runs of underscores and drop leading/trailing ones
+            category_id = '_'.join(filter(None, category_id.split('_')))
         
         # Ensure it's not empty and not too long
         if not category_id:
-            category_id = f"category_{uuid.uuid4().hex[:8]}"
+            category_id = f"category_{secrets.token_hex(4)}"
         elif len(category_id) > 80:
             category_id = category_id[:80]
         
@@ -135,7 +162,7 @@ class Category(BaseModel):
         Returns:
             Generated category ID
         """
-        return f"cat_{uuid.uuid4().hex[:8]}"
+        return f"cat_{secrets.token_hex(4)}"
     
     def is_root_category(self) -> bool:
         """
@@ -204,9 +231,22 @@ class Category(BaseModel):
         """
         Create default system categories.
         
+        The categories are validated once; later calls build fresh instances
+        from the validated fields with a current created_at.
+        
         Returns:
             List of default Category instances
         """
+        now = datetime.now()
+        return [
+            cls._from_validated({**fields, 'created_at': now})
+            for fields in cls._default_category_fields()
+        ]
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _default_category_fields(cls) -> Tuple[Dict[str, Any], ...]:
+        """Validated fields of the default system categories, built on first use."""
         categories = [
             cls(category_id='personal', name='Personal', 
                 description='Personal information, preferences, and experiences'),
@@ -225,4 +265,4 @@ class Category(BaseModel):
             cls(category_id='other', name='Other', 
                 description='Miscellaneous information that doesn\'t fit other categories')
         ]
-        return categories
\ No newline at end of file
+        return tuple(category._fields for category in categories)
@@ -2,9 +2,9 @@
 Factory classes for creating test model instances.
 """
 import random
-import uuid
+import string
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from .user import User
 from .memory import Memory
@@ -15,41 +15,80 @@ from .category import Category
 class ModelFactory:
     """Base factory class for creating test model instances."""
     
-    @staticmethod
-    def random_string(length: int = 10) -> str:
+    # Characters used by random_string()
+    ALPHABET = string.ascii_letters + string.digits
+    
+    # Random source shared by all factories; seed it for reproducible test data
+    RNG = random.Random()
+    
+    @classmethod
+    def random_string(cls, length: int = 10) -> str:
         """Generate a random string of specified length."""
-        import string
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return ''.join(cls.RNG.choices(cls.ALPHABET, k=length))
     
-    @staticmethod
-    def random_datetime(days_ago: int = 30) -> datetime:
+    @classmethod
+    def random_strings(cls, count: int, length: int = 10) -> List[str]:
+        """Generate count random strings of specified length with one random draw."""
+        pool = ''.join(cls.RNG.choices(cls.ALPHABET, k=count * length))
+        return [pool[i:i + length] for i in range(0, count * length, length)]
+    
+    @classmethod
+    def random_datetime(cls, days_ago: int = 30) -> datetime:
         """Generate a random datetime within the last N days."""
         now = datetime.now()
-        delta = timedelta(days=random.randint(0, days_ago))
+        delta = timedelta(days=cls.RNG.randint(0, days_ago))
         return now - delta
     
+    @classmethod
+    def random_datetimes(cls, count: int, days_ago: int = 30,
+                         now: Optional[datetime] = None) -> List[datetime]:
+        """Generate count random datetimes within the last N days of one reference time."""
+        now = now or datetime.now()
+        return [now - timedelta(days=days) for days in cls.RNG.choices(range(days_ago + 1), k=count)]
+    
     @staticmethod
-    def random_choice(choices: List[any]) -> any:
+    def batch_kwargs(common_kwargs: Dict[str, Any], **columns: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Build per-instance keyword arguments for a batch.
+        
+        Args:
+            common_kwargs: Fields shared by all instances; these win over generated values
+            **columns: Generated values per field, one per instance
+            
+        Returns:
+            One kwargs dictionary per instance
+        """
+        fields = list(columns)
+        return [
+            {**dict(zip(fields, values)), **common_kwargs}
+            for values in zip(*columns.values())
+        ]
+    
+    @classmethod
+    def random_choice(cls, choices: Sequence[Any]) -> Any:
         """Pick a random choice from a list."""
-        return random.choice(choices)
+        return cls.RNG.choice(choices)
 
 
 class UserFactory(ModelFactory):
     """Factory for creating User test instances."""
     
-    SAMPLE_SETTINGS = [
+    SAMPLE_SETTINGS = (
         {'theme': 'dark', 'language': 'en', 'notifications': True},
         {'theme': 'light', 'language': 'es', 'notifications': False},
         {'theme': 'auto', 'language': 'fr', 'notifications': True, 'timezone': 'UTC'},
         {'theme': 'dark', 'language': 'en', 'auto_save': True, 'privacy_mode': False}
-    ]
+    )
     
-    SAMPLE_METADATA = [
+    SAMPLE_METADATA = (
         {'signup_date': '2024-01-15', 'source': 'web', 'plan': 'free'},
         {'signup_date': '2024-02-20', 'source': 'mobile', 'plan': 'premium'},
         {'signup_date': '2024-03-10', 'source': 'referral', 'plan': 'free', 'referrer': 'friend'},
         {'beta_tester': True, 'features': ['advanced_search', 'export']}
-    ]
+    )
+    
+    _N_SETTINGS = len(SAMPLE_SETTINGS)
+    _N_METADATA = len(SAMPLE_METADATA)
     
     @classmethod
     def create(cls, user_id: Optional[str] = None, **kwargs) -> User:
@@ -66,16 +105,12 @@ class UserFactory(ModelFactory):
         if user_id is None:
             user_id = f"test_user_{cls.random_string(8)}"
         
-        defaults = {
-            'user_id': user_id,
-            'created_at': cls.random_datetime(90),
-            'updated_at': cls.random_datetime(7),
-            'settings': cls.random_choice(cls.SAMPLE_SETTINGS).copy(),
-            'metadata': cls.random_choice(cls.SAMPLE_METADATA).copy()
-        }
-        
-        defaults.update(kwargs)
-        return User(**defaults)
+        kwargs['user_id'] = user_id
+        kwargs.setdefault('created_at', cls.random_datetime(90))
+        kwargs.setdefault('updated_at', cls.random_datetime(7))
+        kwargs.setdefault('settings', cls.SAMPLE_SETTINGS[cls.RNG.randrange(cls._N_SETTINGS)].copy())
+        kwargs.setdefault('metadata', cls.SAMPLE_METADATA[cls.RNG.randrange(cls._N_METADATA)].copy())
+        return User(**kwargs)
     
     @classmethod
     def create_batch(cls, count: int, **common_kwargs) -> List[User]:
@@ -89,7 +124,16 @@ class UserFactory(ModelFactory):
         Returns:
             List of User instances
         """
-        return [cls.create(**common_kwargs) for _ in range(count)]
+        now = datetime.now()
+        columns = {
+            'created_at': cls.random_datetimes(count, 90, now),
+            'updated_at': cls.random_datetimes(count, 7, now)
+        }
+        if 'user_id' not in common_kwargs:
+            columns['user_id'] = [f"test_user_{suffix}" for suffix in cls.random_strings(count, 8)]
+        
+        create = cls.create
+        return [create(**kwargs) for kwargs in cls.batch_kwargs(common_kwargs, **columns)]
     
     @classmethod
     def create_simple(cls, user_id: Optional[str] = None) -> User:
@@ -115,7 +159,7 @@ class UserFactory(ModelFactory):
 class MemoryFactory(ModelFactory):
     """Factory for creating Memory test instances."""
     
-    SAMPLE_CONTENTS = [
+    SAMPLE_CONTENTS = (
         "I love playing guitar in my free time",
         "My favorite restaurant is the Italian place downtown",
         "I have a meeting with the client tomorrow at 3 PM",
@@ -126,20 +170,27 @@ class MemoryFactory(ModelFactory):
         "My birthday is on March 15th",
         "I'm learning Spanish and practicing daily",
         "The project deadline is next Wednesday"
-    ]
+    )
     
-    SAMPLE_CATEGORIES = [
+    SAMPLE_CATEGORIES = (
         'personal', 'work', 'preferences', 'facts', 'goals', 
         'events', 'relationships', 'shopping', 'entertainment'
-    ]
+    )
     
-    SAMPLE_ORIGINAL_MESSAGES = [
+    SAMPLE_ORIGINAL_MESSAGES = (
         "Hey, I just wanted to mention that I really love playing guitar when I have some free time.",
         "You know that Italian restaurant downtown? That's my absolute favorite place to eat.",
         "Just a reminder that I have that important client meeting scheduled for tomorrow at 3 PM.",
         "I've been thinking about my work schedule, and I really prefer working from home on Fridays.",
         "I should tell you about my pet - I have a cat named Whiskers who is 3 years old."
-    ]
+    )
+    
+    SAMPLE_IMPORTANCE = ('low', 'medium', 'high')
+    
+    _N_CONTENTS = len(SAMPLE_CONTENTS)
+    _N_CATEGORIES = len(SAMPLE_CATEGORIES)
+    _N_ORIGINAL_MESSAGES = len(SAMPLE_ORIGINAL_MESSAGES)
+    _N_IMPORTANCE = len(SAMPLE_IMPORTANCE)
     
     @classmethod
     def create(cls, memory_id: Optional[str] = None, user_id: Optional[str] = None, **kwargs) -> Memory:
@@ -159,22 +210,19 @@ class MemoryFactory(ModelFactory):
         if user_id is None:
             user_id = f"test_user_{cls.random_string(8)}"
         
-        defaults = {
-            'memory_id': memory_id,
-            'user_id': user_id,
-            'content': cls.random_choice(cls.SAMPLE_CONTENTS),
-            'original_message': cls.random_choice(cls.SAMPLE_ORIGINAL_MESSAGES),
-            'category': cls.random_choice(cls.SAMPLE_CATEGORIES),
-            'confidence_score': round(random.uniform(0.7, 1.0), 2),
-            'timestamp': cls.random_datetime(30),
-            'created_at': cls.random_datetime(30),
-            'updated_at': cls.random_datetime(7),
-            'metadata': {'source': 'test', 'importance': cls.random_choice(['low', 'medium', 'high'])},
-            'is_active': True
-        }
-        
-        defaults.update(kwargs)
-        return Memory(**defaults)
+        index = cls.RNG.randrange
+        kwargs['memory_id'] = memory_id
+        kwargs['user_id'] = user_id
+        kwargs.setdefault('content', cls.SAMPLE_CONTENTS[index(cls._N_CONTENTS)])
+        kwargs.setdefault('original_message', cls.SAMPLE_ORIGINAL_MESSAGES[index(cls._N_ORIGINAL_MESSAGES)])
+        kwargs.setdefault('category', cls.SAMPLE_CATEGORIES[index(cls._N_CATEGORIES)])
+        kwargs.setdefault('confidence_score', round(cls.RNG.uniform(0.7, 1.0), 2))
+        kwargs.setdefault('timestamp', cls.random_datetime(30))
+        kwargs.setdefault('created_at', cls.random_datetime(30))
+        kwargs.setdefault('updated_at', cls.random_datetime(7))
+        kwargs.setdefault('metadata', {'source': 'test', 'importance': cls.SAMPLE_IMPORTANCE[index(cls._N_IMPORTANCE)]})
+        kwargs.setdefault('is_active', True)
+        return Memory(**kwargs)
     
     @classmethod
     def create_batch(cls, count: int, user_id: Optional[str] = None, **common_kwargs) -> List[Memory]:
@@ -192,7 +240,17 @@ class MemoryFactory(ModelFactory):
         if user_id is None:
             user_id = f"test_user_{cls.random_string(8)}"
         
-        return [cls.create(user_id=user_id, **common_kwargs) for _ in range(count)]
+        now = datetime.now()
+        columns = {
+            'timestamp': cls.random_datetimes(count, 30, now),
+            'created_at': cls.random_datetimes(count, 30, now),
+            'updated_at': cls.random_datetimes(count, 7, now)
+        }
+        if 'memory_id' not in common_kwargs:
+            columns['memory_id'] = [f"test_mem_{suffix}" for suffix in cls.random_strings(count, 10)]
+        
+        create = cls.create
+        return [create(user_id=user_id, **kwargs) for kwargs in cls.batch_kwargs(common_kwargs, **columns)]
     
     @classmethod
     def create_simple(cls, user_id: str, content: str, memory_id: Optional[str] = None) -> Memory:
@@ -240,24 +298,20 @@ class SessionFactory(ModelFactory):
             user_id = f"test_user_{cls.random_string(8)}"
         
         started_at = cls.random_datetime(7)
-        is_active = random.choice([True, False])
-        ended_at = None if is_active else started_at + timedelta(minutes=random.randint(5, 120))
-        
-        defaults = {
-            'session_id': session_id,
-            'user_id': user_id,
-            'started_at': started_at,
-            'ended_at': ended_at,
-            'message_count': random.randint(1, 50),
-            'memories_created': random.randint(0, 10),
-            'metadata': {
-                'platform': cls.random_choice(['web', 'mobile', 'cli']),
-                'version': cls.random_choice(['1.0.0', '1.1.0', '1.2.0'])
-            }
-        }
+        is_active = cls.RNG.choice((True, False))
+        ended_at = None if is_active else started_at + timedelta(minutes=cls.RNG.randint(5, 120))
         
-        defaults.update(kwargs)
-        return Session(**defaults)
+        kwargs['session_id'] = session_id
+        kwargs['user_id'] = user_id
+        kwargs.setdefault('started_at', started_at)
+        kwargs.setdefault('ended_at', ended_at)
+        kwargs.setdefault('message_count', cls.RNG.randint(1, 50))
+        kwargs.setdefault('memories_created', cls.RNG.randint(0, 10))
+        kwargs.setdefault('metadata', {
+            'platform': cls.random_choice(('web', 'mobile', 'cli')),
+            'version': cls.random_choice(('1.0.0', '1.1.0', '1.2.0'))
+        })
+        return Session(**kwargs)
     
     @classmethod
     def create_active(cls, user_id: Optional[str] = None, **kwargs) -> Session:
@@ -289,7 +343,7 @@ class SessionFactory(ModelFactory):
         # Ensure started_at is set first
         started_at = kwargs.get('started_at', cls.random_datetime(7))
         kwargs['started_at'] = started_at
-        kwargs['ended_at'] = started_at + timedelta(minutes=random.randint(5, 120))
+        kwargs['ended_at'] = started_at + timedelta(minutes=cls.RNG.randint(5, 120))
         return cls.create(user_id=user_id, **kwargs)
     
     @classmethod
@@ -308,13 +362,20 @@ class SessionFactory(ModelFactory):
         if user_id is None:
             user_id = f"test_user_{cls.random_string(8)}"
         
-        return [cls.create(user_id=user_id, **common_kwargs) for _ in range(count)]
+        create = cls.create
+        if 'session_id' in common_kwargs:
+            return [create(user_id=user_id, **common_kwargs) for _ in range(count)]
+        
+        return [
+            create(session_id=f"test_sess_{suffix}", user_id=user_id, **common_kwargs)
+            for suffix in cls.random_strings(count, 8)
+        ]
 
 
 class CategoryFactory(ModelFactory):
     """Factory for creating Category test instances."""
     
-    SAMPLE_CATEGORIES = [
+    SAMPLE_CATEGORIES = (
         ('work', 'Work', 'Work-related information and tasks'),
         ('personal', 'Personal', 'Personal life and experiences'),
         ('hobbies', 'Hobbies', 'Leisure activities and interests'),
@@ -323,7 +384,7 @@ class CategoryFactory(ModelFactory):
         ('food', 'Food', 'Food preferences and recipes'),
         ('technology', 'Technology', 'Tech-related information'),
         ('finance', 'Finance', 'Financial information and planning')
-    ]
+    )
     
     @classmethod
     def create(cls, category_id: Optional[str] = None, name: Optional[str] = None, **kwargs) -> Category:
@@ -344,14 +405,10 @@ class CategoryFactory(ModelFactory):
             name = name or sample_name
             kwargs.setdefault('description', sample_desc)
         
-        defaults = {
-            'category_id': category_id,
-            'name': name,
-            'created_at': cls.random_datetime(30)
-        }
-        
-        defaults.update(kwargs)
-        return Category(**defaults)
+        kwargs['category_id'] = category_id
+        kwargs['name'] = name
+        kwargs.setdefault('created_at', cls.random_datetime(30))
+        return Category(**kwargs)
     
     @classmethod
     def create_hierarchy(cls) -> List[Category]:
@@ -361,44 +418,41 @@ class CategoryFactory(ModelFactory):
         Returns:
             List of Category instances with parent-child relationships
         """
-        categories = []
+        # Fixed, known-good values: skip field validation
         
         # Root categories
-        work = Category(category_id='work', name='Work', description='Work-related information')
-        personal = Category(category_id='personal', name='Personal', description='Personal information')
-        categories.extend([work, personal])
+        work = Category._unchecked(category_id='work', name='Work', description='Work-related information')
+        personal = Category._unchecked(category_id='personal', name='Personal', description='Personal information')
         
         # Work subcategories
-        meetings = Category(
+        meetings = Category._unchecked(
             category_id='work_meetings', 
             name='Meetings', 
             description='Work meetings and appointments',
             parent_category_id='work'
         )
-        projects = Category(
+        projects = Category._unchecked(
             category_id='work_projects', 
             name='Projects', 
             description='Work projects and tasks',
             parent_category_id='work'
         )
-        categories.extend([meetings, projects])
         
         # Personal subcategories
-        family = Category(
+        family = Category._unchecked(
             category_id='personal_family', 
             name='Family', 
             description='Family-related information',
             parent_category_id='personal'
         )
-        hobbies = Category(
+        hobbies = Category._unchecked(
             category_id='personal_hobbies', 
             name='Hobbies', 
             description='Personal hobbies and interests',
             parent_category_id='personal'
         )
-        categories.extend([family, hobbies])
         
-        return categories
+        return [work, personal, meetings, projects, family, hobbies]
     
     @classmethod
     def create_default(cls) -> List[Category]:
@@ -422,4 +476,7 @@ class CategoryFactory(ModelFactory):
         Returns:
             List of Category instances
         """
-        return [cls.create(**common_kwargs) for _ in range(count)]
\ No newline at end of file
+        columns = {'created_at': cls.random_datetimes(count, 30)}
+        
+        create = cls.create
+        return [create(**kwargs) for kwargs in cls.batch_kwargs(common_kwargs, **columns)]
\ No newline at end of file
@@ -1,11 +1,41 @@
 """
 Memory model for the Harmonia Memory Storage System.
 """
-import uuid
-from datetime import datetime
-from typing import Dict, Optional
+import secrets
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
 
-from .base import BaseModel, ValidationError
+from .base import BaseModel, ValidationError, _validate_identifier
+
+
+def _validate_content(model: 'Memory', field: str, value):
+    """Content is required; 10000 characters is a reasonable limit for a memory."""
+    return _validate_identifier(model, field, value, max_length=10000)
+
+
+def _validate_category(model: 'Memory', field: str, value):
+    """Category must be a short string; few distinct ones are shared by many memories."""
+    if value is None:
+        return value
+    if len(value) > 100:
+        raise ValidationError("category must be a string of 100 characters or less")
+    # Keep one copy of each category string
+    return sys.intern(value)
+
+
+def _validate_confidence_score(model: 'Memory', field: str, value):
+    """Confidence score must be between 0.0 and 1.0."""
+    if value is not None and not 0.0 <= value <= 1.0:
+        raise ValidationError("confidence_score must be between 0.0 and 1.0")
+    return value
+
+
+def _validate_original_message(model: 'Memory', field: str, value):
+    """Original messages get a large limit."""
+    if value is not None and len(value) > 50000:
+        raise ValidationError("original_message must be 50000 characters or less")
+    return value
 
 
 class Memory(BaseModel):
@@ -44,6 +74,9 @@ class Memory(BaseModel):
         'is_active': bool
     }
     
+    # Fields live in slots; instances have no __dict__
+    __slots__ = tuple(FIELD_TYPES)
+    
     DEFAULTS = {
         'created_at': datetime.now,
         'updated_at': datetime.now,
@@ -51,61 +84,14 @@ class Memory(BaseModel):
         'is_active': True
     }
     
-    def _validate_field(self, field: str, value):
-        """Custom validation for Memory fields."""
-        # Call parent validation first
-        value = super()._validate_field(field, value)
-        
-        # Memory ID validation
-        if field == 'memory_id':
-            if not value or not isinstance(value, str):
-                raise ValidationError("memory_id must be a non-empty string")
-            if len(value) > 255:
-                raise ValidationError("memory_id must be 255 characters or less")
-        
-        # User ID validation
-        elif field == 'user_id':
-            if not value or not isinstance(value, str):
-                raise ValidationError("user_id must be a non-empty string")
-            if len(value) > 255:
-                raise ValidationError("user_id must be 255 characters or less")
-        
-        # Content validation
-        elif field == 'content':
-            if not value or not isinstance(value, str):
-                raise ValidationError("content must be a non-empty string")
-            if len(value) > 10000:  # Reasonable limit for memory content
-                raise ValidationError("content must be 10000 characters or less")
-        
-        # Category validation
-        elif field == 'category':
-            if value is not None and (not isinstance(value, str) or len(value) > 100):
-                raise ValidationError("category must be a string of 100 characters or less")
-        
-        # Confidence score validation
-        elif field == 'confidence_score':
-            if value is not None:
-                if not isinstance(value, (int, float)):
-                    raise ValidationError("confidence_score must be a number")
-                if not 0.0 <= value <= 1.0:
-                    raise ValidationError("confidence_score must be between 0.0 and 1.0")
-        
-        # Original message validation
-        elif field == 'original_message':
-            if value is not None and len(value) > 50000:  # Large limit for original messages
-                raise ValidationError("original_message must be 50000 characters or less")
-        
-        # Metadata validation
-        elif field == 'metadata':
-            if value is not None and not isinstance(value, dict):
-                raise ValidationError("metadata must be a dictionary")
-        
-        # Boolean validation
-        elif field == 'is_active':
-            if value is not None and not isinstance(value, bool):
-                raise ValidationError("is_active must be a boolean")
-        
-        return value
+    _FIELD_VALIDATORS = {
+        'memory_id': _validate_identifier,
+        'user_id': _validate_identifier,
+        'content': _validate_content,
+        'category': _validate_category,
+        'confidence_score': _validate_confidence_score,
+        'original_message': _validate_original_message
+    }
     
     def get_primary_key(self) -> str:
         """Get the primary key value (memory_id)."""
@@ -153,20 +139,22 @@ class Memory(BaseModel):
         Returns:
             Generated memory ID
         """
-        return f"mem_{uuid.uuid4().hex[:12]}"
+        return f"mem_{secrets.token_hex(6)}"
     
-    def update_content(self, content: str, confidence_score: Optional[float] = None) -> None:
+    def update_content(self, content: str, confidence_score: Optional[float] = None,
+                       updated_at: Optional[datetime] = None) -> None:
         """
         Update memory content and confidence score.
         
         Args:
             content: New content
             confidence_score: New confidence score
+            updated_at: When the memory was updated (defaults to now)
         """
         self.content = content
         if confidence_score is not None:
             self.confidence_score = confidence_score
-        self.updated_at = datetime.now()
+        self.updated_at = updated_at or datetime.now()
     
     def update_metadata(self, **metadata) -> None:
         """
@@ -175,9 +163,7 @@ class Memory(BaseModel):
         Args:
             **metadata: Metadata to update
         """
-        current_metadata = self.metadata.copy()
-        current_metadata.update(metadata)
-        self.metadata = current_metadata
+        self.metadata = {**self.metadata, **metadata}
         self.updated_at = datetime.now()
     
     def get_metadata(self, key: str, default=None):
@@ -193,46 +179,108 @@ class Memory(BaseModel):
         """
         return self.metadata.get(key, default)
     
-    def soft_delete(self) -> None:
-        """Mark memory as inactive (soft delete)."""
+    def soft_delete(self, updated_at: Optional[datetime] = None) -> None:
+        """
+        Mark memory as inactive (soft delete).
+        
+        Args:
+            updated_at: When the memory was deleted (defaults to now)
+        """
         self.is_active = False
-        self.updated_at = datetime.now()
+        self.updated_at = updated_at or datetime.now()
     
-    def restore(self) -> None:
-        """Restore soft-deleted memory."""
+    def restore(self, updated_at: Optional[datetime] = None) -> None:
+        """
+        Restore soft-deleted memory.
+        
+        Args:
+            updated_at: When the memory was restored (defaults to now)
+        """
         self.is_active = True
-        self.updated_at = datetime.now()
+        self.updated_at = updated_at or datetime.now()
     
-    def set_category(self, category: Optional[str]) -> None:
+    def set_category(self, category: Optional[str], updated_at: Optional[datetime] = None) -> None:
         """
         Set the memory category.
         
         Args:
             category: Category to set
+            updated_at: When the memory was updated (defaults to now)
         """
         self.category = category
-        self.updated_at = datetime.now()
+        self.updated_at = updated_at or datetime.now()
     
-    def get_age_days(self) -> int:
+    def get_age_days(self, now: Optional[datetime] = None) -> int:
         """
         Get the age of the memory in days.
         
+        Args:
+            now: Time to measure the age at (defaults to now)
+            
         Returns:
             Age in days since creation
         """
-        if not self.created_at:
+        created_at = self.created_at
+        if not created_at:
             return 0
-        delta = datetime.now() - self.created_at
-        return delta.days
+        return ((now or datetime.now()) - created_at).days
     
-    def is_recent(self, days: int = 7) -> bool:
+    @staticmethod
+    def recent_cutoff(days: int = 7, now: Optional[datetime] = None) -> datetime:
+        """
+        Get the creation time a memory must be after to be recent.
+        
+        is_recent(days) is created_at > recent_cutoff(days), so a caller
+        checking many memories can compute the cutoff once and compare
+        created_at against it.
+        
+        Args:
+            days: Number of days to consider recent
+            now: Time to measure ages at (defaults to now)
+            
+        Returns:
+            Exclusive lower bound on created_at
+        """
+        # An age of at most `days` whole days is less than days + 1 days
+        return (now or datetime.now()) - timedelta(days=days + 1)
+    
+    def is_recent(self, days: int = 7, now: Optional[datetime] = None) -> bool:
         """
         Check if memory is recent (within specified days).
         
         Args:
             days: Number of days to consider recent
+            now: Time to measure the age at (defaults to now)
             
         Returns:
             True if memory is recent
         """
-        return self.get_age_days() <= days
\ No newline at end of file
+        created_at = self.created_at
+        if not created_at:
+            # A memory without a creation time has an age of 0 days
+            return days >= 0
+        return ((now or datetime.now()) - created_at).days <= days
+    
+    @classmethod
+    def filter_recent(cls, memories: Iterable['Memory'], days: int = 7,
+                      now: Optional[datetime] = None) -> List['Memory']:
+        """
+        Select the memories that are recent (within specified days).
+        
+        Gives the same result as calling is_recent on each memory, but
+        compares created_at against a single cutoff.
+        
+        Args:
+            memories: Memories to filter
+            days: Number of days to consider recent
+            now: Time to measure ages at (defaults to now)
+            
+        Returns:
+            The recent memories, in their original order
+        """
+        cutoff = cls.recent_cutoff(days, now)
+        include_undated = days >= 0
+        return [
+            memory for memory in memories
+            if (memory.created_at > cutoff if memory.created_at else include_undated)
+        ]
\ No newline at end of file
@@ -1,11 +1,21 @@
 """
 Session model for the Harmonia Memory Storage System.
 """
-import uuid
+import secrets
 from datetime import datetime
 from typing import Dict, Optional
 
-from .base import BaseModel, ValidationError
+from .base import (
+    BaseModel, ValidationError, _validate_identifier, _validate_non_negative
+)
+
+
+def _validate_ended_at(model: 'Session', field: str, value):
+    """A session cannot end before it started."""
+    started_at = getattr(model, 'started_at', None)
+    if value is not None and started_at and value < started_at:
+        raise ValidationError("ended_at cannot be before started_at")
+    return value
 
 
 class Session(BaseModel):
@@ -34,6 +44,9 @@ class Session(BaseModel):
         'metadata': dict
     }
     
+    # Fields live in slots; instances have no __dict__
+    __slots__ = tuple(FIELD_TYPES)
+    
     DEFAULTS = {
         'started_at': datetime.now,
         'message_count': 0,
@@ -41,47 +54,18 @@ class Session(BaseModel):
         'metadata': dict
     }
     
-    def _validate_field(self, field: str, value):
-        """Custom validation for Session fields."""
-        # Call parent validation first
-        value = super()._validate_field(field, value)
-        
-        # Session ID validation
-        if field == 'session_id':
-            if not value or not isinstance(value, str):
-                raise ValidationError("session_id must be a non-empty string")
-            if len(value) > 255:
-                raise ValidationError("session_id must be 255 characters or less")
-        
-        # User ID validation
-        elif field == 'user_id':
-            if not value or not isinstance(value, str):
-                raise ValidationError("user_id must be a non-empty string")
-            if len(value) > 255:
-                raise ValidationError("user_id must be 255 characters or less")
-        
-        # Message count validation
-        elif field == 'message_count':
-            if value is not None and (not isinstance(value, int) or value < 0):
-                raise ValidationError("message_count must be a non-negative integer")
-        
-        # Memories created validation
-        elif field == 'memories_created':
-            if value is not None and (not isinstance(value, int) or value < 0):
-                raise ValidationError("memories_created must be a non-negative integer")
-        
-        # Metadata validation
-        elif field == 'metadata':
-            if value is not None and not isinstance(value, dict):
-                raise ValidationError("metadata must be a dictionary")
-        
-        # Date logic validation
-        elif field == 'ended_at':
-            if value is not None and hasattr(self, 'started_at') and self.started_at:
-                if value < self.started_at:
-                    raise ValidationError("ended_at cannot be before started_at")
-        
-        return value
+    # ended_at is checked against started_at
+    DEPENDENT_FIELDS = {
+        'started_at': ['ended_at']
+    }
+    
+    _FIELD_VALIDATORS = {
+        'session_id': _validate_identifier,
+        'user_id': _validate_identifier,
+        'message_count': _validate_non_negative,
+        'memories_created': _validate_non_negative,
+        'ended_at': _validate_ended_at
+    }
     
     def get_primary_key(self) -> str:
         """Get the primary key value (session_id)."""
@@ -114,7 +98,7 @@ class Session(BaseModel):
         Returns:
             Generated session ID
         """
-        return f"sess_{uuid.uuid4().hex[:10]}"
+        return f"sess_{secrets.token_hex(5)}"
     
     def is_active(self) -> bool:
         """
@@ -173,9 +157,7 @@ class Session(BaseModel):
         Args:
             **metadata: Metadata to update
         """
-        current_metadata = self.metadata.copy()
-        current_metadata.update(metadata)
-        self.metadata = current_metadata
+        self.metadata = {**self.metadata, **metadata}
     
     def get_metadata(self, key: str, default=None):
         """
@@ -205,17 +187,27 @@ class Session(BaseModel):
         """
         Get a summary of the session.
         
+        Computes the same values as is_active(), get_current_duration_minutes()
+        and get_memories_per_message_ratio(), reading each field once. The
+        ISO timestamps come from the to_dict() cache, so they are formatted
+        once until a field changes.
+        
         Returns:
             Dictionary with session summary
         """
+        started_at = self.started_at
+        ended_at = self.ended_at
+        message_count = self.message_count
+        memories_created = self.memories_created
+        serialized = self._serialized_fields()
         return {
             'session_id': self.session_id,
             'user_id': self.user_id,
-            'is_active': self.is_active(),
-            'duration_minutes': self.get_current_duration_minutes(),
-            'message_count': self.message_count,
-            'memories_created': self.memories_created,
-            'memory_ratio': self.get_memories_per_message_ratio(),
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'ended_at': self.ended_at.isoformat() if self.ended_at else None
+            'is_active': ended_at is None,
+            'duration_minutes': ((ended_at or datetime.now()) - started_at).total_seconds() / 60.0,
+            'message_count': message_count,
+            'memories_created': memories_created,
+            'memory_ratio': memories_created / message_count if message_count else 0.0,
+            'started_at': serialized['started_at'],
+            'ended_at': serialized['ended_at']
         }
\ No newline at end of file
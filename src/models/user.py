@@ -1,11 +1,11 @@
 """
 User model for the Harmonia Memory Storage System.
 """
-import uuid
+import secrets
 from datetime import datetime
 from typing import Dict, Optional
 
-from .base import BaseModel, ValidationError
+from .base import BaseModel, ValidationError, _validate_identifier
 
 
 class User(BaseModel):
@@ -30,6 +30,9 @@ class User(BaseModel):
         'metadata': dict
     }
     
+    # Fields live in slots; instances have no __dict__
+    __slots__ = tuple(FIELD_TYPES)
+    
     DEFAULTS = {
         'created_at': datetime.now,
         'updated_at': datetime.now,
@@ -37,29 +40,9 @@ class User(BaseModel):
         'metadata': dict
     }
     
-    def _validate_field(self, field: str, value):
-        """Custom validation for User fields."""
-        # Call parent validation first
-        value = super()._validate_field(field, value)
-        
-        # User ID validation
-        if field == 'user_id':
-            if not value or not isinstance(value, str):
-                raise ValidationError("user_id must be a non-empty string")
-            if len(value) > 255:
-                raise ValidationError("user_id must be 255 characters or less")
-        
-        # Settings validation
-        elif field == 'settings':
-            if value is not None and not isinstance(value, dict):
-                raise ValidationError("settings must be a dictionary")
-        
-        # Metadata validation
-        elif field == 'metadata':
-            if value is not None and not isinstance(value, dict):
-                raise ValidationError("metadata must be a dictionary")
-        
-        return value
+    _FIELD_VALIDATORS = {
+        'user_id': _validate_identifier
+    }
     
     def get_primary_key(self) -> str:
         """Get the primary key value (user_id)."""
@@ -93,7 +76,7 @@ class User(BaseModel):
         Returns:
             Generated user ID
         """
-        return f"user_{uuid.uuid4().hex[:8]}"
+        return f"user_{secrets.token_hex(4)}"
     
     def update_settings(self, **settings) -> None:
         """
@@ -102,9 +85,7 @@ class User(BaseModel):
         Args:
             **settings: Settings to update
         """
-        current_settings = self.settings.copy()
-        current_settings.update(settings)
-        self.settings = current_settings
+        self.settings = {**self.settings, **settings}
         self.updated_at = datetime.now()
     
     def update_metadata(self, **metadata) -> None:
@@ -114,9 +95,7 @@ class User(BaseModel):
         Args:
             **metadata: Metadata to update
         """
-        current_metadata = self.metadata.copy()
-        current_metadata.update(metadata)
-        self.metadata = current_metadata
+        self.metadata = {**self.metadata, **metadata}
         self.updated_at = datetime.now()
     
     def get_setting(self, key: str, default=None):
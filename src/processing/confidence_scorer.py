@@ -2,6 +2,7 @@
 Confidence scoring for extracted memories.
 """
 import math
+import re
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
@@ -10,6 +11,13 @@ from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Explicit dates, clock times and relative durations in temporal info
+_DATE_PATTERNS = [
+    re.compile(r'\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}'),
+    re.compile(r'\d{1,2}:\d{2}'),
+    re.compile(r'\b\d+\s+(?:days?|weeks?|months?|years?)\b')
+]
+
 
 @dataclass
 class ConfidenceFactors:
@@ -225,15 +233,8 @@ class ConfidenceScorer:
             consistency_score += 0.3
         
         # Check for date patterns
-        import re
-        date_patterns = [
-            r'\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4}',
-            r'\d{1,2}:\d{2}',
-            r'\b\d+\s+(?:days?|weeks?|months?|years?)\b'
-        ]
-        
-        for pattern in date_patterns:
-            if re.search(pattern, temporal_info):
+        for pattern in _DATE_PATTERNS:
+            if pattern.search(temporal_info):
                 consistency_score += 0.2
                 break
         
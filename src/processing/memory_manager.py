@@ -10,14 +10,13 @@ This module provides the main interface for memory operations, integrating:
 - Transaction management
 """
 import uuid
-import json
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 from models.memory import Memory
-from db.manager import DatabaseManager, DatabaseError
+from db.manager import DatabaseManager, DatabaseError, load_json
 from processing.conflict_detector import ConflictDetector, Conflict
 from processing.conflict_resolver import ConflictResolver, Resolution, ResolutionAction, UserPreferences
 from processing.temporal_resolver import TemporalResolver
@@ -736,10 +735,13 @@ class MemoryManager:
             # Direct query using provided connection
             # Note: Avoid using FTS for simple similarity check
             cursor = conn.execute("""
-                SELECT * FROM memories
+                SELECT memory_id, user_id, content, original_message, category,
+                       confidence_score, timestamp, created_at, updated_at,
+                       metadata, NULL AS embedding, deleted_at IS NULL AS is_active
+                FROM memories
                 WHERE user_id = ? 
                 AND memory_id != ?
-                AND is_active = 1
+                AND deleted_at IS NULL
                 AND category = ?
                 ORDER BY confidence_score DESC
                 LIMIT ?
@@ -749,7 +751,7 @@ class MemoryManager:
             for row in cursor:
                 memory_dict = dict(row)
                 if memory_dict.get('metadata'):
-                    memory_dict['metadata'] = json.loads(memory_dict['metadata'])
+                    memory_dict['metadata'] = load_json(memory_dict['metadata'])
                 if memory_dict.get('timestamp') and isinstance(memory_dict['timestamp'], str):
                     memory_dict['timestamp'] = datetime.fromisoformat(memory_dict['timestamp'])
                 similar_memories.append(Memory(**memory_dict))
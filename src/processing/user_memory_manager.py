@@ -393,7 +393,7 @@ class UserMemoryManager:
                      max_confidence: Optional[float] = None) -> Dict[str, Any]:
         """List memories with filtering and pagination."""
         try:
-            memories = self.db_manager.list_memories(
+            memories, total_count = self.db_manager.list_memories_with_total(
                 category=category,
                 limit=limit,
                 offset=offset,
@@ -405,14 +405,6 @@ class UserMemoryManager:
                 max_confidence=max_confidence
             )
             
-            total_count = self.db_manager.count_memories(
-                category=category,
-                from_date=from_date,
-                to_date=to_date,
-                min_confidence=min_confidence,
-                max_confidence=max_confidence
-            )
-            
             return {
                 'memories': memories,
                 'pagination': {
@@ -21,7 +21,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from models.memory import Memory
-from db.manager import DatabaseManager
+from db.manager import DatabaseManager, load_json, sql_timestamp
 from core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -78,6 +78,7 @@ class SearchOptions:
     sort_by: SortOption = SortOption.RELEVANCE
     sort_order: SortOrder = SortOrder.DESC
     include_inactive: bool = False
+    include_embeddings: bool = False
     boost_recent: bool = True
     boost_categories: List[str] = field(default_factory=list)
 
@@ -201,13 +202,13 @@ class SearchEngine:
             user_id: User ID to calculate stats for
         """
         try:
-            with self.db_manager.pool.get_connection() as conn:
+            with self.db_manager.read_pool.get_connection() as conn:
                 # Get total number of documents and average document length
                 cursor = conn.execute("""
                     SELECT COUNT(*) as total_docs,
                            AVG(LENGTH(content)) as avg_length
                     FROM memories 
-                    WHERE user_id = ? AND is_active = 1
+                    WHERE user_id = ? AND deleted_at IS NULL
                 """, (user_id,))
                 
                 row = cursor.fetchone()
@@ -219,7 +220,7 @@ class SearchEngine:
                 # This is expensive but necessary for proper BM25
                 cursor = conn.execute("""
                     SELECT content FROM memories 
-                    WHERE user_id = ? AND is_active = 1
+                    WHERE user_id = ? AND deleted_at IS NULL
                 """, (user_id,))
                 
                 term_doc_freq = defaultdict(int)
@@ -426,17 +427,29 @@ class SearchEngine:
             Raw database results
         """
         # Build base query
-        base_query = """
+        # Embeddings live in memory_embeddings; only join them when asked for
+        if options.include_embeddings:
+            embedding_column = "e.embedding"
+            embedding_join = "LEFT JOIN memory_embeddings e ON e.memory_id = m.memory_id"
+        else:
+            embedding_column = "NULL AS embedding"
+            embedding_join = ""
+        
+        base_query = f"""
             SELECT m.memory_id, m.user_id, m.content, m.original_message, m.category,
                    m.confidence_score, m.timestamp, m.created_at, m.updated_at,
-                   m.metadata, m.embedding, m.is_active,
+                   m.metadata, {embedding_column}, m.deleted_at IS NULL AS is_active,
                    fts.rank as fts_rank
             FROM memories m
-            JOIN memories_fts fts ON m.memory_id = fts.memory_id
-            WHERE m.user_id = ? AND m.is_active = ?
+            JOIN memories_fts fts ON fts.rowid = m.id
+            {embedding_join}
+            WHERE m.user_id = ?
         """
         
-        params = [user_id, not options.include_inactive]
+        params = [user_id]
+        
+        if not options.include_inactive:
+            base_query += " AND m.deleted_at IS NULL"
         
         # Add FTS query
         if fts_query != "*":
@@ -450,11 +463,11 @@ class SearchEngine:
         
         if filters.from_date:
             base_query += " AND m.created_at >= ?"
-            params.append(filters.from_date.isoformat())
+            params.append(sql_timestamp(filters.from_date))
         
         if filters.to_date:
             base_query += " AND m.created_at <= ?"
-            params.append(filters.to_date.isoformat())
+            params.append(sql_timestamp(filters.to_date))
         
         if filters.min_confidence is not None:
             base_query += " AND m.confidence_score >= ?"
@@ -472,7 +485,7 @@ class SearchEngine:
         
         # Execute query using database manager
         try:
-            with self.db_manager.pool.get_connection() as conn:
+            with self.db_manager.read_pool.get_connection() as conn:
                 cursor = conn.execute(base_query, params)
                 results = []
                 for row in cursor.fetchall():
@@ -481,8 +494,7 @@ class SearchEngine:
                     
                     # Parse JSON fields
                     if row_dict.get('metadata'):
-                        import json
-                        row_dict['metadata'] = json.loads(row_dict['metadata'])
+                        row_dict['metadata'] = load_json(row_dict['metadata'])
                     else:
                         row_dict['metadata'] = {}
                     
@@ -700,7 +712,7 @@ class SearchEngine:
         try:
             # Test FTS5 functionality
             test_query = "SELECT count(*) FROM memories_fts"
-            with self.db_manager.pool.get_connection() as conn:
+            with self.db_manager.read_pool.get_connection() as conn:
                 cursor = conn.execute(test_query)
                 result = cursor.fetchone()
                 health['components']['fts5'] = {
@@ -800,15 +812,29 @@ class SearchEngine:
             Raw database results
         """
         # Build base query
-        base_query = """
-            SELECT memory_id, user_id, content, original_message, category,
-                   confidence_score, timestamp, created_at, updated_at,
-                   metadata, embedding, is_active
-            FROM memories
-            WHERE user_id = ? AND is_active = ?
-        """
+        # Embeddings live in memory_embeddings; only join them when asked for
+        if options.include_embeddings:
+            base_query = """
+                SELECT m.memory_id, m.user_id, m.content, m.original_message, m.category,
+                       m.confidence_score, m.timestamp, m.created_at, m.updated_at,
+                       m.metadata, e.embedding, m.deleted_at IS NULL AS is_active
+                FROM memories m
+                LEFT JOIN memory_embeddings e ON e.memory_id = m.memory_id
+                WHERE m.user_id = ?
+            """
+        else:
+            base_query = """
+                SELECT memory_id, user_id, content, original_message, category,
+                       confidence_score, timestamp, created_at, updated_at,
+                       metadata, NULL AS embedding, deleted_at IS NULL AS is_active
+                FROM memories
+                WHERE user_id = ?
+            """
+        
+        params = [user_id]
         
-        params = [user_id, not options.include_inactive]
+        if not options.include_inactive:
+            base_query += " AND deleted_at IS NULL"
         
         # Add filters
         if filters.category:
@@ -817,11 +843,11 @@ class SearchEngine:
         
         if filters.from_date:
             base_query += " AND created_at >= ?"
-            params.append(filters.from_date.isoformat())
+            params.append(sql_timestamp(filters.from_date))
         
         if filters.to_date:
             base_query += " AND created_at <= ?"
-            params.append(filters.to_date.isoformat())
+            params.append(sql_timestamp(filters.to_date))
         
         if filters.min_confidence is not None:
             base_query += " AND confidence_score >= ?"
@@ -840,7 +866,7 @@ class SearchEngine:
         
         # Execute query using database manager
         try:
-            with self.db_manager.pool.get_connection() as conn:
+            with self.db_manager.read_pool.get_connection() as conn:
                 cursor = conn.execute(base_query, params)
                 results = []
                 for row in cursor.fetchall():
@@ -849,8 +875,7 @@ class SearchEngine:
                     
                     # Parse JSON fields
                     if row_dict.get('metadata'):
-                        import json
-                        row_dict['metadata'] = json.loads(row_dict['metadata'])
+                        row_dict['metadata'] = load_json(row_dict['metadata'])
                     else:
                         row_dict['metadata'] = {}
                     